@@ -1 +1,146 @@
-NANOKO_BASE_URL = "http://127.0.0.1:25324"
+import os
+
+NANOKO_BASE_URL = os.environ.get("NANOKO_BASE_URL", "http://127.0.0.1:25324")
+API_WORKER_MAX_THREADS = 8
+IMAGE_CACHE_MEMORY_BYTES = 64 * 1024 * 1024
+IMAGE_CACHE_DISK_BYTES = 512 * 1024 * 1024
+IMAGE_PREFETCH_MAX_WORKERS = 8
+IMAGE_DECODE_MAX_WORKERS = 4
+IMAGE_PIXMAP_CACHE_BYTES = 64 * 1024 * 1024
+# Images of new questions are uploaded in parallel and scaled down or recompressed
+# when larger than these limits, failed requests are retried with backoff
+IMAGE_UPLOAD_MAX_WORKERS = 4
+IMAGE_UPLOAD_MAX_DIMENSION = 2048
+IMAGE_UPLOAD_MAX_BYTES = 1024 * 1024
+IMAGE_UPLOAD_JPEG_QUALITY = 85
+IMAGE_UPLOAD_RETRIES = 3
+IMAGE_UPLOAD_RETRY_DELAY = 0.5
+# Questions of a bulk import are created this many at a time, so the images of
+# some are uploading while others are being added to the bank
+QUESTION_IMPORT_MAX_WORKERS = 4
+# Files looked for, in order, when a folder is imported
+QUESTION_IMPORT_MANIFEST_NAMES = [
+    "manifest.json",
+    "questions.json",
+    "manifest.csv",
+    "questions.csv",
+]
+PERFORMANCE_CACHE_TTL = 5 * 60
+ENTITY_STORE_TTL = 5 * 60
+QUERY_DEBOUNCE_MS = 150
+QUESTIONS_PAGE_SIZE = 50
+REFRESH_COALESCE_MS = 2000
+OUTBOX_RETRY_INTERVAL = 5
+OUTBOX_MAX_BACKOFF = 5 * 60
+# Attempts after which an outbox write is dropped and reported as failed, a
+# server error is less likely to go away than an unreachable server
+OUTBOX_MAX_ATTEMPTS = 10
+OUTBOX_MAX_SERVER_ERROR_ATTEMPTS = 3
+
+# Response cache policies: operation -> (ttl in seconds, serve stale while revalidating)
+RESPONSE_CACHE_POLICIES = {
+    "load_dashboard_data": (30, True),
+    "load_class_data": (30, True),
+    "load_questions": (60, True),
+    "load_assignment_data": (30, False),
+    "load_assignment_review_data": (300, False),
+    "load_question_review_data": (300, False),
+    "load_teacher_dashboard_data": (60, True),
+    "load_teacher_assignments_data": (60, True),
+    "load_teacher_questions_page": (60, True),
+    "load_teacher_class_data": (30, False),
+    "load_teacher_student_statistics": (60, False),
+    "load_class_assignment_review": (30, False),
+    "load_assignment_questions": (300, False),
+    "load_available_assignments": (60, False),
+    "load_question_preview": (300, False),
+}
+# Write operation -> read operations whose cached responses it invalidates
+RESPONSE_CACHE_INVALIDATIONS = {
+    "submit_sub_question": [
+        "load_dashboard_data",
+        "load_class_data",
+        "load_questions",
+        "load_assignment_data",
+        "load_assignment_review_data",
+        "load_question_review_data",
+    ],
+    "join_class": ["load_dashboard_data", "load_class_data", "load_questions"],
+    "create_assignment": [
+        "load_teacher_dashboard_data",
+        "load_teacher_assignments_data",
+        "load_available_assignments",
+    ],
+    "create_class": ["load_teacher_dashboard_data"],
+    "create_question": [
+        "load_teacher_questions_page",
+        "load_question_preview",
+    ],
+    "import_questions": [
+        "load_teacher_questions_page",
+        "load_question_preview",
+    ],
+    "remove_student_from_class": [
+        "load_teacher_dashboard_data",
+        "load_teacher_class_data",
+        "load_teacher_student_statistics",
+        "load_class_assignment_review",
+    ],
+    "assign_assignment_to_class": [
+        "load_teacher_dashboard_data",
+        "load_teacher_class_data",
+        "load_class_assignment_review",
+    ],
+}
+# Write operation -> entity store kinds whose stored entities it changes
+ENTITY_STORE_INVALIDATIONS = {
+    "join_class": ["class", "assignment"],
+    "remove_student_from_class": ["class"],
+    "assign_assignment_to_class": ["class", "assignment"],
+}
+# Student change -> reads whose data it makes stale. A graded answer only moves
+# the performance matrix and stats; the question history and the to-do/done
+# assignment lists change once a whole question or assignment is answered
+STUDENT_REFRESH_DEPENDENCIES = {
+    "submit_sub_question": ["load_dashboard_data"],
+    "complete_question": ["load_dashboard_data", "load_questions"],
+    "complete_assignment": [
+        "load_dashboard_data",
+        "load_class_data",
+        "load_questions",
+    ],
+}
+# Read operations whose responses are also kept in the local store, so the
+# student views open with the last known data before the backend answers
+LOCAL_STORE_OPERATIONS = ["load_dashboard_data", "load_class_data", "load_questions"]
+# Write operations that go through the local store's durable outbox
+OUTBOX_OPERATIONS = ["submit_sub_question"]
+# Connections opened to the server while the sign-in dialog is idle, again at
+# most every WARM_UP_INTERVAL_MS while the user types, before they time out
+WARM_UP_CONNECTIONS = 4
+WARM_UP_INTERVAL_MS = 4000
+# Longest wait for running requests when the application quits
+SHUTDOWN_WAIT_MS = 3000
+# Role -> main window module imported while the sign-in dialog is idle, and the
+# reads started right after login, alongside fetching the user
+ROLE_WINDOW_MODULES = {
+    "student": "app.views.studentMainWindow",
+    "teacher": "app.views.teacherMainWindow",
+}
+SIGNIN_PREFETCH_OPERATIONS = {
+    "student": ["load_dashboard_data", "load_class_data", "load_questions"],
+    "teacher": [
+        "load_teacher_dashboard_data",
+        "load_teacher_assignments_data",
+        "load_teacher_questions_page",
+    ],
+}
+# Loaded only after sign in, the startup report fails if any is imported earlier
+STARTUP_DEFERRED_MODULES = [
+    "matplotlib",
+    "app.views.studentMainWindow",
+    "app.views.teacherMainWindow",
+]
+RESPONSE_CACHE_MAX_STALE = 60 * 60
+RESPONSE_CACHE_MAX_ENTRIES = 256
+CHART_CACHE_MAX_ENTRIES = 512
@@ -1,8 +1,17 @@
+import copy
+import json
 import pytz
+import httpx
+import threading
 import traceback
+from itertools import count
+from typing import List, Optional, Tuple
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from nanoko import Nanoko
 from nanoko.models.llm import LLMMessage
-from PyQt6.QtCore import QThread, pyqtSignal
+from nanoko.models.assignment import Assignment
+from PyQt6.QtCore import Qt, QObject, QTimer, QThreadPool, pyqtSignal
 from datetime import datetime, timedelta, timezone
 from nanoko.models.performance import Performance, ProcessPerformances
 from nanoko.models.question import ConceptType, ProcessType, Question, SubQuestion
@@ -11,8 +20,30 @@ from nanoko.exceptions import (
     NanokoAPI401UnauthorizedError,
     NanokoAPI403ForbiddenError,
     NanokoAPI404NotFoundError,
+    NanokoAPI500InternalServerError,
+    raise_nanoko_api_exception,
 )
 
+from app.config import (
+    OUTBOX_OPERATIONS,
+    OUTBOX_MAX_BACKOFF,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_RETRY_INTERVAL,
+    OUTBOX_MAX_SERVER_ERROR_ATTEMPTS,
+    QUESTIONS_PAGE_SIZE,
+    API_WORKER_MAX_THREADS,
+    LOCAL_STORE_OPERATIONS,
+    IMAGE_PREFETCH_MAX_WORKERS,
+)
+from app.controllers.imageCache import ImageCache
+from app.controllers.localStore import LocalStore
+from app.controllers.entityStore import EntityStore
+from app.controllers.imageUploader import ImageUploader
+from app.controllers.questionIndex import QuestionIndex
+from app.controllers.questionImporter import ManifestError, QuestionImporter
+from app.controllers.performanceCache import PerformanceCache
+from app.controllers.responseCache import ResponseCache
+from app.controllers.viewModels import AssignmentVM, QuestionVM, SubQuestionVM
 from app.utils import (
     getAttribution,
     datetimeToText,
@@ -22,8 +53,63 @@ from app.utils import (
 )
 
 
-class ApiWorker(QThread):
-    """Worker thread for API operations"""
+class ApiRequest(QObject):
+    """Handle for a single operation submitted to the ApiWorker"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    FINISHED = "finished"
+    CANCELLED = "cancelled"
+
+    finished = pyqtSignal(object)  # request
+
+    def __init__(self, requestId: int, operation: str, params: dict):
+        super().__init__()
+        self.requestId = requestId
+        self.operation = operation
+        self.params = params
+        self.state = ApiRequest.PENDING
+        self.cacheKey = None
+        self.cachedEmissions = None
+        self.silent = False
+
+    def cancel(self) -> bool:
+        """Cancel the request if it has not started yet
+
+        Returns:
+            bool: Whether the request was cancelled
+        """
+        if self.state != ApiRequest.PENDING:
+            return False
+
+        self.state = ApiRequest.CANCELLED
+        return True
+
+    def isCancelled(self) -> bool:
+        """Check whether the request was cancelled
+
+        Returns:
+            bool: Whether the request was cancelled
+        """
+        return self.state == ApiRequest.CANCELLED
+
+    def isFinished(self) -> bool:
+        """Check whether the request has finished running
+
+        Returns:
+            bool: Whether the request has finished
+        """
+        return self.state == ApiRequest.FINISHED
+
+
+class ApiWorker(QObject):
+    """Concurrent executor for API operations
+
+    Every submitted operation runs on its own pooled thread, so independent
+    requests overlap instead of queueing behind each other. Result signals are
+    emitted from the pooled thread and delivered to receivers on the GUI thread
+    through queued connections.
+    """
 
     signInFinished = pyqtSignal(bool, str, object)  # success, message, user
     signUpFinished = pyqtSignal(bool, str)  # success, message
@@ -32,140 +118,677 @@ class ApiWorker(QThread):
     dashboardDataLoaded = pyqtSignal(dict)
     classDataLoaded = pyqtSignal(dict)
     questionsLoaded = pyqtSignal(list)
-    questionAnsweringDataLoaded = pyqtSignal(dict)
-    questionReviewDataLoaded = pyqtSignal(dict)
-    assignmentReviewDataLoaded = pyqtSignal(dict)
+    questionAnsweringDataLoaded = pyqtSignal(object)  # AssignmentVM
+    questionReviewDataLoaded = pyqtSignal(object)  # AssignmentVM
+    assignmentReviewDataLoaded = pyqtSignal(object)  # AssignmentVM
     subQuestionFeedbackReceived = pyqtSignal(int, dict)  # sub_question_id, feedback
+    subQuestionSubmitFailed = pyqtSignal(int, str)  # sub_question_id, error_message
+    subQuestionSubmitQueued = pyqtSignal(int, str)  # sub_question_id, error_message
     answerSubmitted = pyqtSignal(dict)
     joinClassFinished = pyqtSignal(bool, str)  # success, message
-    aiResponseReceived = pyqtSignal(str)  # text
+    aiResponseReceived = pyqtSignal(int, str)  # request_id, text
+    aiResponseChunkReceived = pyqtSignal(int, str)  # request_id, text chunk
+    aiResponseFailed = pyqtSignal(int, str)  # request_id, error_message
 
     # Teacher signals
     teacherDashboardDataLoaded = pyqtSignal(dict)
     teacherClassesDataLoaded = pyqtSignal(list)
     teacherAssignmentsDataLoaded = pyqtSignal(list)
-    teacherQuestionsDataLoaded = pyqtSignal(list)
+    # cursor, questions, next cursor (None on the last page)
+    teacherQuestionsPageLoaded = pyqtSignal(object, list, object)
     teacherClassDataLoaded = pyqtSignal(dict)
     teacherStudentStatisticsLoaded = pyqtSignal(dict)
     assignmentCreated = pyqtSignal(bool, str)  # success, message
     classCreated = pyqtSignal(bool, str)  # success, message
     questionCreated = pyqtSignal(bool, str)  # success, message
+    imageUploadProgress = pyqtSignal(int, int, str)  # uploaded, total, path
+    questionImportProgress = pyqtSignal(int, int, str)  # finished, total, name
+    questionImportFinished = pyqtSignal(dict)  # report
     classAssignmentReviewLoaded = pyqtSignal(dict)
     studentRemovedFromClass = pyqtSignal(bool, str)  # success, message
     assignmentQuestionsDataLoaded = pyqtSignal(dict)
     assignmentAssignmentResult = pyqtSignal(bool, str)  # success, message
     availableAssignmentsDataLoaded = pyqtSignal(list)
-    filteredQuestionsLoaded = pyqtSignal(list)
+    filteredQuestionsLoaded = pyqtSignal(int, list)  # generation, questions
+    questionBankLoaded = pyqtSignal(object)  # QuestionIndex
     questionPreviewDataLoaded = pyqtSignal(dict)
 
+    imageLoaded = pyqtSignal(int, bytes)  # image_id, image
+
     operationFailed = pyqtSignal(str, str)  # operation, error_message
 
-    def __init__(self, nanokoClient: Nanoko):
+    _outboxFlushRequested = pyqtSignal()
+    _userKnown = pyqtSignal()  # the local store user is set after sign in
+    _prefetchRequested = pyqtSignal(list)  # operations
+
+    def __init__(
+        self,
+        nanokoClient: Nanoko,
+        maxThreadCount: int = None,
+        imageCache: ImageCache = None,
+        responseCache: ResponseCache = None,
+        performanceCache: PerformanceCache = None,
+        localStore: LocalStore = None,
+        entityStore: EntityStore = None,
+    ):
         super().__init__()
         self.nanokoClient = nanokoClient
-        self.operation = None
-        self.params = None
+        self.imageCache = imageCache or ImageCache(baseUrl=nanokoClient.base_url)
+        self.responseCache = responseCache
+        self.performanceCache = performanceCache or PerformanceCache()
+        self.entityStore = entityStore or EntityStore()
+        self.localStore = localStore
+        self.imageUploader = ImageUploader(localStore)
+        self._questionImporter = None
+        self._prefetchExecutor = ThreadPoolExecutor(
+            max_workers=IMAGE_PREFETCH_MAX_WORKERS,
+            thread_name_prefix="ImagePrefetch",
+        )
+        self.threadPool = QThreadPool(self)
+        self.threadPool.setMaxThreadCount(maxThreadCount or API_WORKER_MAX_THREADS)
+        self._requestIds = count(1)
+        self._activeRequests = {}
+        self._inflightRequests = {}
+        self._questionSnapshots = {}  # owner -> questions, for unpaginated servers
+        # responses finished before the signed in user was known, e.g. prefetches
+        self._unsavedResponses = []  # (key, operation, emissions)
+
+        if self.responseCache is not None:
+            self._setupResponseCapture()
+        if self.localStore is not None:
+            self._setupOutbox()
+            self._userKnown.connect(self._saveUnsavedResponses)
+        self._prefetchRequested.connect(self._prefetchAll)
+
+    def _setupResponseCapture(self):
+        """Create the private worker whose emissions are captured for caching
+
+        Cached operations run on this worker, so their results can be stored
+        and compared before anything reaches the controllers.
+        """
+        self._capture = threading.local()
+        self._captureWorker = ApiWorker(
+            self.nanokoClient,
+            1,
+            self.imageCache,
+            performanceCache=self.performanceCache,
+            entityStore=self.entityStore,
+        )
+        self._captureWorker._prefetchExecutor = self._prefetchExecutor
+        self._captureWorker._questionSnapshots = self._questionSnapshots
+
+        for name, signal in vars(ApiWorker).items():
+            if isinstance(signal, pyqtSignal):
+                getattr(self._captureWorker, name).connect(
+                    partial(self._recordEmission, name),
+                    Qt.ConnectionType.DirectConnection,
+                )
+
+    def _recordEmission(self, name: str, *args):
+        """Record a signal emitted by the capture worker on the current thread
+
+        Args:
+            name (str): The name of the signal
+            *args: The arguments of the signal
+        """
+        self._capture.emissions.append((name, args))
+
+    def _setupOutbox(self):
+        """Retry the writes waiting in the local store's outbox periodically"""
+        self._outboxLock = threading.Lock()
+        self._outboxInflight = set()
+        self._outboxFlushRequested.connect(self._flushOutbox)
+
+        self._outboxTimer = QTimer(self)
+        self._outboxTimer.setInterval(int(OUTBOX_RETRY_INTERVAL * 1000))
+        self._outboxTimer.timeout.connect(self._flushOutbox)
+        self._outboxTimer.start()
+
+    def _flushOutbox(self) -> dict:
+        """Send the outbox writes that are due and not already being sent
+
+        Returns:
+            dict: The started requests by outbox id
+        """
+        started = {}
+        for outboxId, operation, params, attempts in self.localStore.dueOutbox():
+            with self._outboxLock:
+                if outboxId in self._outboxInflight:
+                    continue
+                self._outboxInflight.add(outboxId)
+
+            started[outboxId] = self._start(
+                ApiRequest(
+                    next(self._requestIds),
+                    operation,
+                    {**params, "outbox_id": outboxId, "attempts": attempts},
+                )
+            )
+        return started
+
+    def _finishOutboxWrite(self, params: dict):
+        """Remove an outbox write that the backend accepted or rejected
+
+        Args:
+            params (dict): The parameters of the write
+        """
+        outbox_id = params.get("outbox_id")
+        if outbox_id is None:
+            return
+
+        self.localStore.remove(outbox_id)
+        with self._outboxLock:
+            self._outboxInflight.discard(outbox_id)
+
+    def _postponeOutboxWrite(
+        self, params: dict, error: Exception, maxAttempts: int = OUTBOX_MAX_ATTEMPTS
+    ) -> bool:
+        """Keep an outbox write that failed because the backend is unreachable
+
+        The write is removed from the outbox instead once it failed maxAttempts
+        times.
+
+        Args:
+            params (dict): The parameters of the write
+            error (Exception): The error of the attempt
+            maxAttempts (int, optional): The attempts after which the write is
+                dropped. Defaults to OUTBOX_MAX_ATTEMPTS.
+
+        Returns:
+            bool: Whether the write stays in the outbox to be retried
+        """
+        outbox_id = params.get("outbox_id")
+        if outbox_id is None:
+            return False
+
+        if params.get("attempts", 0) + 1 >= maxAttempts:
+            print(
+                f"[ApiWorker] Dropping outbox write #{outbox_id} after "
+                f"{maxAttempts} attempts: {error}"
+            )
+            self._finishOutboxWrite(params)
+            return False
 
-    def setup(self, operation, **params):
-        """Setup the worker with operation and parameters
+        delay = min(
+            OUTBOX_MAX_BACKOFF, OUTBOX_RETRY_INTERVAL * 2 ** params.get("attempts", 0)
+        )
+        self.localStore.postpone(outbox_id, delay)
+        with self._outboxLock:
+            self._outboxInflight.discard(outbox_id)
+        print(f"[ApiWorker] Retrying outbox write #{outbox_id} in {delay}s: {error}")
+        return True
+
+    def submit(self, operation: str, **params) -> ApiRequest:
+        """Submit an operation to run concurrently with other requests
 
         Args:
             operation (str): The operation to perform
             **params: Additional parameters for the operation
+
+        Returns:
+            ApiRequest: The handle of the submitted request
         """
-        if self.isRunning():
-            self.wait()
+        if operation in ("signin", "signup"):
+            self._unsavedResponses.clear()
+            self.performanceCache.clear()
+            self.entityStore.clear()
+            self._questionSnapshots.clear()
+
+        if self.localStore is not None and operation in OUTBOX_OPERATIONS:
+            # writes are stored durably first and sent from the outbox
+            if self.responseCache is not None:
+                self.responseCache.invalidateAfter(operation)
+            outboxId = self.localStore.enqueue(operation, params)
+            request = self._flushOutbox().get(outboxId)
+            if request is None:
+                request = ApiRequest(next(self._requestIds), operation, params)
+            return request
+
+        if self.responseCache is not None:
+            if operation in ("signin", "signup"):
+                self.responseCache.clear()
+            self.responseCache.invalidateAfter(operation)
+
+            if self.responseCache.isCacheable(operation):
+                return self._submitCached(operation, params)
+
+        return self._start(ApiRequest(next(self._requestIds), operation, params))
+
+    def prefetch(self, operation: str, **params) -> Optional[ApiRequest]:
+        """Load a read into the response cache before a view asks for it
+
+        The view's own request then joins the running prefetch or replays its
+        cached response. A failed prefetch is not reported, since the view
+        may never make the request, e.g. when the guessed role was wrong.
 
-        self.operation = operation
-        self.params = params
+        Args:
+            operation (str): The read operation
+            **params: Additional parameters for the operation
+
+        Returns:
+            Optional[ApiRequest]: The handle of the request, or None if the
+                operation is not cached
+        """
+        if self.responseCache is None or not self.responseCache.isCacheable(operation):
+            return None
+
+        return self._submitCached(operation, params, silent=True)
+
+    def _prefetchAll(self, operations: list):
+        """Prefetch reads without parameters
+
+        Args:
+            operations (list): The read operations
+        """
+        for operation in operations:
+            self.prefetch(operation)
+
+    def _start(self, request: ApiRequest) -> ApiRequest:
+        """Track a request and queue it on the thread pool
+
+        Args:
+            request (ApiRequest): The request to start
+
+        Returns:
+            ApiRequest: The started request
+        """
+        request.finished.connect(self._onRequestFinished)
+        self._activeRequests[request.requestId] = request
+
+        self.threadPool.start(partial(self._execute, request))
+        return request
+
+    def _submitCached(
+        self, operation: str, params: dict, silent: bool = False
+    ) -> ApiRequest:
+        """Serve a read operation from the response cache when possible
+
+        Fresh responses are replayed without a request. Stale responses of
+        stale-while-revalidate operations are replayed and then refreshed in
+        the background. Identical requests that are already running are shared.
+
+        Args:
+            operation (str): The operation to perform
+            params (dict): The parameters for the operation
+            silent (bool, optional): Don't report a failure. Defaults to False.
+
+        Returns:
+            ApiRequest: The handle of the request
+        """
+        key = ResponseCache.makeKey(operation, params)
+        emissions, isFresh = self.responseCache.get(key)
+
+        if (
+            emissions is None
+            and self.localStore is not None
+            and operation in LOCAL_STORE_OPERATIONS
+        ):
+            stored = self.localStore.loadResponse(key)
+            if stored is not None:
+                emissions = stored[0]
+                print(f"[ApiWorker] Serving {operation} from the local store")
+        elif emissions is not None:
+            print(f"[ApiWorker] Serving {operation} from cache (fresh: {isFresh})")
+
+        if emissions is not None:
+            QTimer.singleShot(0, partial(self._replay, emissions))
+
+        inflight = self._inflightRequests.get(key)
+        if inflight is not None:
+            # a view now waits for it, so its failure has to be reported
+            inflight.silent = inflight.silent and silent
+            return inflight
+
+        request = ApiRequest(next(self._requestIds), operation, params)
+        request.cacheKey = key
+        request.cachedEmissions = emissions
+        request.silent = silent
+
+        if isFresh:
+            request.state = ApiRequest.FINISHED
+            QTimer.singleShot(0, partial(request.finished.emit, request))
+            return request
+
+        self._inflightRequests[key] = request
+        return self._start(request)
+
+    def _replay(self, emissions: list):
+        """Emit cached signals again
+
+        Args:
+            emissions (list): The (signal name, args) pairs to emit
+        """
+        for name, args in copy.deepcopy(emissions):
+            getattr(self, name).emit(*args)
+
+    def activeRequests(self) -> list:
+        """Get the requests that have been submitted but not finished yet
+
+        Returns:
+            list: The pending and running requests
+        """
+        return list(self._activeRequests.values())
+
+    def waitForDone(self, msecs: int = -1) -> bool:
+        """Block until every submitted request has finished
+
+        Only meant for shutdown and headless tooling, never for the GUI thread.
+
+        Args:
+            msecs (int, optional): Timeout in milliseconds. Defaults to -1 (no timeout).
+
+        Returns:
+            bool: Whether all requests finished before the timeout
+        """
+        return self.threadPool.waitForDone(msecs)
 
-    def run(self):
-        """Execute the operation in a separate thread"""
-        if not self.operation:
+    def _onRequestFinished(self, request: ApiRequest):
+        """Forget a request once it has finished
+
+        Args:
+            request (ApiRequest): The finished request
+        """
+        self._activeRequests.pop(request.requestId, None)
+        if self._inflightRequests.get(request.cacheKey) is request:
+            del self._inflightRequests[request.cacheKey]
+
+    def _execute(self, request: ApiRequest):
+        """Execute a request on a pooled thread
+
+        Args:
+            request (ApiRequest): The request to execute
+        """
+        if request.isCancelled():
+            request.finished.emit(request)
             return
 
-        print(f"[ApiWorker] Starting operation: {self.operation}")
+        request.state = ApiRequest.RUNNING
+        print(
+            f"[ApiWorker] Starting operation #{request.requestId}: {request.operation}"
+        )
 
         try:
-            match self.operation:
+            if request.cacheKey is not None:
+                self._executeCached(request)
+            else:
+                self._dispatch(request.operation, request.params)
+                self.entityStore.invalidateAfter(request.operation)
+                if self.responseCache is not None:
+                    self.responseCache.invalidateAfter(request.operation)
+        finally:
+            request.state = ApiRequest.FINISHED
+            request.finished.emit(request)
+
+    def _executeCached(self, request: ApiRequest):
+        """Execute a cached read operation and store its response
+
+        Args:
+            request (ApiRequest): The request to execute
+        """
+        generation = self.responseCache.generation(request.operation)
+
+        self._capture.emissions = []
+        try:
+            self._captureWorker._dispatch(request.operation, request.params)
+            emissions = self._capture.emissions
+        finally:
+            self._capture.emissions = None
+
+        errors = [args[1] for name, args in emissions if name == "operationFailed"]
+        if errors:
+            if request.cachedEmissions is not None:
+                # the cached data is already shown, keep it while offline
+                print(f"[ApiWorker] Keeping cached {request.operation}: {errors[0]}")
+                return
+            if request.silent:
+                print(
+                    f"[ApiWorker] Prefetching {request.operation} failed: {errors[0]}"
+                )
+                return
+        elif (
+            self.responseCache.put(
+                request.cacheKey,
+                request.operation,
+                copy.deepcopy(emissions),
+                generation,
+            )
+            and self.localStore is not None
+            and request.operation in LOCAL_STORE_OPERATIONS
+        ):
+            self._saveResponse(request.cacheKey, request.operation, emissions)
+
+        if emissions == request.cachedEmissions:
+            print(f"[ApiWorker] {request.operation} revalidated, no changes")
+            return
+
+        for name, args in emissions:
+            getattr(self, name).emit(*args)
+
+    def _saveResponse(self, key: str, operation: str, emissions: list):
+        """Store a response locally, once the signed in user is known
+
+        Args:
+            key (str): The response cache key of the request
+            operation (str): The operation
+            emissions (list): The (signal name, args) pairs emitted by the request
+        """
+        if self.localStore.userId is None:
+            self._unsavedResponses.append((key, operation, emissions))
+            return
+        self.localStore.saveResponse(key, operation, emissions)
+
+    def _saveUnsavedResponses(self):
+        """Store the responses that finished before the user was known"""
+        unsaved, self._unsavedResponses = self._unsavedResponses, []
+        for key, operation, emissions in unsaved:
+            self.localStore.saveResponse(key, operation, emissions)
+
+    def _dispatch(self, operation: str, params: dict):
+        """Dispatch an operation to its handler
+
+        Args:
+            operation (str): The operation to perform
+            params (dict): The parameters for the operation
+        """
+        try:
+            match operation:
                 case "signin":
-                    self._handleSignin()
+                    self._handleSignin(params)
                 case "signup":
-                    self._handleSignup()
+                    self._handleSignup(params)
+                case "warm_up":
+                    self._handleWarmUp(params)
 
                 # Student operations
                 case "load_dashboard_data":
-                    self._handleLoadDashboardData()
+                    self._handleLoadDashboardData(params)
                 case "load_class_data":
-                    self._handleLoadClassData()
+                    self._handleLoadClassData(params)
                 case "load_assignment_data":
-                    self._handleLoadAssignmentData()
+                    self._handleLoadAssignmentData(params)
                 case "load_assignment_review_data":
-                    self._handleLoadAssignmentReviewData()
+                    self._handleLoadAssignmentReviewData(params)
                 case "load_question_review_data":
-                    self._handleLoadQuestionReviewData()
+                    self._handleLoadQuestionReviewData(params)
                 case "load_assignments":
-                    self._handleLoadAssignments()
+                    self._handleLoadAssignments(params)
                 case "load_questions":
-                    self._handleLoadQuestions()
+                    self._handleLoadQuestions(params)
                 case "submit_answer":
-                    self._handleSubmitAnswer()
+                    self._handleSubmitAnswer(params)
                 case "submit_sub_question":
-                    self._handleSubmitSubQuestion()
+                    self._handleSubmitSubQuestion(params)
                 case "send_ai_message":
-                    self._handleSendAIMessage()
+                    self._handleSendAIMessage(params)
                 case "join_class":
-                    self._handleJoinClass()
+                    self._handleJoinClass(params)
 
                 # Teacher operations
                 case "load_teacher_dashboard_data":
-                    self._handleLoadTeacherDashboardData()
+                    self._handleLoadTeacherDashboardData(params)
                 case "load_teacher_assignments_data":
-                    self._handleLoadTeacherAssignmentsData()
-                case "load_teacher_questions_data":
-                    self._handleLoadTeacherQuestionsData()
+                    self._handleLoadTeacherAssignmentsData(params)
+                case "load_teacher_questions_page":
+                    self._handleLoadTeacherQuestionsPage(params)
                 case "load_teacher_class_data":
-                    self._handleLoadTeacherClassData()
+                    self._handleLoadTeacherClassData(params)
                 case "load_teacher_student_statistics":
-                    self._handleLoadTeacherStudentStatistics()
+                    self._handleLoadTeacherStudentStatistics(params)
                 case "load_teacher_class_assignments":
-                    self._handleLoadTeacherClassAssignments()
+                    self._handleLoadTeacherClassAssignments(params)
                 case "create_assignment":
-                    self._handleCreateAssignment()
+                    self._handleCreateAssignment(params)
                 case "create_class":
-                    self._handleCreateClass()
+                    self._handleCreateClass(params)
                 case "create_question":
-                    self._handleCreateQuestion()
+                    self._handleCreateQuestion(params)
+                case "import_questions":
+                    self._handleImportQuestions(params)
                 case "load_class_assignment_review":
-                    self._handleLoadClassAssignmentReview()
+                    self._handleLoadClassAssignmentReview(params)
                 case "remove_student_from_class":
-                    self._handleRemoveStudentFromClass()
+                    self._handleRemoveStudentFromClass(params)
                 case "load_assignment_questions":
-                    self._handleLoadAssignmentQuestions()
+                    self._handleLoadAssignmentQuestions(params)
                 case "load_class_performance":
-                    self._handleLoadClassPerformance()
+                    self._handleLoadClassPerformance(params)
                 case "load_available_assignments":
-                    self._handleLoadAvailableAssignments()
+                    self._handleLoadAvailableAssignments(params)
                 case "assign_assignment_to_class":
-                    self._handleAssignAssignmentToClass()
+                    self._handleAssignAssignmentToClass(params)
                 case "load_filtered_questions":
-                    self._handleLoadFilteredQuestions()
+                    self._handleLoadFilteredQuestions(params)
+                case "load_question_bank":
+                    self._handleLoadQuestionBank(params)
                 case "load_question_preview":
-                    self._handleLoadQuestionPreview()
+                    self._handleLoadQuestionPreview(params)
+
+                # Shared operations
+                case "load_image":
+                    self._handleLoadImage(params)
                 case _:
                     self.operationFailed.emit(
-                        self.operation, f"Unknown operation: {self.operation}"
+                        operation, f"Unknown operation: {operation}"
                     )
         except Exception as e:
-            self.operationFailed.emit(self.operation, str(e))
+            self.operationFailed.emit(operation, str(e))
+
+    def _fetchConcurrently(self, fetch, keys) -> dict:
+        """Fetch several resources in parallel with bounded concurrency
+
+        Args:
+            fetch (Callable): Function fetching the resource for a key
+            keys (Iterable): The keys to fetch, duplicates and None are skipped
+
+        Returns:
+            dict: Mapping from key to fetched resource
+        """
+        keys = list(dict.fromkeys(key for key in keys if key is not None))
+        if len(keys) <= 1:
+            return {key: fetch(key) for key in keys}
+
+        futures = {key: self._prefetchExecutor.submit(fetch, key) for key in keys}
+        return {key: future.result() for key, future in futures.items()}
+
+    def _prefetchImages(self, questions: list) -> dict:
+        """Fetch the images of every sub-question in parallel
+
+        Args:
+            questions (list): Questions whose sub-question images are needed
+
+        Returns:
+            dict: Mapping from image id to image bytes
+        """
+        return self._fetchConcurrently(
+            self._getImage,
+            (
+                sub_question.image_id
+                for question in questions
+                for sub_question in question.sub_questions
+            ),
+        )
+
+    def _getPerformanceDateData(self, user_ids, days: int = 30) -> dict:
+        """Get the recent performance series of several students
+
+        Cached series are reused and the rest are fetched with a bounded
+        concurrent fan-out. This is the only place fetching series for several
+        students, so a bulk endpoint can replace the fan-out here without
+        touching any handler or view.
+
+        Args:
+            user_ids (Iterable): The ids of the students
+            days (int): The number of days to cover. Defaults to 30.
+
+        Returns:
+            dict: Mapping from student id to performance date data
+        """
+        series = {}
+        missing = []
+        for user_id in dict.fromkeys(user_ids):
+            data = self.performanceCache.get(user_id, days)
+            if data is None:
+                missing.append(user_id)
+            else:
+                series[user_id] = data
+
+        start_time = datetime.now(timezone.utc) - timedelta(days=days)
+        fetched = self._fetchConcurrently(
+            lambda user_id: self.nanokoClient.service.get_performance_date_data(
+                user_id=user_id, start_time=start_time
+            ),
+            missing,
+        )
+        for user_id, data in fetched.items():
+            self.performanceCache.put(user_id, days, data)
+            series[user_id] = data
+
+        return series
+
+    def _getImage(self, image_id: int) -> bytes:
+        """Get an image, downloading it only if it is not cached yet
+
+        Args:
+            image_id (int): The id of the image
+
+        Returns:
+            bytes: The image bytes
+        """
+        image = self.imageCache.get(image_id)
+        if image is None:
+            image = self.nanokoClient.bank.get_image(image_id)
+            self.imageCache.put(image_id, image)
+        return image
+
+    def _handleLoadImage(self, params: dict):
+        """Load a single image for a lazily loaded thumbnail"""
+        image_id = params.get("image_id")
+        try:
+            self.imageLoaded.emit(image_id, self._getImage(image_id))
+        except Exception as e:
+            # a missing thumbnail keeps its placeholder instead of raising an error
+            print(f"[ApiWorker] Failed to load image {image_id}: {e}")
+            self.imageLoaded.emit(image_id, b"")
+
+    def _handleSignin(self, params: dict):
+        """Handle user sign in
 
-    def _handleSignin(self):
-        """Handle user sign in"""
+        Reads listed in "prefetch" are started right after login, so they
+        run alongside me() instead of waiting for the main window. Those that
+        finish first are written to the local store once me() returns.
+        """
         try:
-            self.nanokoClient.user.login(
-                self.params["username"], self.params["password"]
-            )
+            if self.localStore is not None:
+                self.localStore.setUser(None)
+            self.nanokoClient.user.login(params["username"], params["password"])
+            if params.get("prefetch"):
+                self._prefetchRequested.emit(params["prefetch"])
             me = self.nanokoClient.user.me()
+            self.entityStore.put("user", [me])
+            if self.localStore is not None:
+                self.localStore.setUser(me.id)
+                self._userKnown.emit()
+                self._outboxFlushRequested.emit()
             self.signInFinished.emit(
                 True,
                 "Signin successful",
@@ -176,15 +799,40 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("signin", str(e))
 
-    def _handleSignup(self):
+    def _handleWarmUp(self, params: dict):
+        """Open connections to the server before they are needed
+
+        The connections stay in the HTTP client's pool, so the requests made
+        right after sign in skip the TCP and TLS handshakes.
+        """
+        client = self.nanokoClient.client
+        url = self.nanokoClient.base_url
+
+        def connect():
+            try:
+                client.get(url)
+            except httpx.HTTPError as e:
+                return e
+
+        futures = [
+            self._prefetchExecutor.submit(connect)
+            for _ in range(params.get("connections", 1))
+        ]
+        errors = [e for e in (future.result() for future in futures) if e is not None]
+        if errors:
+            print(
+                f"[ApiWorker] Warm-up failed for {len(errors)} connections: {errors[0]}"
+            )
+
+    def _handleSignup(self, params: dict):
         """Handle user sign up"""
         try:
             self.nanokoClient.user.register(
-                username=self.params["username"],
-                email=self.params["email"],
-                display_name=(self.params["firstName"] + " " + self.params["lastName"]),
-                password=self.params["password"],
-                permission=getPermissionFromRole(self.params["role"]),
+                username=params["username"],
+                email=params["email"],
+                display_name=(params["firstName"] + " " + params["lastName"]),
+                password=params["password"],
+                permission=getPermissionFromRole(params["role"]),
             )
             self.signUpFinished.emit(True, "Signup successful")
         except NanokoAPI400BadRequestError as e:
@@ -192,7 +840,7 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("signup", str(e))
 
-    def _handleLoadDashboardData(self):
+    def _handleLoadDashboardData(self, params: dict):
         """Load all dashboard data"""
         try:
             overview_data = self.nanokoClient.service.get_overview()
@@ -296,257 +944,202 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("load_dashboard_data", str(e))
 
-    def _handleLoadClassData(self):
+    def _handleLoadClassData(self, params: dict):
         """Load class data for the class interface"""
         try:
-            class_data = self.nanokoClient.user.get_class_data().model_dump()
-            self.classDataLoaded.emit(class_data)
+            class_data = self.nanokoClient.user.get_class_data()
+            self.entityStore.put(
+                "assignment",
+                class_data.to_do_assignments + class_data.done_assignments,
+            )
+            self.classDataLoaded.emit(class_data.model_dump())
         except NanokoAPI404NotFoundError:
             self.classDataLoaded.emit({"class_name": None})
         except Exception as e:
             self.operationFailed.emit("load_class_data", str(e))
 
-    def _handleLoadAssignmentData(self):
+    def _getAssignment(self, assignment_id: int) -> Optional[Assignment]:
+        """Get an assignment from the entity store, downloading them on a miss
+
+        Args:
+            assignment_id (int): The ID of the assignment
+
+        Returns:
+            Optional[Assignment]: The assignment, or None if it doesn't exist
+        """
+        assignment = self.entityStore.get("assignment", assignment_id)
+        if assignment is None:
+            self.entityStore.put("assignment", self.nanokoClient.user.get_assignments())
+            assignment = self.entityStore.get("assignment", assignment_id)
+        return assignment
+
+    def _getQuestions(self, question_ids: List[int]) -> List[Question]:
+        """Get questions from the entity store, downloading only the missing ones
+
+        Args:
+            question_ids (List[int]): The IDs of the questions
+
+        Returns:
+            List[Question]: The questions that exist, in the given order
+        """
+        questions, missing = self.entityStore.getMany("question", question_ids)
+        if missing:
+            fetched = self.nanokoClient.bank.get_questions(question_ids=missing)
+            self.entityStore.putQuestions(fetched)
+            questions.update((question.id, question) for question in fetched)
+        return [
+            questions[question_id]
+            for question_id in question_ids
+            if question_id in questions
+        ]
+
+    def _assignmentViewModel(
+        self,
+        assignment_id: int,
+        title: str,
+        description: str,
+        questions: List[Question],
+        images: dict,
+        submissions: dict,
+    ) -> AssignmentVM:
+        """Build the view model of questions to answer or review
+
+        Args:
+            assignment_id (int): The ID of the assignment, or of the question
+            title (str): The title
+            description (str): The description
+            questions (List[Question]): The questions
+            images (dict): Image ID -> image bytes
+            submissions (dict): Sub-question ID -> completed sub-question
+
+        Returns:
+            AssignmentVM: The view model
+        """
+        return AssignmentVM(
+            id=assignment_id,
+            title=title,
+            description=description,
+            questions=tuple(
+                QuestionVM(
+                    id=question.id,
+                    title=question.name,
+                    attribution=getAttribution(question.source),
+                    subQuestions=tuple(
+                        SubQuestionVM.fromSubQuestion(
+                            sub_question,
+                            images.get(sub_question.image_id),
+                            submissions.get(sub_question.id),
+                        )
+                        for sub_question in question.sub_questions
+                    ),
+                )
+                for question in questions
+            ),
+        )
+
+    def _handleLoadAssignmentData(self, params: dict):
         """Load specific assignment data for the question answering interface"""
         try:
-            assignment_id = self.params.get("assignment_id")
+            assignment_id = params.get("assignment_id")
 
-            assignments = self.nanokoClient.user.get_assignments()
-            assignment_result = [
-                assignment
-                for assignment in assignments
-                if assignment.id == assignment_id
-            ]
-            if len(assignment_result) == 0:
+            assignment = self._getAssignment(assignment_id)
+            if assignment is None:
                 self.operationFailed.emit(
                     "load_assignment_data", "Assignment not found"
                 )
                 return
 
-            assignment = assignment_result[0]
-
-            questions = self.nanokoClient.bank.get_questions(
-                question_ids=assignment.question_ids
-            )
+            questions = self._getQuestions(assignment.question_ids)
 
-            completed_sub_questions = (
-                self.nanokoClient.user.get_completed_sub_questions(
-                    assignment_id=assignment.id
-                )
+            completed_sub_questions_future = self._prefetchExecutor.submit(
+                self.nanokoClient.user.get_completed_sub_questions,
+                assignment_id=assignment.id,
             )
+            images = self._prefetchImages(questions)
+            completed_sub_questions = completed_sub_questions_future.result()
             completed_sub_questions_dict = {
                 sub_question.id: sub_question
                 for sub_question in completed_sub_questions
             }
 
-            assignment_data = {
-                "id": assignment.id,
-                "title": assignment.name,
-                "description": assignment.description,
-                "questions": [
-                    {
-                        "id": question.id,
-                        "title": question.name,
-                        "attribution": getAttribution(question.source),
-                        "sub_questions": [
-                            (
-                                {
-                                    "id": sub_question.id,
-                                    "is_submitted": False,
-                                    "type": "multiple_choice"
-                                    if sub_question.options is not None
-                                    else "text",
-                                    "text": sub_question.description,
-                                    "options": sub_question.options,
-                                    "image": (
-                                        self.nanokoClient.bank.get_image(
-                                            sub_question.image_id
-                                        )
-                                        if sub_question.image_id
-                                        else None
-                                    ),
-                                    "keywords": sub_question.keywords,
-                                }
-                            )
-                            if sub_question.id not in completed_sub_questions_dict
-                            else {
-                                "id": sub_question.id,
-                                "type": "multiple_choice"
-                                if sub_question.options is not None
-                                else "text",
-                                "text": sub_question.description,
-                                "options": sub_question.options,
-                                "image": (
-                                    self.nanokoClient.bank.get_image(
-                                        sub_question.image_id
-                                    )
-                                    if sub_question.image_id
-                                    else None
-                                ),
-                                "keywords": sub_question.keywords,
-                                "is_submitted": True,
-                                "user_answer": completed_sub_questions_dict[
-                                    sub_question.id
-                                ].submitted_answer,
-                                "performance": completed_sub_questions_dict[
-                                    sub_question.id
-                                ]
-                                .performance.name.replace("_", " ")
-                                .lower()
-                                .capitalize(),
-                                "feedback": completed_sub_questions_dict[
-                                    sub_question.id
-                                ].feedback,
-                            }
-                            for sub_question in question.sub_questions
-                        ],
-                    }
-                    for question in questions
-                ],
-            }
+            assignment_data = self._assignmentViewModel(
+                assignment.id,
+                assignment.name,
+                assignment.description,
+                questions,
+                images,
+                completed_sub_questions_dict,
+            )
 
             self.questionAnsweringDataLoaded.emit(assignment_data)
 
         except Exception as e:
             self.operationFailed.emit("load_assignment_data", str(e))
 
-    def _handleLoadAssignmentReviewData(self):
+    def _handleLoadAssignmentReviewData(self, params: dict):
         """Load specific assignment data for review"""
         try:
-            assignment_id = self.params.get("assignment_id")
+            assignment_id = params.get("assignment_id")
 
-            assignments = self.nanokoClient.user.get_assignments()
-            assignment_result = [
-                assignment
-                for assignment in assignments
-                if assignment.id == assignment_id
-            ]
-            if len(assignment_result) == 0:
-                self.questionAnsweringDataLoaded.emit({"id": None})
+            assignment = self._getAssignment(assignment_id)
+            if assignment is None:
+                self.operationFailed.emit(
+                    "load_assignment_review_data", "Assignment not found"
+                )
                 return
 
-            assignment = assignment_result[0]
+            questions = self._getQuestions(assignment.question_ids)
 
-            questions = self.nanokoClient.bank.get_questions(
-                question_ids=assignment.question_ids
-            )
-
-            completed_sub_questions = (
-                self.nanokoClient.user.get_completed_sub_questions(
-                    assignment_id=assignment.id
-                )
+            completed_sub_questions_future = self._prefetchExecutor.submit(
+                self.nanokoClient.user.get_completed_sub_questions,
+                assignment_id=assignment.id,
             )
+            images = self._prefetchImages(questions)
+            completed_sub_questions = completed_sub_questions_future.result()
             completed_sub_questions_dict = {
                 sub_question.id: sub_question
                 for sub_question in completed_sub_questions
             }
 
-            assignment_data = {
-                "id": assignment.id,
-                "title": assignment.name,
-                "description": assignment.description,
-                "questions": [
-                    {
-                        "id": question.id,
-                        "title": question.name,
-                        "attribution": getAttribution(question.source),
-                        "sub_questions": [
-                            {
-                                "id": sub_question.id,
-                                "type": "multiple_choice"
-                                if sub_question.options is not None
-                                else "text",
-                                "text": sub_question.description,
-                                "options": sub_question.options,
-                                "image": (
-                                    self.nanokoClient.bank.get_image(
-                                        sub_question.image_id
-                                    )
-                                    if sub_question.image_id
-                                    else None
-                                ),
-                                "keywords": sub_question.keywords,
-                                "user_answer": completed_sub_questions_dict[
-                                    sub_question.id
-                                ].submitted_answer
-                                if sub_question.options is None
-                                else completed_sub_questions_dict[
-                                    sub_question.id
-                                ].submitted_answer.split("<OPTION>"),
-                                "performance": completed_sub_questions_dict[
-                                    sub_question.id
-                                ]
-                                .performance.name.replace("_", " ")
-                                .lower()
-                                .capitalize(),
-                                "feedback": completed_sub_questions_dict[
-                                    sub_question.id
-                                ].feedback,
-                            }
-                            for sub_question in question.sub_questions
-                        ],
-                    }
-                    for question in questions
-                ],
-            }
+            assignment_data = self._assignmentViewModel(
+                assignment.id,
+                assignment.name,
+                assignment.description,
+                questions,
+                images,
+                completed_sub_questions_dict,
+            )
 
             self.assignmentReviewDataLoaded.emit(assignment_data)
 
         except Exception as e:
             self.operationFailed.emit("load_assignment_review_data", str(e))
 
-    def _handleLoadQuestionReviewData(self):
+    def _handleLoadQuestionReviewData(self, params: dict):
         """Load specific question data for review"""
         try:
-            question_id = self.params.get("question_id")
+            question_id = params.get("question_id")
 
             question_data = self.nanokoClient.user.get_completed_question(question_id)
-            question_json = {
-                "id": question_data.id,
-                "title": question_data.name,
-                "questions": [
-                    {
-                        "id": question_data.id,
-                        "title": question_data.name,
-                        "attribution": getAttribution(question_data.source),
-                        "sub_questions": [
-                            {
-                                "id": sub_question.id,
-                                "type": "multiple_choice"
-                                if sub_question.options is not None
-                                else "text",
-                                "text": sub_question.description,
-                                "options": sub_question.options,
-                                "image": (
-                                    self.nanokoClient.bank.get_image(
-                                        sub_question.image_id
-                                    )
-                                    if sub_question.image_id
-                                    else None
-                                ),
-                                "keywords": sub_question.keywords,
-                                "user_answer": sub_question.submitted_answer
-                                if sub_question.options is None
-                                else sub_question.submitted_answer.split("<OPTION>"),
-                                "performance": sub_question.performance.name.replace(
-                                    "_", " "
-                                )
-                                .lower()
-                                .capitalize(),
-                                "feedback": sub_question.feedback,
-                            }
-                            for sub_question in question_data.sub_questions
-                        ],
-                    }
-                ],
-            }
+            images = self._prefetchImages([question_data])
+            question_json = self._assignmentViewModel(
+                question_data.id,
+                question_data.name,
+                "",
+                [question_data],
+                images,
+                {
+                    sub_question.id: sub_question
+                    for sub_question in question_data.sub_questions
+                },
+            )
 
             self.questionReviewDataLoaded.emit(question_json)
 
         except Exception as e:
             self.operationFailed.emit("load_question_review_data", str(e))
 
-    def _handleLoadQuestions(self):
+    def _handleLoadQuestions(self, params: dict):
         """Load question history and completed questions"""
         try:
             questions = self.nanokoClient.user.get_completed_questions()
@@ -563,13 +1156,7 @@ class ApiWorker(QThread):
                             {
                                 "title": f"Question {chr(65 + idx)}",
                                 "text": sub_question.description,
-                                "image": (
-                                    self.nanokoClient.bank.get_image(
-                                        sub_question.image_id
-                                    )
-                                    if sub_question.image_id
-                                    else None
-                                ),
+                                "image_id": sub_question.image_id,
                                 "tags": [
                                     (
                                         sub_question.concept.name.replace("_", " ")
@@ -601,55 +1188,124 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("load_questions", str(e))
 
-    def _handleSubmitSubQuestion(self):
+    def _handleSubmitSubQuestion(self, params: dict):
         """Submit sub-question answer for instant feedback"""
-        try:
-            assignment_id = self.params.get("assignment_id")
-            sub_question_id = self.params.get("sub_question_id")
-            answer = self.params.get("answer")
+        assignment_id = params.get("assignment_id")
+        sub_question_id = params.get("sub_question_id")
+        answer = params.get("answer")
 
+        try:
             feedback = self.nanokoClient.user.submit(
                 assignment_id=assignment_id,
                 sub_question_id=sub_question_id,
                 answer=answer if isinstance(answer, str) else "<OPTION>".join(answer),
             )
-
-            self.subQuestionFeedbackReceived.emit(
-                sub_question_id,
-                {
-                    "feedback": feedback.comment,
-                    "performance": feedback.performance.name.replace("_", " ")
-                    .lower()
-                    .capitalize(),
-                },
+        except (httpx.TransportError, NanokoAPI500InternalServerError) as e:
+            maxAttempts = (
+                OUTBOX_MAX_SERVER_ERROR_ATTEMPTS
+                if isinstance(e, NanokoAPI500InternalServerError)
+                else OUTBOX_MAX_ATTEMPTS
             )
-
+            if self._postponeOutboxWrite(params, e, maxAttempts):
+                self.subQuestionSubmitQueued.emit(sub_question_id, str(e))
+            else:
+                self.subQuestionSubmitFailed.emit(sub_question_id, str(e))
+                self.operationFailed.emit("submit_sub_question", str(e))
+            return
         except Exception as e:
+            self._finishOutboxWrite(params)
+            self.subQuestionSubmitFailed.emit(sub_question_id, str(e))
             self.operationFailed.emit("submit_sub_question", str(e))
+            return
+
+        self._finishOutboxWrite(params)
+        self.subQuestionFeedbackReceived.emit(
+            sub_question_id,
+            {
+                "feedback": feedback.comment,
+                "performance": feedback.performance.name.replace("_", " ")
+                .lower()
+                .capitalize(),
+            },
+        )
 
-    def _handleSendAIMessage(self):
-        """Handle AI message sending and response"""
+    def _handleSendAIMessage(self, params: dict):
+        """Handle AI message sending, streaming the hint as it is generated"""
+        request_id = params.get("request_id", 0)
         try:
-            user_message = self.params.get("message", "")
-            sub_question_id = self.params.get("sub_question_id", 0)
-            history = self.params.get("history", [])
-
-            hint = self.nanokoClient.llm.get_hint(
-                sub_question_id,
-                user_message,
-                [LLMMessage.model_validate(message) for message in history],
-            )
+            user_message = params.get("message", "")
+            sub_question_id = params.get("sub_question_id", 0)
+            history = params.get("history", [])
+
+            chunks = []
+            for chunk in self._streamHint(sub_question_id, user_message, history):
+                chunks.append(chunk)
+                self.aiResponseChunkReceived.emit(request_id, chunk)
 
-            self.aiResponseReceived.emit(hint)
+            self.aiResponseReceived.emit(request_id, "".join(chunks))
 
         except Exception as e:
+            self.aiResponseFailed.emit(request_id, str(e))
             self.operationFailed.emit("send_ai_message", str(e))
 
-    def _handleJoinClass(self):
+    def _streamHint(self, sub_question_id: int, question: str, history: list):
+        """Request a hint and yield its text as it arrives
+
+        The hint is requested as server-sent events, each carrying a JSON
+        object with a "delta" text, until a "[DONE]" event. Servers without
+        streaming support answer with the usual JSON body, which is yielded as
+        a single chunk.
+
+        Args:
+            sub_question_id (int): The ID of the sub-question
+            question (str): The question of the student
+            history (list): The previous messages of the conversation
+
+        Yields:
+            str: The chunks of the hint
+        """
+        llm = self.nanokoClient.llm
+        params = {
+            "sub_question_id": sub_question_id,
+            "question": question,
+            "context": [
+                LLMMessage.model_validate(message).model_dump() for message in history
+            ],
+        }
+        with llm.client.stream(
+            "POST",
+            f"{llm.base_url}/api/v1/llm/hint",
+            json=params,
+            headers={"Accept": "text/event-stream, application/json"},
+        ) as response:
+            if response.is_error:
+                response.read()
+                raise_nanoko_api_exception(response)
+
+            if not response.headers.get("content-type", "").startswith(
+                "text/event-stream"
+            ):
+                response.read()
+                yield response.json()["hint"]
+                return
+
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    return
+
+                delta = json.loads(data).get("delta", "")
+                if delta:
+                    yield delta
+
+    def _handleJoinClass(self, params: dict):
         """Handle joining a class"""
         try:
-            class_name = self.params.get("class_name", "")
-            enter_code = self.params.get("enter_code", "")
+            class_name = params.get("class_name", "")
+            enter_code = params.get("enter_code", "")
 
             if class_name and enter_code:
                 self.nanokoClient.user.join_class(class_name, enter_code)
@@ -669,7 +1325,7 @@ class ApiWorker(QThread):
             self.operationFailed.emit("join_class", str(e))
 
     # Teacher-specific mock data handlers
-    def _handleLoadTeacherDashboardData(self):
+    def _handleLoadTeacherDashboardData(self, params: dict):
         """Load teacher dashboard data"""
         print("[ApiWorker] _handleLoadTeacherDashboardData called")
 
@@ -684,6 +1340,13 @@ class ApiWorker(QThread):
 
         try:
             overview = self.nanokoClient.service.get_teacher_overview()
+            assignment_images = self._fetchConcurrently(
+                self.nanokoClient.user.get_assignment_image,
+                [assignment.id for assignment in overview.assignments],
+            )
+            performance_data = self._getPerformanceDateData(
+                student.id for student in overview.students
+            )
             dashboard_data = {
                 "classes": [
                     {
@@ -707,9 +1370,7 @@ class ApiWorker(QThread):
                         "id": assignment.id,
                         "name": assignment.name,
                         "description": assignment.description,
-                        "image": self.nanokoClient.user.get_assignment_image(
-                            assignment.id
-                        ),
+                        "image": assignment_images[assignment.id],
                     }
                     for assignment in overview.assignments
                 ],
@@ -718,11 +1379,7 @@ class ApiWorker(QThread):
                         "id": student.id,
                         "name": student.display_name,
                         "performance_data": _process_performance_data(
-                            self.nanokoClient.service.get_performance_date_data(
-                                user_id=student.id,
-                                start_time=datetime.now(timezone.utc)
-                                - timedelta(days=30),
-                            )
+                            performance_data[student.id]
                         ),
                     }
                     for student in overview.students
@@ -748,17 +1405,22 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("load_teacher_dashboard_data", str(e))
 
-    def _handleLoadTeacherAssignmentsData(self):
+    def _handleLoadTeacherAssignmentsData(self, params: dict):
         """Load teacher assignments data"""
         print("[ApiWorker] _handleLoadTeacherAssignmentsData called")
         try:
             assignments = self.nanokoClient.user.get_assignments()
+            self.entityStore.put("assignment", assignments)
+            assignment_images = self._fetchConcurrently(
+                self.nanokoClient.user.get_assignment_image,
+                [assignment.id for assignment in assignments],
+            )
             assignments_data = [
                 {
                     "id": assignment.id,
                     "name": assignment.name,
                     "description": assignment.description,
-                    "image": self.nanokoClient.user.get_assignment_image(assignment.id),
+                    "image": assignment_images[assignment.id],
                 }
                 for assignment in assignments
             ]
@@ -771,11 +1433,58 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("load_teacher_assignments_data", str(e))
 
-    def _handleLoadTeacherQuestionsData(self):
-        """Load teacher questions data"""
-        print("[ApiWorker] _handleLoadTeacherQuestionsData called")
+    def _getUserQuestionsPage(
+        self, after_id: Optional[int], limit: int
+    ) -> Tuple[List[Question], Optional[int]]:
+        """Get a page of the questions created by the current user
+
+        Pages are ordered by id and the cursor is the id of the last question of
+        the previous page. Servers that ignore the page parameters return every
+        question, which is then kept as a snapshot to serve the following pages,
+        so the first page always reflects the latest questions.
+
+        Args:
+            after_id (Optional[int]): The cursor, None for the first page
+            limit (int): The page size
+
+        Returns:
+            Tuple[List[Question], Optional[int]]: The questions of the page, and
+                the cursor of the next page, or None on the last page
+        """
+        questions = (
+            self._questionSnapshots.get("user") if after_id is not None else None
+        )
+        if questions is None:
+            user = self.nanokoClient.user
+            query = {"limit": limit + 1}
+            if after_id is not None:
+                query["after_id"] = after_id
+            response = user.client.get(
+                f"{user.base_url}/api/v1/user/questions", params=query
+            )
+            raise_nanoko_api_exception(response)
+            questions = sorted(
+                (Question.model_validate(q) for q in response.json()),
+                key=lambda question: question.id,
+            )
+            if len(questions) > limit + 1:
+                self._questionSnapshots["user"] = questions
+            else:
+                self._questionSnapshots.pop("user", None)
+
+        if after_id is not None:
+            questions = [question for question in questions if question.id > after_id]
+        page = questions[:limit]
+        self.entityStore.putQuestions(page)
+        return page, page[-1].id if len(questions) > limit else None
+
+    def _handleLoadTeacherQuestionsPage(self, params: dict):
+        """Load a page of teacher questions data"""
         try:
-            questions = self.nanokoClient.user.get_questions()
+            after_id = params.get("after_id")
+            questions, next_cursor = self._getUserQuestionsPage(
+                after_id, params.get("limit", QUESTIONS_PAGE_SIZE)
+            )
             questions_data = [
                 {
                     "id": question.id,
@@ -786,16 +1495,19 @@ class ApiWorker(QThread):
                 }
                 for question in questions
             ]
-            self.teacherQuestionsDataLoaded.emit(questions_data)
+            self.teacherQuestionsPageLoaded.emit(after_id, questions_data, next_cursor)
         except Exception as e:
-            self.operationFailed.emit("load_teacher_questions_data", str(e))
+            self.operationFailed.emit("load_teacher_questions_page", str(e))
 
-    def _handleLoadTeacherClassData(self):
+    def _handleLoadTeacherClassData(self, params: dict):
         """Load individual teacher class data"""
         try:
-            class_id = self.params.get("class_id")
+            class_id = params.get("class_id")
 
             class_data = self.nanokoClient.user.get_class_data(class_id)
+            self.entityStore.put("class", [class_data], idField="class_id")
+            self.entityStore.put("user", class_data.students)
+            self.entityStore.put("assignment", class_data.assignments)
             class_name = class_data.name
             class_code = class_data.enter_code
             students = class_data.students
@@ -846,14 +1558,14 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("load_teacher_class_data", str(e))
 
-    def _handleLoadTeacherStudentStatistics(self):
+    def _handleLoadTeacherStudentStatistics(self, params: dict):
         """Load teacher student statistics"""
         print(
-            f"[ApiWorker] _handleLoadTeacherStudentStatistics called with params: {self.params}"
+            f"[ApiWorker] _handleLoadTeacherStudentStatistics called with params: {params}"
         )
         try:
-            student_id = self.params.get("student_id")
-            student_name = self.params.get("student_name")
+            student_id = params.get("student_id")
+            student_name = params.get("student_name")
             matrix_30_days = self.nanokoClient.service.get_recent_average_performances(
                 user_id=student_id,
                 start_time=datetime.now(timezone.utc) - timedelta(days=30),
@@ -861,15 +1573,12 @@ class ApiWorker(QThread):
             matrix_all_time = self.nanokoClient.service.get_average_performances(
                 user_id=student_id,
             )
-            performance_chart_data = (
-                self.nanokoClient.service.get_performance_date_data(
-                    user_id=student_id,
-                    start_time=datetime.now(timezone.utc) - timedelta(days=30),
-                )
-            )
+            performance_chart_data = self._getPerformanceDateData([student_id])[
+                student_id
+            ]
 
             student_data = {
-                "class_id": self.params.get("class_id"),
+                "class_id": params.get("class_id"),
                 "student_id": student_id,
                 "student_name": student_name,
                 "matrix_30_days": matrix_30_days.model_dump(),
@@ -888,10 +1597,11 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("load_teacher_student_statistics", str(e))
 
-    def _handleLoadAvailableAssignments(self):
+    def _handleLoadAvailableAssignments(self, params: dict):
         """Handle loading available assignments"""
         try:
             assignments = self.nanokoClient.user.get_assignments()
+            self.entityStore.put("assignment", assignments)
             available_assignments_data = [
                 {
                     "id": assignment.id,
@@ -909,12 +1619,12 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("load_available_assignments", str(e))
 
-    def _handleCreateAssignment(self):
+    def _handleCreateAssignment(self, params: dict):
         """Handle creating a new assignment"""
         try:
-            name = self.params.get("name", "")
-            description = self.params.get("description", "")
-            question_ids = self.params.get("question_ids", [])
+            name = params.get("name", "")
+            description = params.get("description", "")
+            question_ids = params.get("question_ids", [])
 
             if not name or not description:
                 self.assignmentCreated.emit(
@@ -931,6 +1641,7 @@ class ApiWorker(QThread):
                 description=description,
                 question_ids=question_ids,
             )
+            self.entityStore.put("assignment", [assignment])
             self.assignmentCreated.emit(
                 True, f"Assignment '{assignment.name}' created successfully!"
             )
@@ -942,11 +1653,11 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("create_assignment", str(e))
 
-    def _handleCreateClass(self):
+    def _handleCreateClass(self, params: dict):
         """Handle creating a new class"""
         try:
-            class_name = self.params.get("class_name", "")
-            enter_code = self.params.get("enter_code", "")
+            class_name = params.get("class_name", "")
+            enter_code = params.get("enter_code", "")
 
             if not class_name:
                 self.classCreated.emit(False, "Class name is required.")
@@ -969,12 +1680,12 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("create_class", str(e))
 
-    def _handleCreateQuestion(self):
+    def _handleCreateQuestion(self, params: dict):
         """Handle creating a new question"""
         try:
-            name = self.params.get("name", "")
-            source = self.params.get("source", "")
-            sub_questions_data = self.params.get("sub_questions_data", [])
+            name = params.get("name", "")
+            source = params.get("source", "")
+            sub_questions_data = params.get("sub_questions_data", [])
 
             if not name or not sub_questions_data:
                 self.questionCreated.emit(
@@ -982,20 +1693,15 @@ class ApiWorker(QThread):
                 )
                 return
 
-            path_to_id = {}
-            for sub_question in sub_questions_data:
-                if sub_question["image_path"]:
-                    image_hash = self.nanokoClient.bank.upload_image(
-                        file=sub_question["image_path"],
-                        content_type="image/png"
-                        if sub_question["image_path"].endswith(".png")
-                        else "image/jpeg",
-                    )
-                    image_id = self.nanokoClient.bank.add_image(
-                        hash=image_hash,
-                        description=sub_question["image_description"],
-                    )
-                    path_to_id[sub_question["image_path"]] = image_id
+            image_ids = self.imageUploader.upload(
+                self.nanokoClient.bank,
+                [
+                    (sub_question["image_path"], sub_question["image_description"])
+                    for sub_question in sub_questions_data
+                    if sub_question["image_path"]
+                ],
+                self.imageUploadProgress.emit,
+            )
 
             question = Question(
                 name=name,
@@ -1008,8 +1714,13 @@ class ApiWorker(QThread):
                         process=ProcessType[textToEnumName(sub_question["process"])],
                         keywords=sub_question["keywords"],
                         options=sub_question["options"],
-                        image_id=path_to_id[sub_question["image_path"]]
-                        if sub_question["image_path"] is not None
+                        image_id=image_ids[
+                            (
+                                sub_question["image_path"],
+                                sub_question["image_description"],
+                            )
+                        ]
+                        if sub_question["image_path"]
                         else None,
                     )
                     for sub_question in sub_questions_data
@@ -1032,16 +1743,46 @@ class ApiWorker(QThread):
             print(traceback.format_exc())
             self.operationFailed.emit("create_question", str(e))
 
-    def _handleLoadClassAssignmentReview(self):
+    def _handleImportQuestions(self, params: dict):
+        """Handle creating the questions of a manifest in bulk"""
+        importer = QuestionImporter(self.imageUploader, self.localStore)
+        self._questionImporter = importer
+        try:
+            questions = importer.load(params.get("manifest_path", ""))
+            report = importer.run(
+                self.nanokoClient.bank, questions, self.questionImportProgress.emit
+            )
+            self.questionImportFinished.emit(report)
+        except ManifestError as e:
+            self.operationFailed.emit("import_questions", str(e))
+        except Exception as e:
+            print(traceback.format_exc())
+            self.operationFailed.emit("import_questions", str(e))
+        finally:
+            if self._questionImporter is importer:
+                self._questionImporter = None
+
+    def cancelQuestionImport(self):
+        """Stop the running bulk import once the questions being created are added
+
+        The questions that were not started are imported when the same
+        manifest is imported again.
+        """
+        importer = self._questionImporter
+        if importer is not None:
+            importer.cancel()
+
+    def _handleLoadClassAssignmentReview(self, params: dict):
         """Load class assignment review data for teachers"""
         try:
-            assignment_id = self.params.get("assignment_id", 1)
-            class_id = self.params.get("class_id")
+            assignment_id = params.get("assignment_id", 1)
+            class_id = params.get("class_id")
 
             review_data = self.nanokoClient.user.get_assignment_review_data(
                 class_id=class_id,
                 assignment_id=assignment_id,
             )
+            images = self._prefetchImages(review_data.questions)
             total_students = 0
             if (
                 len(review_data.questions) > 0
@@ -1069,9 +1810,7 @@ class ApiWorker(QThread):
                                 if sub_question.options
                                 else "text",
                                 "options": sub_question.options,
-                                "image": self.nanokoClient.bank.get_image(
-                                    sub_question.image_id
-                                )
+                                "image": images[sub_question.image_id]
                                 if sub_question.image_id is not None
                                 else None,
                                 "student_performances": [
@@ -1108,13 +1847,11 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("load_class_assignment_review", str(e))
 
-    def _handleRemoveStudentFromClass(self):
+    def _handleRemoveStudentFromClass(self, params: dict):
         """Handle removing a student from a class"""
-        print(
-            f"[ApiWorker] _handleRemoveStudentFromClass called with params: {self.params}"
-        )
+        print(f"[ApiWorker] _handleRemoveStudentFromClass called with params: {params}")
         try:
-            student_id = self.params.get("student_id", "")
+            student_id = params.get("student_id", "")
 
             if not student_id:
                 self.studentRemovedFromClass.emit(False, "Student id is required.")
@@ -1133,23 +1870,18 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("remove_student_from_class", str(e))
 
-    def _handleLoadAssignmentQuestions(self):
+    def _handleLoadAssignmentQuestions(self, params: dict):
         """Handle loading assignment questions"""
         try:
-            assignment_id = self.params.get("assignment_id")
-            assignments = self.nanokoClient.user.get_assignments()
-            assignment_result = [
-                assignment
-                for assignment in assignments
-                if assignment.id == assignment_id
-            ]
-            if not assignment_result:
+            assignment_id = params.get("assignment_id")
+            assignment = self._getAssignment(assignment_id)
+            if assignment is None:
                 self.operationFailed.emit(
                     "load_assignment_questions", "Assignment not found"
                 )
-            assignment = assignment_result[0]
-            question_ids = assignment.question_ids
-            questions = self.nanokoClient.bank.get_questions(question_ids)
+                return
+            questions = self._getQuestions(assignment.question_ids)
+            images = self._prefetchImages(questions)
 
             assignment_questions_data = {
                 "title": assignment.name,
@@ -1168,9 +1900,7 @@ class ApiWorker(QThread):
                                 "text": sub_question.description,
                                 "answer": sub_question.answer,
                                 "options": sub_question.options,
-                                "image": self.nanokoClient.bank.get_image(
-                                    sub_question.image_id
-                                )
+                                "image": images[sub_question.image_id]
                                 if sub_question.image_id is not None
                                 else None,
                             }
@@ -1189,12 +1919,12 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("load_assignment_questions", str(e))
 
-    def _handleAssignAssignmentToClass(self):
+    def _handleAssignAssignmentToClass(self, params: dict):
         """Handle assigning an assignment to a class"""
         try:
-            assignment_id = self.params.get("assignment_id")
-            class_id = self.params.get("class_id")
-            due_date = self.params.get("due_date")
+            assignment_id = params.get("assignment_id")
+            class_id = params.get("class_id")
+            due_date = params.get("due_date")
 
             print(
                 f"[ApiWorker] Mock: Assigning assignment {assignment_id} to class {class_id} with due date {due_date}"
@@ -1226,13 +1956,13 @@ class ApiWorker(QThread):
         except Exception as e:
             self.operationFailed.emit("assign_assignment_to_class", str(e))
 
-    def _handleLoadFilteredQuestions(self):
+    def _handleLoadFilteredQuestions(self, params: dict):
         """Handle loading filtered questions for selection"""
         print("[ApiWorker] _handleLoadFilteredQuestions called")
         try:
-            search_text = self.params.get("search_text", "").lower()
-            concept_filter = self.params.get("concept_filter", "")
-            process_filter = self.params.get("process_filter", "")
+            search_text = params.get("search_text", "").lower()
+            concept_filter = params.get("concept_filter", "")
+            process_filter = params.get("process_filter", "")
 
             print(
                 f"[ApiWorker] Filters - search: '{search_text}', concept: '{concept_filter}', process: '{process_filter}'"
@@ -1252,60 +1982,97 @@ class ApiWorker(QThread):
             questions = self.nanokoClient.bank.get_questions(
                 keyword=search_text, concept=concept, process=process
             )
+            self.entityStore.putQuestions(questions)
 
             questions_data = [
+                self._selectionQuestionData(question) for question in questions
+            ]
+
+            self.filteredQuestionsLoaded.emit(
+                params.get("generation", 0), questions_data
+            )
+
+        except Exception as e:
+            self.operationFailed.emit("load_filtered_questions", str(e))
+
+    def _selectionQuestionData(self, question: Question) -> dict:
+        """Convert a bank question into the data shown when selecting questions
+
+        Args:
+            question (Question): The question
+
+        Returns:
+            dict: The question data
+        """
+        return {
+            "id": question.id,
+            "title": question.name,
+            "sub_questions": [
                 {
-                    "id": question.id,
-                    "title": question.name,
-                    "sub_questions": [
-                        {
-                            "id": sub_question.id,
-                            "type": "multiple_choice"
-                            if sub_question.options
-                            else "text",
-                            "text": sub_question.description,
-                            "answer": sub_question.answer,
-                            "options": sub_question.options,
-                            "image": self.nanokoClient.bank.get_image(
-                                sub_question.image_id
-                            )
-                            if sub_question.image_id is not None
-                            else None,
-                            "tags": [
-                                (
-                                    enumNameToText(sub_question.concept.name),
-                                    "concept",
-                                ),
-                                (
-                                    enumNameToText(sub_question.process.name),
-                                    "process",
-                                ),
-                            ],
-                        }
-                        for sub_question in question.sub_questions
+                    "id": sub_question.id,
+                    "type": "multiple_choice" if sub_question.options else "text",
+                    "text": sub_question.description,
+                    "answer": sub_question.answer,
+                    "options": sub_question.options,
+                    "image_id": sub_question.image_id,
+                    "tags": [
+                        (enumNameToText(sub_question.concept.name), "concept"),
+                        (enumNameToText(sub_question.process.name), "process"),
                     ],
-                    "attribution": getAttribution(question.source),
                 }
-                for question in questions
-            ]
+                for sub_question in question.sub_questions
+            ],
+            "attribution": getAttribution(question.source),
+        }
+
+    def _handleLoadQuestionBank(self, params: dict):
+        """Download the whole question bank once and index it for local search"""
+        try:
+            questions = self.nanokoClient.bank.get_questions()
+            self.entityStore.putQuestions(questions)
 
-            self.filteredQuestionsLoaded.emit(questions_data)
+            index = QuestionIndex()
+            for question in questions:
+                index.add(
+                    self._selectionQuestionData(question),
+                    [question.name]
+                    + [
+                        text
+                        for sub_question in question.sub_questions
+                        for text in [
+                            sub_question.description,
+                            *(sub_question.keywords or []),
+                        ]
+                    ],
+                    [
+                        sub_question.concept.value
+                        for sub_question in question.sub_questions
+                    ],
+                    [
+                        sub_question.process.value
+                        for sub_question in question.sub_questions
+                    ],
+                )
+            index.build()
+
+            print(f"[ApiWorker] Indexed {len(index)} bank questions")
+            self.questionBankLoaded.emit(index)
 
         except Exception as e:
-            self.operationFailed.emit("load_filtered_questions", str(e))
+            self.operationFailed.emit("load_question_bank", str(e))
 
-    def _handleLoadQuestionPreview(self):
+    def _handleLoadQuestionPreview(self, params: dict):
         """Handle loading question preview data"""
         try:
-            question_id = self.params.get("question_id")
-            questions = self.nanokoClient.user.get_questions()
-            question = [
-                question for question in questions if question.id == question_id
-            ]
-            if len(question) == 0:
+            question_id = params.get("question_id")
+            question = self.entityStore.get("question", question_id)
+            if question is None:
+                self.entityStore.putQuestions(self.nanokoClient.user.get_questions())
+                question = self.entityStore.get("question", question_id)
+            if question is None:
                 self.operationFailed.emit("load_question_preview", "Question not found")
                 return
-            question = question[0]
+            images = self._prefetchImages([question])
             question_data = {
                 "id": question.id,
                 "title": question.name,
@@ -1317,7 +2084,7 @@ class ApiWorker(QThread):
                         "text": sub_question.description,
                         "answer": sub_question.answer,
                         "options": sub_question.options,
-                        "image": self.nanokoClient.bank.get_image(sub_question.image_id)
+                        "image": images[sub_question.image_id]
                         if sub_question.image_id is not None
                         else None,
                         "tags": [
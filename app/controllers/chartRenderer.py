@@ -0,0 +1,195 @@
+import json
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtCore import QObject, pyqtSignal
+from typing import TYPE_CHECKING, Hashable, Optional, Tuple
+
+from app.config import CHART_CACHE_MAX_ENTRIES
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+
+def plotPerformanceChart(figure: "Figure", studentName: str, performanceData: dict):
+    """Plot a student's recent average performance onto a figure
+
+    Args:
+        figure (Figure): The figure to draw on, it is cleared first
+        studentName (str): The name of the student
+        performanceData (dict): The "dates" and "scores" of the student
+    """
+    figure.clear()
+
+    dates = performanceData.get("dates", [])
+    scores = performanceData.get("scores", [])
+
+    ax = figure.add_subplot(111)
+
+    if dates and scores and len(dates) == len(scores):
+        ax.plot(dates, scores, "o-", color="#0078d4", linewidth=2, markersize=6)
+    else:
+        ax.text(
+            0.5,
+            0.5,
+            "No performance data available",
+            horizontalalignment="center",
+            verticalalignment="center",
+            transform=ax.transAxes,
+            fontsize=12,
+        )
+
+    ax.set_ylim(0, 4)
+    ax.set_ylabel("Score")
+    ax.set_title(
+        f"{studentName}'s Recent Average Performance",
+        fontsize=12,
+        fontweight="bold",
+    )
+    ax.grid(True, alpha=0.3)
+    ax.set_facecolor("#f8f9fa")
+
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
+    ax.spines["left"].set_color("#ccc")
+    ax.spines["bottom"].set_color("#ccc")
+
+
+class ChartRenderer(QObject):
+    """Render student performance charts off the GUI thread
+
+    A single background thread owns one Agg figure and renders every chart
+    into a QImage, so no live canvases are created no matter how many charts
+    are shown. matplotlib is only imported by the first render. Rendered
+    charts are cached as QPixmaps keyed by (student id, data hash), and a
+    chart is only rendered once per key.
+    """
+
+    chartReady = pyqtSignal(object, QPixmap)  # key, pixmap
+    _chartRendered = pyqtSignal(object, QImage)  # key, image
+
+    def __init__(
+        self,
+        width: int = 400,
+        height: int = 250,
+        dpi: int = 80,
+        maxEntries: int = CHART_CACHE_MAX_ENTRIES,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.width = width
+        self.height = height
+        self.dpi = dpi
+        self.maxEntries = maxEntries
+
+        self._pixmaps = OrderedDict()  # key -> QPixmap
+        self._pendingKeys = set()
+        self._figure = None
+        self._canvas = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="chart-renderer"
+        )
+
+        self._chartRendered.connect(self._onChartRendered)
+
+    @staticmethod
+    def makeKey(
+        studentId: Hashable, studentName: str, performanceData: dict
+    ) -> Tuple[Hashable, str]:
+        """Build the cache key of a chart
+
+        Args:
+            studentId (Hashable): The id of the student
+            studentName (str): The name of the student, shown in the title
+            performanceData (dict): The "dates" and "scores" of the student
+
+        Returns:
+            Tuple[Hashable, str]: The student id and a hash of the chart data
+        """
+        data = json.dumps([studentName, performanceData], sort_keys=True, default=str)
+        return studentId, hashlib.sha1(data.encode()).hexdigest()
+
+    def request(
+        self, studentId: Hashable, studentName: str, performanceData: dict
+    ) -> Tuple[Tuple[Hashable, str], Optional[QPixmap]]:
+        """Get a chart, rendering it in the background when it is not cached
+
+        chartReady is emitted with the key once a missing chart is rendered.
+
+        Args:
+            studentId (Hashable): The id of the student
+            studentName (str): The name of the student
+            performanceData (dict): The "dates" and "scores" of the student
+
+        Returns:
+            Tuple[Tuple[Hashable, str], Optional[QPixmap]]: The key of the chart
+                and the cached chart, or None while it is rendering
+        """
+        key = self.makeKey(studentId, studentName, performanceData)
+
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return key, pixmap
+
+        if key not in self._pendingKeys:
+            self._pendingKeys.add(key)
+            self._executor.submit(self._render, key, studentName, performanceData)
+        return key, None
+
+    def _render(self, key: tuple, studentName: str, performanceData: dict):
+        """Render a chart on the background thread
+
+        Args:
+            key (tuple): The key of the chart
+            studentName (str): The name of the student
+            performanceData (dict): The "dates" and "scores" of the student
+        """
+        try:
+            if self._figure is None:
+                from matplotlib.figure import Figure
+                from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+                self._figure = Figure(
+                    figsize=(self.width / self.dpi, self.height / self.dpi),
+                    dpi=self.dpi,
+                    facecolor="white",
+                )
+                self._canvas = FigureCanvasAgg(self._figure)
+
+            plotPerformanceChart(self._figure, studentName, performanceData)
+            self._figure.subplots_adjust(left=0.12, right=0.97, top=0.88, bottom=0.12)
+            self._canvas.draw()
+
+            buffer = self._canvas.buffer_rgba()
+            image = QImage(
+                bytes(buffer),
+                buffer.shape[1],
+                buffer.shape[0],
+                QImage.Format.Format_RGBA8888,
+            ).copy()
+        except Exception as e:
+            print(f"[ChartRenderer] Failed to render chart {key}: {e}")
+            image = QImage()
+
+        self._chartRendered.emit(key, image)
+
+    def _onChartRendered(self, key: tuple, image: QImage):
+        """Cache a rendered chart on the GUI thread and announce it
+
+        Args:
+            key (tuple): The key of the chart
+            image (QImage): The rendered chart, null if rendering failed
+        """
+        self._pendingKeys.discard(key)
+        if image.isNull():
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        self._pixmaps[key] = pixmap
+        self._pixmaps.move_to_end(key)
+        while len(self._pixmaps) > self.maxEntries:
+            self._pixmaps.popitem(last=False)
+
+        self.chartReady.emit(key, pixmap)
@@ -0,0 +1,138 @@
+import time
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.config import ENTITY_STORE_TTL, ENTITY_STORE_INVALIDATIONS
+
+
+class EntityStore:
+    """Normalized store of the entities carried by API responses
+
+    Assignments, questions, sub-questions, classes and users are kept once
+    per kind, keyed by id, whichever response they arrived in. Handlers that
+    need a single entity look it up here first and only download the whole
+    collection on a miss, which also refills the store. Entries expire after
+    a TTL and write operations drop the kinds they change. All methods are
+    safe to call from the ApiWorker's pooled threads.
+    """
+
+    KINDS = ("assignment", "question", "sub_question", "class", "user")
+
+    def __init__(
+        self,
+        ttl: float = ENTITY_STORE_TTL,
+        invalidations: Dict[str, List[str]] = ENTITY_STORE_INVALIDATIONS,
+    ):
+        self.ttl = ttl
+        self.invalidations = invalidations
+
+        self._lock = threading.Lock()
+        self._entities = {kind: {} for kind in self.KINDS}  # id -> (timestamp, entity)
+
+    def put(self, kind: str, entities: Iterable[Any], idField: str = "id"):
+        """Store entities of a kind, replacing older versions
+
+        Args:
+            kind (str): The kind of the entities
+            entities (Iterable[Any]): The entities
+            idField (str, optional): The attribute holding the id. Defaults to "id".
+        """
+        now = time.monotonic()
+        with self._lock:
+            table = self._entities[kind]
+            for entity in entities:
+                table[getattr(entity, idField)] = (now, entity)
+
+    def putQuestions(self, questions: Iterable[Any]):
+        """Store questions and their sub-questions
+
+        Args:
+            questions (Iterable[Any]): The questions
+        """
+        questions = list(questions)
+        self.put("question", questions)
+        self.put(
+            "sub_question",
+            (
+                sub_question
+                for question in questions
+                for sub_question in question.sub_questions
+            ),
+        )
+
+    def get(self, kind: str, entityId: int) -> Optional[Any]:
+        """Get an entity by id
+
+        Args:
+            kind (str): The kind of the entity
+            entityId (int): The id of the entity
+
+        Returns:
+            Optional[Any]: The entity, or None if it is missing or expired
+        """
+        with self._lock:
+            return self._lookup(self._entities[kind], entityId, time.monotonic())
+
+    def getMany(self, kind: str, entityIds: Iterable[int]) -> Tuple[dict, list]:
+        """Get entities by id
+
+        Args:
+            kind (str): The kind of the entities
+            entityIds (Iterable[int]): The ids of the entities
+
+        Returns:
+            Tuple[dict, list]: The stored entities by id, and the ids that are
+                missing or expired
+        """
+        found = {}
+        missing = []
+        now = time.monotonic()
+        with self._lock:
+            table = self._entities[kind]
+            for entityId in entityIds:
+                entity = self._lookup(table, entityId, now)
+                if entity is None:
+                    missing.append(entityId)
+                else:
+                    found[entityId] = entity
+        return found, missing
+
+    def _lookup(self, table: dict, entityId: int, now: float) -> Optional[Any]:
+        entry = table.get(entityId)
+        if entry is None:
+            return None
+
+        timestamp, entity = entry
+        if now - timestamp > self.ttl:
+            del table[entityId]
+            return None
+        return entity
+
+    def invalidate(self, kind: str, entityId: int = None):
+        """Drop an entity, or every entity of a kind
+
+        Args:
+            kind (str): The kind of the entities
+            entityId (int, optional): The id of the entity, None for all of the
+                kind. Defaults to None.
+        """
+        with self._lock:
+            if entityId is None:
+                self._entities[kind].clear()
+            else:
+                self._entities[kind].pop(entityId, None)
+
+    def invalidateAfter(self, operation: str):
+        """Drop the kinds of entities a write operation changes
+
+        Args:
+            operation (str): The operation
+        """
+        for kind in self.invalidations.get(operation, ()):
+            self.invalidate(kind)
+
+    def clear(self):
+        """Drop every entity, e.g. when another user signs in"""
+        with self._lock:
+            for table in self._entities.values():
+                table.clear()
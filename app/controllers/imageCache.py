@@ -0,0 +1,211 @@
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+from collections import OrderedDict
+from PyQt6.QtCore import QStandardPaths
+
+from app.utils import serverKey
+from app.config import NANOKO_BASE_URL, IMAGE_CACHE_DISK_BYTES, IMAGE_CACHE_MEMORY_BYTES
+
+
+class ImageCache:
+    """Two-tier cache for question images keyed by image id
+
+    Recently used images are kept in an in-memory LRU tier. Every image is also
+    written to a size-bounded directory on disk so it survives app restarts;
+    the least recently used files are evicted once the directory grows past its
+    limit. Image ids are only unique per server, so each server has its own
+    directory. All methods are safe to call from the ApiWorker's pooled
+    threads.
+    """
+
+    def __init__(
+        self,
+        cacheDir: str = None,
+        memoryBytes: int = IMAGE_CACHE_MEMORY_BYTES,
+        diskBytes: int = IMAGE_CACHE_DISK_BYTES,
+        baseUrl: str = NANOKO_BASE_URL,
+    ):
+        self.cacheDir = Path(cacheDir or self._defaultCacheDir(baseUrl))
+        self.memoryBytes = memoryBytes
+        self.diskBytes = diskBytes
+
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._memorySize = 0
+        self._diskSize = 0
+
+        try:
+            self.cacheDir.mkdir(parents=True, exist_ok=True)
+            self._diskSize = sum(
+                path.stat().st_size for path in self.cacheDir.glob("*.img")
+            )
+        except OSError as e:
+            print(f"[ImageCache] Disk tier disabled: {e}")
+            self.diskBytes = 0
+
+    @staticmethod
+    def _defaultCacheDir(baseUrl: str) -> str:
+        """Get the default cache directory for the images of a server
+
+        Args:
+            baseUrl (str): The base URL of the server
+
+        Returns:
+            str: The cache directory
+        """
+        location = QStandardPaths.writableLocation(
+            QStandardPaths.StandardLocation.CacheLocation
+        )
+        if not location:
+            location = os.path.join(os.path.expanduser("~"), ".cache", "nanoko")
+        return os.path.join(location, "images", serverKey(baseUrl))
+
+    def _pathFor(self, image_id: int) -> Path:
+        """Get the disk path of an image
+
+        Args:
+            image_id (int): The id of the image
+
+        Returns:
+            Path: The path of the cached file
+        """
+        return self.cacheDir / f"{image_id}.img"
+
+    def get(self, image_id: int) -> Optional[bytes]:
+        """Get an image from the cache
+
+        Args:
+            image_id (int): The id of the image
+
+        Returns:
+            Optional[bytes]: The image bytes, or None on a miss
+        """
+        with self._lock:
+            data = self._memory.get(image_id)
+            if data is not None:
+                self._memory.move_to_end(image_id)
+                return data
+
+        if not self.diskBytes:
+            return None
+
+        path = self._pathFor(image_id)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            self._storeInMemory(image_id, data)
+        return data
+
+    def put(self, image_id: int, data: bytes):
+        """Store an image in both cache tiers
+
+        Args:
+            image_id (int): The id of the image
+            data (bytes): The image bytes
+        """
+        if not data:
+            return
+
+        with self._lock:
+            self._storeInMemory(image_id, data)
+
+        if not self.diskBytes or len(data) > self.diskBytes:
+            return
+
+        path = self._pathFor(image_id)
+        tempPath = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            previousSize = path.stat().st_size if path.exists() else 0
+            tempPath.write_bytes(data)
+            os.replace(tempPath, path)
+        except OSError as e:
+            print(f"[ImageCache] Failed to write image {image_id}: {e}")
+            return
+
+        with self._lock:
+            self._diskSize += len(data) - previousSize
+            if self._diskSize > self.diskBytes:
+                self._evictFromDisk()
+
+    def invalidate(self, image_id: int):
+        """Remove an image from both cache tiers
+
+        Args:
+            image_id (int): The id of the image
+        """
+        with self._lock:
+            data = self._memory.pop(image_id, None)
+            if data is not None:
+                self._memorySize -= len(data)
+
+            path = self._pathFor(image_id)
+            try:
+                size = path.stat().st_size
+                path.unlink()
+                self._diskSize -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove every image from both cache tiers"""
+        with self._lock:
+            self._memory.clear()
+            self._memorySize = 0
+            for path in self.cacheDir.glob("*.img"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._diskSize = 0
+
+    def _storeInMemory(self, image_id: int, data: bytes):
+        """Insert an image into the memory tier, evicting old entries
+
+        Must be called with the lock held.
+
+        Args:
+            image_id (int): The id of the image
+            data (bytes): The image bytes
+        """
+        previous = self._memory.pop(image_id, None)
+        if previous is not None:
+            self._memorySize -= len(previous)
+
+        if len(data) > self.memoryBytes:
+            return
+
+        self._memory[image_id] = data
+        self._memorySize += len(data)
+
+        while self._memorySize > self.memoryBytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memorySize -= len(evicted)
+
+    def _evictFromDisk(self):
+        """Delete the least recently used files until the disk tier fits
+
+        Must be called with the lock held.
+        """
+        try:
+            entries = sorted(
+                (path.stat().st_mtime, path.stat().st_size, path)
+                for path in self.cacheDir.glob("*.img")
+            )
+        except OSError:
+            return
+
+        self._diskSize = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._diskSize <= self.diskBytes:
+                break
+            try:
+                path.unlink()
+                self._diskSize -= size
+            except OSError:
+                pass
@@ -0,0 +1,178 @@
+import hashlib
+from typing import Hashable, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtGui import QGuiApplication, QImage, QPixmap, QPixmapCache
+
+from app.config import IMAGE_DECODE_MAX_WORKERS, IMAGE_PIXMAP_CACHE_BYTES
+
+
+class ImageDecoder(QObject):
+    """Decode, crop and scale images off the GUI thread
+
+    Images are decoded into QImages on a small thread pool, at the exact
+    device pixel size they are shown at. The GUI thread only turns the
+    result into a QPixmap. Pixmaps are kept in the global, size-bounded
+    QPixmapCache under (image id, size, device pixel ratio, shape). Showing
+    an image again, e.g. after its page is rebuilt, needs no decoding.
+    """
+
+    imageReady = pyqtSignal(object, QPixmap)  # key, pixmap
+    imageFailed = pyqtSignal(object)  # key
+    _imageDecoded = pyqtSignal(object, QImage)  # key, image
+
+    _instance = None
+
+    def __init__(self, maxWorkers: int = IMAGE_DECODE_MAX_WORKERS, parent=None):
+        super().__init__(parent)
+        self._pendingKeys = set()
+        self._executor = ThreadPoolExecutor(
+            max_workers=maxWorkers, thread_name_prefix="image-decoder"
+        )
+
+        QPixmapCache.setCacheLimit(IMAGE_PIXMAP_CACHE_BYTES // 1024)
+        self._imageDecoded.connect(self._onImageDecoded)
+
+    @classmethod
+    def instance(cls) -> "ImageDecoder":
+        """Get the decoder shared by every view
+
+        Returns:
+            ImageDecoder: The decoder
+        """
+        if cls._instance is None:
+            cls._instance = cls(parent=QGuiApplication.instance())
+        return cls._instance
+
+    @staticmethod
+    def makeKey(
+        imageId: Optional[Hashable],
+        imageData: bytes,
+        size: int,
+        square: bool = True,
+        devicePixelRatio: float = None,
+    ) -> tuple:
+        """Build the cache key of a decoded image
+
+        Args:
+            imageId (Optional[Hashable]): The id of the image, None to key it by
+                a hash of its data
+            imageData (bytes): Raw image bytes
+            size (int): The side of a square thumbnail, or the width of the image
+            square (bool, optional): Crop to a centered square. Defaults to True.
+            devicePixelRatio (float, optional): The device pixel ratio to render
+                at. Defaults to the application's.
+
+        Returns:
+            tuple: The key
+        """
+        if imageId is None:
+            imageId = hashlib.sha1(imageData or b"").hexdigest()
+        if devicePixelRatio is None:
+            devicePixelRatio = QGuiApplication.instance().devicePixelRatio()
+        return imageId, size, devicePixelRatio, square
+
+    @staticmethod
+    def _cacheKey(key: tuple) -> str:
+        return "nanoko-image:" + ":".join(map(str, key))
+
+    def cached(self, key: tuple) -> Optional[QPixmap]:
+        """Get a decoded image if it is cached
+
+        Args:
+            key (tuple): The key of the image
+
+        Returns:
+            Optional[QPixmap]: The pixmap, or None if it is not cached
+        """
+        pixmap = QPixmapCache.find(self._cacheKey(key))
+        return pixmap if pixmap is not None and not pixmap.isNull() else None
+
+    def request(
+        self,
+        imageId: Optional[Hashable],
+        imageData: bytes,
+        size: int,
+        square: bool = True,
+        devicePixelRatio: float = None,
+    ) -> Tuple[tuple, Optional[QPixmap]]:
+        """Get a decoded image, decoding it in the background when it is not cached
+
+        imageReady is emitted with the key once a missing image is decoded, or
+        imageFailed if its data cannot be decoded.
+
+        Args:
+            imageId (Optional[Hashable]): The id of the image, None to key it by
+                a hash of its data
+            imageData (bytes): Raw image bytes
+            size (int): The side of a square thumbnail, or the width of the image
+            square (bool, optional): Crop to a centered square. Defaults to True.
+            devicePixelRatio (float, optional): The device pixel ratio to render
+                at. Defaults to the application's.
+
+        Returns:
+            Tuple[tuple, Optional[QPixmap]]: The key of the image and the cached
+                pixmap, or None while it is decoding
+        """
+        key = self.makeKey(imageId, imageData, size, square, devicePixelRatio)
+
+        pixmap = self.cached(key)
+        if pixmap is not None:
+            return key, pixmap
+
+        if imageData and key not in self._pendingKeys:
+            self._pendingKeys.add(key)
+            self._executor.submit(self._decode, key, imageData)
+        return key, None
+
+    def _decode(self, key: tuple, imageData: bytes):
+        """Decode and scale an image on a background thread
+
+        Args:
+            key (tuple): The key of the image
+            imageData (bytes): Raw image bytes
+        """
+        _, size, devicePixelRatio, square = key
+        try:
+            image = QImage.fromData(imageData)
+            if not image.isNull():
+                pixels = round(size * devicePixelRatio)
+                if square:
+                    side = min(image.width(), image.height())
+                    image = image.copy(
+                        (image.width() - side) // 2,
+                        (image.height() - side) // 2,
+                        side,
+                        side,
+                    ).scaled(
+                        pixels,
+                        pixels,
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation,
+                    )
+                else:
+                    image = image.scaledToWidth(
+                        pixels, Qt.TransformationMode.SmoothTransformation
+                    )
+                image.setDevicePixelRatio(devicePixelRatio)
+        except Exception as e:
+            print(f"[ImageDecoder] Failed to decode image {key}: {e}")
+            image = QImage()
+
+        self._imageDecoded.emit(key, image)
+
+    def _onImageDecoded(self, key: tuple, image: QImage):
+        """Cache a decoded image on the GUI thread and announce it
+
+        Args:
+            key (tuple): The key of the image
+            image (QImage): The decoded image, null if decoding failed
+        """
+        self._pendingKeys.discard(key)
+        if image.isNull():
+            self.imageFailed.emit(key)
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self._cacheKey(key), pixmap)
+        self.imageReady.emit(key, pixmap)
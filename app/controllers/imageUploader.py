@@ -0,0 +1,343 @@
+import json
+import time
+import httpx
+import hashlib
+import threading
+from pathlib import Path
+from nanoko.api.bank import BankAPI
+from typing import Callable, Dict, List, Optional, Tuple
+from PyQt6.QtGui import QImage
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, Qt
+from nanoko.exceptions import (
+    NanokoAPI400BadRequestError,
+    NanokoAPI404NotFoundError,
+    NanokoAPI500InternalServerError,
+)
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from app.config import (
+    IMAGE_UPLOAD_RETRIES,
+    IMAGE_UPLOAD_MAX_BYTES,
+    IMAGE_UPLOAD_MAX_WORKERS,
+    IMAGE_UPLOAD_RETRY_DELAY,
+    IMAGE_UPLOAD_JPEG_QUALITY,
+    IMAGE_UPLOAD_MAX_DIMENSION,
+)
+from app.controllers.localStore import LocalStore
+
+
+class ImageUploader:
+    """Upload the images of new questions concurrently, each file only once
+
+    Files are identified by the SHA-256 of their content. The hash the server
+    returned for a file is remembered, in the local store when there is one,
+    so a file that was uploaded before is only registered again. Files that
+    are larger than the limits are scaled down and recompressed on the upload
+    threads, and requests failing with a network or server error are retried
+    with backoff. All methods are safe to call from the ApiWorker's pooled
+    threads.
+    """
+
+    SIGNATURES = (
+        (b"\x89PNG\r\n\x1a\n", "image/png"),
+        (b"\xff\xd8\xff", "image/jpeg"),
+        (b"GIF87a", "image/gif"),
+        (b"GIF89a", "image/gif"),
+        (b"BM", "image/bmp"),
+    )
+
+    def __init__(
+        self,
+        localStore: LocalStore = None,
+        maxWorkers: int = IMAGE_UPLOAD_MAX_WORKERS,
+        maxDimension: int = IMAGE_UPLOAD_MAX_DIMENSION,
+        maxBytes: int = IMAGE_UPLOAD_MAX_BYTES,
+        retries: int = IMAGE_UPLOAD_RETRIES,
+        retryDelay: float = IMAGE_UPLOAD_RETRY_DELAY,
+    ):
+        self.localStore = localStore
+        self.maxDimension = maxDimension
+        self.maxBytes = maxBytes
+        self.retries = retries
+        self.retryDelay = retryDelay
+
+        self._lock = threading.Lock()
+        self._serverHashes = {}  # content digest -> server hash
+        self._uploadLocks = {}  # content digest -> lock held while uploading it
+        self._executor = ThreadPoolExecutor(
+            max_workers=maxWorkers, thread_name_prefix="ImageUpload"
+        )
+
+    def upload(
+        self,
+        bank: BankAPI,
+        images: List[Tuple[str, str]],
+        onProgress: Optional[Callable[[int, int, str], None]] = None,
+    ) -> Dict[Tuple[str, str], int]:
+        """Upload image files and add them to the bank
+
+        Args:
+            bank (BankAPI): The bank API of the signed in client
+            images (List[Tuple[str, str]]): The (path, description) pairs
+            onProgress (Optional[Callable[[int, int, str], None]], optional):
+                Called with the number of finished files, the number of files
+                and the path of the file that finished. Defaults to None.
+
+        Returns:
+            Dict[Tuple[str, str], int]: The image id of each (path, description)
+        """
+        if not images:
+            return {}
+
+        paths = list(dict.fromkeys(path for path, _ in images))
+        contents = dict(zip(paths, self._executor.map(self._readFile, paths)))
+
+        files = {}  # digest -> (path, data, descriptions)
+        pathDigests = {}
+        for path, (digest, data) in contents.items():
+            pathDigests[path] = digest
+            files.setdefault(digest, (path, data, []))
+        for path, description in dict.fromkeys(images):
+            descriptions = files[pathDigests[path]][2]
+            if description not in descriptions:
+                descriptions.append(description)
+
+        total = len(files)
+        finished = 0
+        if onProgress is not None:
+            onProgress(0, total, "")
+
+        imageIds = {}  # (digest, description) -> image id
+        remaining = {digest: len(file[2]) for digest, file in files.items()}
+        pending = {}  # future -> (digest, description), None for an upload
+
+        def register(digest: str, serverHash: str, uploaded: bool):
+            data = files[digest][1]
+            for description in files[digest][2]:
+                future = self._executor.submit(
+                    self._addImage,
+                    bank,
+                    digest,
+                    data,
+                    serverHash,
+                    uploaded,
+                    description,
+                )
+                pending[future] = (digest, description)
+
+        for digest, (path, data, _) in files.items():
+            serverHash = self._knownServerHash(digest)
+            if serverHash is None:
+                future = self._executor.submit(self._uploadContent, bank, digest, data)
+                pending[future] = (digest, None)
+            else:
+                register(digest, serverHash, False)
+
+        # a file is added to the bank as soon as its upload finished
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    digest, description = pending.pop(future)
+                    if description is None:
+                        register(digest, future.result(), True)
+                        continue
+
+                    imageIds[(digest, description)] = future.result()
+                    remaining[digest] -= 1
+                    if remaining[digest] == 0:
+                        finished += 1
+                        if onProgress is not None:
+                            onProgress(finished, total, files[digest][0])
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+        return {
+            (path, description): imageIds[(pathDigests[path], description)]
+            for path, description in images
+        }
+
+    def _readFile(self, path: str) -> Tuple[str, bytes]:
+        """Read a file and hash its content"""
+        data = Path(path).read_bytes()
+        return hashlib.sha256(data).hexdigest(), data
+
+    def _addImage(
+        self,
+        bank: BankAPI,
+        digest: str,
+        data: bytes,
+        serverHash: str,
+        uploaded: bool,
+        description: str,
+    ) -> int:
+        """Add an uploaded file to the bank, uploading it again if it is gone
+
+        Returns:
+            int: The id of the image
+        """
+        try:
+            return self._postImage(bank, serverHash, description)
+        except (NanokoAPI400BadRequestError, NanokoAPI404NotFoundError):
+            if uploaded:
+                raise
+
+        # the server no longer has the file uploaded in an earlier session
+        print(f"[ImageUploader] Uploading {digest[:12]} again")
+        self._forgetServerHash(digest)
+        serverHash = self._uploadContent(bank, digest, data)
+        return self._postImage(bank, serverHash, description)
+
+    def _uploadContent(self, bank: BankAPI, digest: str, data: bytes) -> str:
+        """Shrink a file if it is too large and upload it
+
+        Returns:
+            str: The hash of the file on the server
+        """
+        with self._lock:
+            uploadLock = self._uploadLocks.setdefault(digest, threading.Lock())
+
+        with uploadLock:
+            try:
+                # concurrent uploads, e.g. of a bulk import, may share the file
+                serverHash = self._knownServerHash(digest)
+                if serverHash is not None:
+                    return serverHash
+
+                data, contentType = self._prepare(data)
+                serverHash = self._withRetries(
+                    "upload_image", bank.upload_image, data, contentType
+                )
+                self._rememberServerHash(digest, serverHash)
+                return serverHash
+            finally:
+                # later uploads of the file find its hash, or create a new lock
+                with self._lock:
+                    if self._uploadLocks.get(digest) is uploadLock:
+                        del self._uploadLocks[digest]
+
+    def _postImage(self, bank: BankAPI, serverHash: str, description: str) -> int:
+        return self._withRetries("add_image", bank.add_image, description, serverHash)
+
+    def _prepare(self, data: bytes) -> Tuple[bytes, str]:
+        """Scale down and recompress an image that exceeds the limits
+
+        Args:
+            data (bytes): The content of the file
+
+        Returns:
+            Tuple[bytes, str]: The content to upload and its content type
+        """
+        contentType = self.contentType(data)
+        image = QImage()
+        if not image.loadFromData(data):
+            return data, contentType
+
+        tooLarge = max(image.width(), image.height()) > self.maxDimension
+        if not tooLarge and len(data) <= self.maxBytes:
+            return data, contentType
+
+        if tooLarge:
+            image = image.scaled(
+                self.maxDimension,
+                self.maxDimension,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+
+        # PNGs such as diagrams stay PNGs unless they are still too large,
+        # photos and other formats become JPEGs unless they are transparent
+        imageFormat = "PNG"
+        if contentType != "image/png" and not image.hasAlphaChannel():
+            imageFormat = "JPEG"
+        compressed = self._encode(image, imageFormat)
+        if (
+            compressed is not None
+            and imageFormat == "PNG"
+            and len(compressed) > self.maxBytes
+            and not image.hasAlphaChannel()
+        ):
+            imageFormat = "JPEG"
+            compressed = self._encode(image, imageFormat)
+
+        if compressed is None or (not tooLarge and len(compressed) >= len(data)):
+            return data, contentType
+        return compressed, f"image/{imageFormat.lower()}"
+
+    def _encode(self, image: QImage, imageFormat: str) -> Optional[bytes]:
+        """Encode an image, None if the format is not supported"""
+        encoded = QByteArray()
+        buffer = QBuffer(encoded)
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        if not image.save(buffer, imageFormat, IMAGE_UPLOAD_JPEG_QUALITY):
+            return None
+        buffer.close()
+        return bytes(encoded)
+
+    @classmethod
+    def contentType(cls, data: bytes) -> str:
+        """Detect the content type of an image from its first bytes
+
+        Args:
+            data (bytes): The content of the file
+
+        Returns:
+            str: The content type, "image/png" if it is not recognized
+        """
+        for signature, contentType in cls.SIGNATURES:
+            if data.startswith(signature):
+                return contentType
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            return "image/webp"
+        return "image/png"
+
+    def _withRetries(self, name: str, call: Callable, *args):
+        """Call the bank API, retrying network and server errors
+
+        Gateway errors the SDK doesn't map to an exception surface as a body
+        that is not JSON, so they are retried too.
+
+        Args:
+            name (str): The name of the call, for logging
+            call (Callable): The bank API method
+            *args: The arguments of the call
+
+        Returns:
+            The result of the call
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                return call(*args)
+            except (
+                httpx.TransportError,
+                NanokoAPI500InternalServerError,
+                json.JSONDecodeError,
+            ) as e:
+                if attempt == self.retries:
+                    raise
+                error = str(e) or type(e).__name__
+
+            delay = self.retryDelay * 2**attempt
+            print(f"[ImageUploader] Retrying {name} in {delay:.1f}s: {error}")
+            time.sleep(delay)
+
+    def _knownServerHash(self, digest: str) -> Optional[str]:
+        with self._lock:
+            serverHash = self._serverHashes.get(digest)
+        if serverHash is None and self.localStore is not None:
+            serverHash = self.localStore.loadImageHash(digest)
+        return serverHash
+
+    def _rememberServerHash(self, digest: str, serverHash: str):
+        with self._lock:
+            self._serverHashes[digest] = serverHash
+        if self.localStore is not None:
+            self.localStore.saveImageHash(digest, serverHash)
+
+    def _forgetServerHash(self, digest: str):
+        with self._lock:
+            self._serverHashes.pop(digest, None)
+        if self.localStore is not None:
+            self.localStore.deleteImageHash(digest)
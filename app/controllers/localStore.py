@@ -0,0 +1,305 @@
+import os
+import time
+import pickle
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+from PyQt6.QtCore import QStandardPaths
+
+from app.utils import serverKey
+from app.config import NANOKO_BASE_URL
+
+
+class LocalStore:
+    """Persistent SQLite store of a user's data and pending writes
+
+    Responses of the offline-first read operations are kept per user, so the
+    views can render the last known data right after sign in, even when the
+    backend is slow or unreachable. Writes go into a durable outbox first and
+    stay there until the backend accepts them, surviving app restarts. Each
+    server gets its own database, so users with the same id on different
+    servers never share responses or writes. All methods are safe to call
+    from the ApiWorker's pooled threads.
+    """
+
+    def __init__(self, path: str = None, baseUrl: str = NANOKO_BASE_URL):
+        self.path = path or self._defaultPath(baseUrl)
+        self.userId = None
+
+        self._lock = threading.Lock()
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        except (OSError, sqlite3.Error) as e:
+            print(f"[LocalStore] Falling back to memory: {e}")
+            self._connection = sqlite3.connect(":memory:", check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "user_id INTEGER, key TEXT, operation TEXT, saved_at REAL, "
+                "emissions BLOB, PRIMARY KEY (user_id, key))"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS outbox ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER, "
+                "operation TEXT, params BLOB, attempts INTEGER DEFAULT 0, "
+                "next_attempt REAL, created_at REAL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS image_hashes ("
+                "digest TEXT PRIMARY KEY, server_hash TEXT)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS imported_questions ("
+                "user_id INTEGER, entry_key TEXT, question_id INTEGER, "
+                "imported_at REAL, PRIMARY KEY (user_id, entry_key))"
+            )
+
+    @staticmethod
+    def _defaultPath(baseUrl: str) -> str:
+        """Get the default path of the database of a server
+
+        Args:
+            baseUrl (str): The base URL of the server
+
+        Returns:
+            str: The database path
+        """
+        location = QStandardPaths.writableLocation(
+            QStandardPaths.StandardLocation.AppDataLocation
+        )
+        if not location:
+            location = os.path.join(
+                os.path.expanduser("~"), ".local", "share", "nanoko"
+            )
+        return os.path.join(location, f"nanoko-{serverKey(baseUrl)}.db")
+
+    def setUser(self, userId: Optional[int]):
+        """Select the user whose data is read and written
+
+        Args:
+            userId (Optional[int]): The id of the signed in user, None when signed out
+        """
+        self.userId = userId
+
+    def loadSetting(self, key: str) -> Optional[str]:
+        """Load a setting shared by every user of this machine
+
+        Args:
+            key (str): The name of the setting
+
+        Returns:
+            Optional[str]: The value, or None if it was never saved
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM settings WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def saveSetting(self, key: str, value: str):
+        """Save a setting shared by every user of this machine
+
+        Args:
+            key (str): The name of the setting
+            value (str): The value
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO settings VALUES (?, ?)", (key, value)
+            )
+
+    def loadImageHash(self, digest: str) -> Optional[str]:
+        """Load the server hash of an uploaded image file
+
+        Args:
+            digest (str): The SHA-256 of the file
+
+        Returns:
+            Optional[str]: The hash the server returned, or None if the file was
+                never uploaded
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT server_hash FROM image_hashes WHERE digest = ?", (digest,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def saveImageHash(self, digest: str, serverHash: str):
+        """Remember the server hash of an uploaded image file
+
+        Args:
+            digest (str): The SHA-256 of the file
+            serverHash (str): The hash the server returned
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO image_hashes VALUES (?, ?)",
+                (digest, serverHash),
+            )
+
+    def deleteImageHash(self, digest: str):
+        """Forget the server hash of an image file the server no longer has
+
+        Args:
+            digest (str): The SHA-256 of the file
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM image_hashes WHERE digest = ?", (digest,)
+            )
+
+    def loadImportedQuestions(self) -> Dict[str, int]:
+        """Load the questions the current user already created by bulk import
+
+        Returns:
+            Dict[str, int]: The id of the created question by manifest entry key
+        """
+        if self.userId is None:
+            return {}
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT entry_key, question_id FROM imported_questions WHERE user_id = ?",
+                (self.userId,),
+            ).fetchall()
+        return dict(rows)
+
+    def saveImportedQuestion(self, entryKey: str, questionId: int):
+        """Remember that a manifest entry was created, so a resumed import skips it
+
+        Args:
+            entryKey (str): The key of the manifest entry
+            questionId (int): The id of the created question
+        """
+        if self.userId is None:
+            return
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO imported_questions VALUES (?, ?, ?, ?)",
+                (self.userId, entryKey, questionId, time.time()),
+            )
+
+    def loadResponse(self, key: str) -> Optional[Tuple[list, float]]:
+        """Load the stored emissions of a request
+
+        Args:
+            key (str): The response cache key of the request
+
+        Returns:
+            Optional[Tuple[list, float]]: The emissions and the time they were
+                saved, or None if nothing is stored
+        """
+        if self.userId is None:
+            return None
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT emissions, saved_at FROM responses WHERE user_id = ? AND key = ?",
+                (self.userId, key),
+            ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            return pickle.loads(row[0]), row[1]
+        except Exception as e:
+            print(f"[LocalStore] Dropping unreadable response {key}: {e}")
+            return None
+
+    def saveResponse(self, key: str, operation: str, emissions: list):
+        """Store the emissions of a request, replacing older ones
+
+        Args:
+            key (str): The response cache key of the request
+            operation (str): The operation
+            emissions (list): The (signal name, args) pairs emitted by the request
+        """
+        if self.userId is None:
+            return
+
+        data = pickle.dumps(emissions)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (self.userId, key, operation, time.time(), data),
+            )
+
+    def enqueue(self, operation: str, params: dict) -> int:
+        """Add a write to the outbox
+
+        Args:
+            operation (str): The write operation
+            params (dict): The parameters of the operation
+
+        Returns:
+            int: The id of the outbox entry
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO outbox (user_id, operation, params, next_attempt, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.userId, operation, pickle.dumps(params), now, now),
+            )
+            return cursor.lastrowid
+
+    def dueOutbox(self) -> List[Tuple[int, str, dict, int]]:
+        """Get the writes of the current user that are due to be sent
+
+        Returns:
+            List[Tuple[int, str, dict, int]]: The id, operation, parameters and
+                number of failed attempts of each write, oldest first
+        """
+        if self.userId is None:
+            return []
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, operation, params, attempts FROM outbox "
+                "WHERE user_id = ? AND next_attempt <= ? ORDER BY id",
+                (self.userId, time.time()),
+            ).fetchall()
+        return [
+            (outboxId, operation, pickle.loads(params), attempts)
+            for outboxId, operation, params, attempts in rows
+        ]
+
+    def outboxSize(self) -> int:
+        """Count the writes of the current user that have not been sent yet
+
+        Returns:
+            int: The number of pending writes
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM outbox WHERE user_id = ?", (self.userId,)
+            ).fetchone()[0]
+
+    def postpone(self, outboxId: int, delay: float):
+        """Record a failed attempt and schedule the next one
+
+        Args:
+            outboxId (int): The id of the outbox entry
+            delay (float): Seconds until the next attempt
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE outbox SET attempts = attempts + 1, next_attempt = ? WHERE id = ?",
+                (time.time() + delay, outboxId),
+            )
+
+    def remove(self, outboxId: int):
+        """Remove a write from the outbox once it was accepted or rejected
+
+        Args:
+            outboxId (int): The id of the outbox entry
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM outbox WHERE id = ?", (outboxId,))
@@ -1,21 +1,36 @@
+import importlib
 from nanoko import Nanoko
-from PyQt6.QtCore import Qt
 from nanoko.models.user import User
 from PyQt6.QtWidgets import QApplication
 from qfluentwidgets import InfoBar, InfoBarPosition
-
-from app.config import NANOKO_BASE_URL
+from PyQt6.QtCore import Qt, QTimer, QElapsedTimer
+
+from app.config import (
+    NANOKO_BASE_URL,
+    WARM_UP_CONNECTIONS,
+    WARM_UP_INTERVAL_MS,
+    ROLE_WINDOW_MODULES,
+    SIGNIN_PREFETCH_OPERATIONS,
+)
 from app.controllers.apiWorker import ApiWorker
+from app.controllers.localStore import LocalStore
+from app.controllers.responseCache import ResponseCache
 from app.views.signinDialog import SignInDialog
 from app.views.signupDialog import SignUpDialog
-from app.views.studentMainWindow import StudentMainWindow
-from app.views.teacherMainWindow import TeacherMainWindow
 from app.controllers.studentController import StudentController
 from app.controllers.teacherController import TeacherController
 
 
 class MainController:
-    """Main controller for the application"""
+    """Main controller for the application
+
+    The student and teacher windows are imported when a user of that role signs
+    in, so neither of them, nor matplotlib, slows down showing the sign-in dialog.
+    Once the dialog is painted, the server connections are opened and the window
+    of the role that signed in last is imported on the next idle moment.
+    """
+
+    LAST_ROLE_SETTING = "last_role"
 
     def __init__(self):
         self.nanokoClient = Nanoko(base_url=NANOKO_BASE_URL)
@@ -23,13 +38,22 @@ class MainController:
         self.signinDialog = None
         self.signupDialog = None
         self.mainWindow = None
-        self.apiWorker = ApiWorker(self.nanokoClient)
+        self.localStore = LocalStore(baseUrl=NANOKO_BASE_URL)
+        self.apiWorker = ApiWorker(
+            self.nanokoClient, responseCache=ResponseCache(), localStore=self.localStore
+        )
         self.studentController = StudentController(self.apiWorker)
         self.teacherController = TeacherController(self.apiWorker)
 
         self.apiWorker.signInFinished.connect(self.handleSigninFinished)
         self.apiWorker.signUpFinished.connect(self.handleSignupFinished)
 
+        self.expectedRole = self.localStore.loadSetting(self.LAST_ROLE_SETTING)
+        if self.expectedRole not in ROLE_WINDOW_MODULES:
+            self.expectedRole = "student"
+        self._lastWarmUp = QElapsedTimer()
+        self._windowModuleImported = False
+
     def start(self):
         """Start the application by showing the sign-in dialog"""
         self.showSigninDialog()
@@ -45,6 +69,28 @@ class MainController:
 
         self.signinDialog.signinRequested.connect(self.handleSignin)
         self.signinDialog.signupRequested.connect(self.showSignupDialog)
+        self.signinDialog.warmUpRequested.connect(self.warmUp)
+
+    def warmUp(self):
+        """Prepare for signing in while the sign-in dialog is idle"""
+        if self._lastWarmUp.isValid() and (
+            self._lastWarmUp.elapsed() < WARM_UP_INTERVAL_MS
+        ):
+            return
+        self._lastWarmUp.start()
+
+        self.apiWorker.submit("warm_up", connections=WARM_UP_CONNECTIONS)
+
+        if not self._windowModuleImported:
+            self._windowModuleImported = True
+            # on the GUI thread once the dialog is idle, importing Qt widget
+            # modules on a pool thread could block showMainWindow on the
+            # import lock and race the interpreter shutdown
+            QTimer.singleShot(0, self._importExpectedWindow)
+
+    def _importExpectedWindow(self):
+        """Import the main window module of the role expected to sign in"""
+        importlib.import_module(ROLE_WINDOW_MODULES[self.expectedRole])
 
     def showSignupDialog(self):
         """Show the sign-up dialog"""
@@ -68,16 +114,26 @@ class MainController:
             self.signupDialog = None
 
         role = user.permission.name.lower().replace("admin", "student")
+        if role != self.expectedRole:
+            self.expectedRole = role
+            self.localStore.saveSetting(self.LAST_ROLE_SETTING, role)
+
         if role == "student":
+            from app.views.studentMainWindow import StudentMainWindow
+
             self.mainWindow = StudentMainWindow(self.studentController)
             self.mainWindow.requestNewWindow.connect(self._createNewStudentWindow)
         elif role == "teacher":
+            from app.views.teacherMainWindow import TeacherMainWindow
+
             self.mainWindow = TeacherMainWindow(self.teacherController)
 
         self.mainWindow.show()
 
     def _createNewStudentWindow(self):
         """Create a new student window and close the current one"""
+        from app.views.studentMainWindow import StudentMainWindow
+
         if not self.mainWindow or not isinstance(self.mainWindow, StudentMainWindow):
             return
 
@@ -130,12 +186,12 @@ class MainController:
     def handleSignin(self, username, password, remember):
         """Handle sign-in request"""
 
-        self.apiWorker.setup(
+        self.apiWorker.submit(
             operation="signin",
             username=username,
             password=password,
+            prefetch=SIGNIN_PREFETCH_OPERATIONS[self.expectedRole],
         )
-        self.apiWorker.run()
 
     def handleSigninFinished(self, success, message, user):
         """Handle sign-in finished"""
@@ -147,7 +203,7 @@ class MainController:
     def handleSignup(self, username, firstName, lastName, email, role, password):
         """Handle sign-up request"""
 
-        self.apiWorker.setup(
+        self.apiWorker.submit(
             operation="signup",
             username=username,
             firstName=firstName,
@@ -156,7 +212,6 @@ class MainController:
             role=role,
             password=password,
         )
-        self.apiWorker.run()
 
     def handleSignupFinished(self, success, message):
         """Handle sign-up finished"""
@@ -0,0 +1,57 @@
+import time
+import threading
+from typing import Any, Optional
+
+from app.config import PERFORMANCE_CACHE_TTL
+
+
+class PerformanceCache:
+    """Short-lived cache of per-student performance series
+
+    Series are keyed by student id and the number of days they cover, so a
+    dashboard refresh only refetches the students whose series expired. All
+    methods are safe to call from the ApiWorker's pooled threads.
+    """
+
+    def __init__(self, ttl: float = PERFORMANCE_CACHE_TTL):
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._entries = {}  # (user_id, days) -> (timestamp, data)
+
+    def get(self, user_id: int, days: int) -> Optional[Any]:
+        """Get the cached series of a student
+
+        Args:
+            user_id (int): The id of the student
+            days (int): The number of days covered by the series
+
+        Returns:
+            Optional[Any]: The series, or None if it is missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get((user_id, days))
+            if entry is None:
+                return None
+
+            timestamp, data = entry
+            if time.monotonic() - timestamp > self.ttl:
+                del self._entries[(user_id, days)]
+                return None
+            return data
+
+    def put(self, user_id: int, days: int, data: Any):
+        """Store the series of a student
+
+        Args:
+            user_id (int): The id of the student
+            days (int): The number of days covered by the series
+            data (Any): The series
+        """
+        with self._lock:
+            self._entries[(user_id, days)] = (time.monotonic(), data)
+
+    def clear(self):
+        """Drop every cached series"""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,84 @@
+from typing import Callable, Optional
+from PyQt6.QtCore import QObject, QTimer
+
+from app.config import QUERY_DEBOUNCE_MS
+from app.controllers.apiWorker import ApiRequest
+
+
+class QueryPipeline(QObject):
+    """Debounce an interactive query and keep only its latest result
+
+    Every started query gets a new generation number. Starting a query
+    cancels the previous request if it has not started yet, and results
+    carrying an older generation are dropped, so a slow response for a stale
+    query can never replace a fresher one.
+    """
+
+    def __init__(
+        self,
+        start: Callable[[int, tuple], Optional[ApiRequest]],
+        delay: int = QUERY_DEBOUNCE_MS,
+        parent=None,
+    ):
+        """Create a query pipeline
+
+        Args:
+            start (Callable[[int, tuple], Optional[ApiRequest]]): Starts a query
+                with its generation and returns its request, if any
+            delay (int, optional): Debounce delay in milliseconds. Defaults to
+                QUERY_DEBOUNCE_MS.
+            parent (QObject, optional): The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.start = start
+        self.generation = 0
+
+        self._query = None
+        self._request = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._startPending)
+
+    def submit(self, query: tuple, debounce: bool = False):
+        """Submit a query, replacing any query that has not started yet
+
+        Args:
+            query (tuple): The query
+            debounce (bool, optional): Wait for the input to settle before
+                starting. Defaults to False.
+        """
+        self._query = query
+        if debounce:
+            self._timer.start()
+        else:
+            self._timer.stop()
+            self._startPending()
+
+    def track(self, request: Optional[ApiRequest]):
+        """Remember the request of the current generation so it can be cancelled
+
+        Args:
+            request (Optional[ApiRequest]): The request
+        """
+        self._request = request
+
+    def isCurrent(self, generation: int) -> bool:
+        """Check whether a result belongs to the latest query
+
+        Args:
+            generation (int): The generation of the result
+
+        Returns:
+            bool: Whether the result should be shown
+        """
+        return generation == self.generation and not self._timer.isActive()
+
+    def _startPending(self):
+        """Start the pending query as a new generation"""
+        if self._request is not None:
+            self._request.cancel()
+            self._request = None
+
+        self.generation += 1
+        self.track(self.start(self.generation, self._query))
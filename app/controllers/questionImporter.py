@@ -0,0 +1,515 @@
+import os
+import csv
+import json
+import time
+import hashlib
+import threading
+from nanoko.api.bank import BankAPI
+from PyQt6.QtGui import QImageReader
+from typing import Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from nanoko.models.question import ConceptType, ProcessType, Question, SubQuestion
+
+from app.config import QUESTION_IMPORT_MAX_WORKERS, QUESTION_IMPORT_MANIFEST_NAMES
+from app.utils import enumNameToText, textToEnumName
+from app.controllers.localStore import LocalStore
+from app.controllers.imageUploader import ImageUploader
+
+
+class ManifestError(ValueError):
+    """A manifest that can't be imported, listing every problem found in it"""
+
+    MAX_SHOWN_PROBLEMS = 5
+
+    def __init__(self, path: str, problems: List[str]):
+        self.path = path
+        self.problems = problems
+
+        shown = problems[: self.MAX_SHOWN_PROBLEMS]
+        message = f"{os.path.basename(path) or path}: " + "; ".join(shown)
+        if len(problems) > len(shown):
+            message += f"; and {len(problems) - len(shown)} more problems"
+        super().__init__(message)
+
+
+class QuestionImporter:
+    """Create the questions of a manifest in bulk
+
+    A manifest is a JSON or CSV file, or a folder holding one of
+    QUESTION_IMPORT_MANIFEST_NAMES. Image paths are relative to the manifest.
+    The whole manifest is validated locally before anything is sent. The
+    questions are then created QUESTION_IMPORT_MAX_WORKERS at a time, each
+    uploading its images through the shared ImageUploader first, so the
+    uploads of some questions overlap the creation of others. Created
+    entries are remembered in the local store, so importing the manifest
+    again resumes after an interrupted, cancelled or partly failed import.
+
+    A JSON manifest is a list of questions, or an object with a "questions"
+    list and a default "source"::
+
+        {"source": "NCEA", "questions": [{"name": "Fencing", "sub_questions": [
+            {"description": "...", "answer": "...", "concept": "Measurement",
+             "process": "Apply", "keywords": ["perimeter"], "options": null,
+             "image": "images/field.png", "image_description": "A field"}]}]}
+
+    A CSV manifest has one row per sub-question and the columns name, source,
+    description, answer, concept, process, keywords (comma-separated),
+    options (separated by "|"), image and image_description. Rows with the
+    same name form one question.
+    """
+
+    CSV_COLUMNS = (
+        "name",
+        "source",
+        "description",
+        "answer",
+        "concept",
+        "process",
+        "keywords",
+        "options",
+        "image",
+        "image_description",
+    )
+    DEFAULT_SOURCE = "Other"
+
+    def __init__(
+        self,
+        imageUploader: ImageUploader,
+        localStore: LocalStore = None,
+        maxWorkers: int = QUESTION_IMPORT_MAX_WORKERS,
+    ):
+        self.imageUploader = imageUploader
+        self.localStore = localStore
+        self.maxWorkers = maxWorkers
+
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Stop after the questions that are being created, the rest stay pending"""
+        self._cancelled.set()
+
+    def load(self, path: str) -> List[dict]:
+        """Read and validate a manifest
+
+        Args:
+            path (str): The manifest file, or a folder holding one
+
+        Raises:
+            ManifestError: If the manifest can't be read or has invalid entries
+
+        Returns:
+            List[dict]: The questions, with their sub-questions' concepts and
+                processes as enums and their image paths absolute
+        """
+        manifestPath = self._findManifest(path)
+        baseDir = os.path.dirname(manifestPath)
+        try:
+            if manifestPath.lower().endswith(".csv"):
+                entries, defaultSource = self._readCsv(manifestPath)
+            else:
+                entries, defaultSource = self._readJson(manifestPath)
+        except (OSError, ValueError, csv.Error) as e:
+            raise ManifestError(manifestPath, [f"can't be read: {e}"]) from e
+
+        questions = []
+        problems = []
+        imageProblems = {}  # path -> problem, each file is checked once
+        for index, entry in enumerate(entries, 1):
+            question = self._validateQuestion(
+                entry,
+                f"question {index}",
+                baseDir,
+                defaultSource,
+                problems,
+                imageProblems,
+            )
+            if question is not None:
+                questions.append(question)
+
+        if not entries:
+            problems.append("has no questions")
+        if problems:
+            raise ManifestError(manifestPath, problems)
+        return questions
+
+    def _findManifest(self, path: str) -> str:
+        """Get the manifest file of a path that may be a folder"""
+        if not os.path.isdir(path):
+            if not os.path.isfile(path):
+                raise ManifestError(path, ["file not found"])
+            return path
+
+        for name in QUESTION_IMPORT_MANIFEST_NAMES:
+            manifestPath = os.path.join(path, name)
+            if os.path.isfile(manifestPath):
+                return manifestPath
+        raise ManifestError(
+            path, [f"folder has none of {', '.join(QUESTION_IMPORT_MANIFEST_NAMES)}"]
+        )
+
+    def _readJson(self, path: str) -> Tuple[list, str]:
+        """Read the question entries and default source of a JSON manifest"""
+        with open(path, encoding="utf-8-sig") as file:
+            data = json.load(file)
+
+        if isinstance(data, list):
+            return data, ""
+        if isinstance(data, dict) and isinstance(data.get("questions"), list):
+            return data["questions"], self._text(data.get("source"))
+        raise ValueError('expected a list of questions or an object with "questions"')
+
+    def _readCsv(self, path: str) -> Tuple[list, str]:
+        """Read the question entries of a CSV manifest, one row per sub-question"""
+        with open(path, newline="", encoding="utf-8-sig") as file:
+            reader = csv.DictReader(file)
+            columns = [column.strip().lower() for column in reader.fieldnames or []]
+            missing = [
+                column
+                for column in ("name", "description", "concept", "process")
+                if column not in columns
+            ]
+            if missing:
+                raise ValueError(f"missing columns {', '.join(missing)}")
+            unknown = [column for column in columns if column not in self.CSV_COLUMNS]
+            if unknown:
+                raise ValueError(f"unknown columns {', '.join(unknown)}")
+
+            entries = {}  # name -> entry, in the order of the first row
+            for values in reader:
+                row = {
+                    column.strip().lower(): value
+                    for column, value in values.items()
+                    if column is not None
+                }
+                name = self._text(row.get("name"))
+                entry = entries.setdefault(
+                    name,
+                    {"name": name, "source": row.get("source"), "sub_questions": []},
+                )
+                entry["sub_questions"].append(
+                    {
+                        column: row.get(column)
+                        for column in self.CSV_COLUMNS
+                        if column not in ("name", "source")
+                    }
+                )
+        return list(entries.values()), ""
+
+    def _validateQuestion(
+        self,
+        entry,
+        location: str,
+        baseDir: str,
+        defaultSource: str,
+        problems: List[str],
+        imageProblems: Dict[str, Optional[str]],
+    ) -> Optional[dict]:
+        """Validate a question entry, adding what is wrong with it to problems
+
+        Returns:
+            Optional[dict]: The question, or None if it is invalid
+        """
+        if not isinstance(entry, dict):
+            problems.append(f"{location}: expected an object")
+            return None
+
+        name = self._text(entry.get("name"))
+        if name:
+            location = f'{location} "{name}"'
+        else:
+            problems.append(f"{location}: name is required")
+
+        subEntries = entry.get("sub_questions")
+        if not isinstance(subEntries, list) or not subEntries:
+            problems.append(f"{location}: at least one sub-question is required")
+            return None
+
+        problemCount = len(problems)
+        subQuestions = [
+            self._validateSubQuestion(
+                subEntry,
+                f"{location}, sub-question {index}",
+                baseDir,
+                problems,
+                imageProblems,
+            )
+            for index, subEntry in enumerate(subEntries, 1)
+        ]
+        if not name or len(problems) > problemCount:
+            return None
+
+        source = self._text(entry.get("source")) or defaultSource or self.DEFAULT_SOURCE
+        # the key identifies the entry across imports, wherever the folder moved to
+        key = hashlib.sha256(
+            json.dumps(
+                {
+                    "name": name,
+                    "source": source,
+                    "sub_questions": [
+                        {
+                            **subQuestion,
+                            "concept": subQuestion["concept"].name,
+                            "process": subQuestion["process"].name,
+                        }
+                        for subQuestion in subQuestions
+                    ],
+                },
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+
+        for subQuestion in subQuestions:
+            image = subQuestion.pop("image")
+            subQuestion["image_path"] = (
+                os.path.normpath(os.path.join(baseDir, image)) if image else None
+            )
+        return {
+            "key": key,
+            "name": name,
+            "source": source,
+            "sub_questions": subQuestions,
+        }
+
+    def _validateSubQuestion(
+        self,
+        entry,
+        location: str,
+        baseDir: str,
+        problems: List[str],
+        imageProblems: Dict[str, Optional[str]],
+    ) -> Optional[dict]:
+        """Validate a sub-question entry, adding what is wrong with it to problems
+
+        Returns:
+            Optional[dict]: The sub-question, or None if it is invalid
+        """
+        if not isinstance(entry, dict):
+            problems.append(f"{location}: expected an object")
+            return None
+
+        description = self._text(entry.get("description"))
+        if not description:
+            problems.append(f"{location}: description is required")
+
+        concept = self._enum(ConceptType, entry.get("concept"))
+        if concept is None:
+            problems.append(
+                f"{location}: unknown concept {entry.get('concept')!r}, expected one "
+                f"of {', '.join(enumNameToText(item.name) for item in ConceptType)}"
+            )
+        process = self._enum(ProcessType, entry.get("process"))
+        if process is None:
+            problems.append(
+                f"{location}: unknown process {entry.get('process')!r}, expected one "
+                f"of {', '.join(enumNameToText(item.name) for item in ProcessType)}"
+            )
+
+        keywords = self._list(entry.get("keywords"), ",")
+        options = self._list(entry.get("options"), "|")
+        for field, value in (("keywords", keywords), ("options", options)):
+            if value is False:
+                problems.append(f"{location}: {field} must be a list or text")
+
+        image = self._text(entry.get("image") or entry.get("image_path"))
+        if image:
+            imagePath = os.path.normpath(os.path.join(baseDir, image))
+            if imagePath not in imageProblems:
+                imageProblems[imagePath] = self._imageProblem(imagePath)
+            if imageProblems[imagePath] is not None:
+                problems.append(f"{location}: {imageProblems[imagePath]} {image}")
+
+        return {
+            "description": description,
+            "answer": self._text(entry.get("answer")),
+            "concept": concept,
+            "process": process,
+            "keywords": keywords,
+            "options": options,
+            "image": image or None,
+            "image_description": self._text(entry.get("image_description")),
+        }
+
+    @staticmethod
+    def _imageProblem(path: str) -> Optional[str]:
+        """Check that an image file exists and can be decoded from its header"""
+        if not os.path.isfile(path):
+            return "image not found:"
+        if not QImageReader(path).canRead():
+            return "not a supported image:"
+        return None
+
+    @staticmethod
+    def _text(value) -> str:
+        """Convert a manifest value to stripped text, "" for a missing value"""
+        if value is None:
+            return ""
+        return str(value).strip()
+
+    @staticmethod
+    def _enum(enumType, value):
+        """Parse a concept or process given by its name, its text or its value
+
+        Returns:
+            Optional[Enum]: The member, or None if the value matches none
+        """
+        if isinstance(value, int) and not isinstance(value, bool):
+            return enumType._value2member_map_.get(value)
+        if not isinstance(value, str):
+            return None
+
+        name = textToEnumName(" ".join(value.replace("_", " ").split()))
+        return enumType.__members__.get(name)
+
+    @staticmethod
+    def _list(value, separator: str):
+        """Parse keywords or options given as a list or as separated text
+
+        Returns:
+            Optional[List[str]]: The items, None for no items, or False if the
+                value is neither a list nor text
+        """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = value.split(separator)
+        elif not isinstance(value, list):
+            return False
+
+        items = [str(item).strip() for item in value if str(item).strip()]
+        return items or None
+
+    def run(
+        self,
+        bank: BankAPI,
+        questions: List[dict],
+        onProgress: Optional[Callable[[int, int, str], None]] = None,
+    ) -> dict:
+        """Create the questions that were not imported before
+
+        Args:
+            bank (BankAPI): The bank API of the signed in client
+            questions (List[dict]): The questions returned by load()
+            onProgress (Optional[Callable[[int, int, str], None]], optional):
+                Called with the number of finished questions, the number of
+                questions and the name of the question that finished.
+                Defaults to None.
+
+        Returns:
+            dict: The counts of imported, skipped, failed and cancelled
+                questions, the failures and the throughput achieved
+        """
+        started = time.perf_counter()
+        importedKeys = (
+            self.localStore.loadImportedQuestions()
+            if self.localStore is not None
+            else {}
+        )
+        pending = [
+            question for question in questions if question["key"] not in importedKeys
+        ]
+
+        total = len(questions)
+        finished = total - len(pending)
+        if onProgress is not None:
+            onProgress(finished, total, "")
+
+        imported = 0
+        subQuestions = 0
+        images = 0
+        failed = []  # (name, error)
+        cancelled = 0
+        with ThreadPoolExecutor(
+            max_workers=self.maxWorkers, thread_name_prefix="QuestionImport"
+        ) as executor:
+            futures = {
+                executor.submit(self._importQuestion, bank, question): question
+                for question in pending
+            }
+            for future in as_completed(futures):
+                question = futures[future]
+                try:
+                    imageCount = future.result()
+                except Exception as e:
+                    print(
+                        f"[QuestionImporter] Failed to import {question['name']}: {e}"
+                    )
+                    failed.append((question["name"], str(e)))
+                else:
+                    if imageCount is None:
+                        cancelled += 1
+                        continue
+                    imported += 1
+                    subQuestions += len(question["sub_questions"])
+                    images += imageCount
+
+                finished += 1
+                if onProgress is not None:
+                    onProgress(finished, total, question["name"])
+
+        elapsed = time.perf_counter() - started
+        report = {
+            "total": total,
+            "imported": imported,
+            "skipped": total - len(pending),
+            "failed": failed,
+            "cancelled": cancelled,
+            "sub_questions": subQuestions,
+            "images": images,
+            "elapsed": elapsed,
+            "questions_per_second": imported / elapsed if elapsed > 0 else 0.0,
+            "sub_questions_per_second": subQuestions / elapsed if elapsed > 0 else 0.0,
+        }
+        print(
+            f"[QuestionImporter] Imported {imported} of {total} questions "
+            f"({subQuestions} sub-questions, {images} images) in {elapsed:.1f}s, "
+            f"{report['questions_per_second']:.2f} questions/s, "
+            f"{report['skipped']} skipped, {len(failed)} failed, {cancelled} cancelled"
+        )
+        return report
+
+    def _importQuestion(self, bank: BankAPI, question: dict) -> Optional[int]:
+        """Upload the images of a question and add it to the bank
+
+        Returns:
+            Optional[int]: The number of images added, or None if the import
+                was cancelled before the question was started
+        """
+        if self._cancelled.is_set():
+            return None
+
+        imageIds = self.imageUploader.upload(
+            bank,
+            [
+                (subQuestion["image_path"], subQuestion["image_description"])
+                for subQuestion in question["sub_questions"]
+                if subQuestion["image_path"]
+            ],
+        )
+        questionId = bank.add_question(
+            Question(
+                name=question["name"],
+                source=question["source"],
+                sub_questions=[
+                    SubQuestion(
+                        description=subQuestion["description"],
+                        answer=subQuestion["answer"],
+                        concept=subQuestion["concept"],
+                        process=subQuestion["process"],
+                        keywords=subQuestion["keywords"],
+                        options=subQuestion["options"],
+                        image_id=imageIds[
+                            (
+                                subQuestion["image_path"],
+                                subQuestion["image_description"],
+                            )
+                        ]
+                        if subQuestion["image_path"]
+                        else None,
+                    )
+                    for subQuestion in question["sub_questions"]
+                ],
+            )
+        )
+        if self.localStore is not None:
+            self.localStore.saveImportedQuestion(question["key"], questionId)
+        return len(imageIds)
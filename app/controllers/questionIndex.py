@@ -0,0 +1,179 @@
+import re
+from bisect import bisect_left
+from typing import Iterable, List, Optional
+
+TOKEN_PATTERN = re.compile(r"\w+")
+PREFIX_CACHE_MAX_ENTRIES = 1024
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens
+
+    Args:
+        text (str): The text
+
+    Returns:
+        List[str]: The tokens
+    """
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class QuestionIndex:
+    """In-memory search index over a snapshot of the question bank
+
+    Every question gets a bit position. An inverted index maps each token of
+    the question names, sub-question descriptions and keywords to a bitmap of
+    the questions containing it, and concept/process bitmaps mark the questions
+    with at least one sub-question of that concept or process. A search ANDs
+    the bitmaps together, so filtering never touches the questions themselves.
+
+    Query words match any indexed token they prefix, so results update while
+    a word is still being typed.
+    """
+
+    def __init__(self):
+        self._questions = []  # bit position -> question data
+        self._tokenPositions = {}  # token -> positions, until the index is built
+        self._conceptPositions = {}  # concept value -> positions
+        self._processPositions = {}  # process value -> positions
+        self._tokenBitmaps = None  # token -> bitmap
+        self._conceptBitmaps = None  # concept value -> bitmap
+        self._processBitmaps = None  # process value -> bitmap
+        self._sortedTokens = None
+        self._prefixBitmaps = {}  # query word -> bitmap
+
+    def __len__(self) -> int:
+        return len(self._questions)
+
+    def add(
+        self,
+        questionData: dict,
+        texts: Iterable[str],
+        concepts: Iterable[int],
+        processes: Iterable[int],
+    ):
+        """Add a question to the index
+
+        Args:
+            questionData (dict): The data returned for the question by search
+            texts (Iterable[str]): The searchable texts of the question
+            concepts (Iterable[int]): The concepts of its sub-questions
+            processes (Iterable[int]): The processes of its sub-questions
+        """
+        position = len(self._questions)
+        self._questions.append(questionData)
+
+        tokens = {token for text in texts for token in tokenize(text)}
+        for token in tokens:
+            self._tokenPositions.setdefault(token, []).append(position)
+        for concept in set(concepts):
+            self._conceptPositions.setdefault(concept, []).append(position)
+        for process in set(processes):
+            self._processPositions.setdefault(process, []).append(position)
+
+        self._tokenBitmaps = None
+
+    def build(self):
+        """Turn the collected positions into bitmaps
+
+        Called by the first search after questions were added, or ahead of
+        time on a background thread so the first search is instant too.
+        """
+        if self._tokenBitmaps is not None:
+            return
+
+        self._tokenBitmaps = self._toBitmaps(self._tokenPositions)
+        self._conceptBitmaps = self._toBitmaps(self._conceptPositions)
+        self._processBitmaps = self._toBitmaps(self._processPositions)
+        self._sortedTokens = sorted(self._tokenBitmaps)
+        self._prefixBitmaps = {}
+
+    def _toBitmaps(self, positions: dict) -> dict:
+        """Convert lists of bit positions into integer bitmaps
+
+        Args:
+            positions (dict): Key -> bit positions
+
+        Returns:
+            dict: Key -> bitmap
+        """
+        size = (len(self._questions) + 7) // 8
+        bitmaps = {}
+        for key, keyPositions in positions.items():
+            bits = bytearray(size)
+            for position in keyPositions:
+                bits[position >> 3] |= 1 << (position & 7)
+            bitmaps[key] = int.from_bytes(bits, "little")
+        return bitmaps
+
+    def search(
+        self,
+        text: str = "",
+        concept: Optional[int] = None,
+        process: Optional[int] = None,
+    ) -> List[dict]:
+        """Find the questions matching a query
+
+        Args:
+            text (str, optional): Words that must all prefix a token of the
+                question. Defaults to "".
+            concept (Optional[int], optional): Required concept value. Defaults to None.
+            process (Optional[int], optional): Required process value. Defaults to None.
+
+        Returns:
+            List[dict]: The matching questions in snapshot order
+        """
+        self.build()
+
+        bitmap = (1 << len(self._questions)) - 1
+        if concept is not None:
+            bitmap &= self._conceptBitmaps.get(concept, 0)
+        if process is not None:
+            bitmap &= self._processBitmaps.get(process, 0)
+
+        for word in sorted(set(tokenize(text)), key=len, reverse=True):
+            if not bitmap:
+                break
+            bitmap &= self._prefixBitmap(word)
+
+        return self._questionsOf(bitmap)
+
+    def _prefixBitmap(self, word: str) -> int:
+        """Get the bitmap of the questions with a token starting with a word
+
+        Args:
+            word (str): The word
+
+        Returns:
+            int: The bitmap
+        """
+        bitmap = self._prefixBitmaps.get(word)
+        if bitmap is not None:
+            return bitmap
+
+        bitmap = 0
+        index = bisect_left(self._sortedTokens, word)
+        while index < len(self._sortedTokens) and self._sortedTokens[index].startswith(
+            word
+        ):
+            bitmap |= self._tokenBitmaps[self._sortedTokens[index]]
+            index += 1
+
+        if len(self._prefixBitmaps) >= PREFIX_CACHE_MAX_ENTRIES:
+            self._prefixBitmaps.clear()
+        self._prefixBitmaps[word] = bitmap
+        return bitmap
+
+    def _questionsOf(self, bitmap: int) -> List[dict]:
+        """Get the questions whose bits are set in a bitmap
+
+        Args:
+            bitmap (int): The bitmap
+
+        Returns:
+            List[dict]: The questions in snapshot order
+        """
+        bits = bin(bitmap)[:1:-1]
+        return [
+            self._questions[position] for position, bit in enumerate(bits) if bit == "1"
+        ]
@@ -0,0 +1,64 @@
+from typing import Callable, Dict, Iterable
+from PyQt6.QtCore import QObject, QTimer
+
+from app.config import REFRESH_COALESCE_MS, STUDENT_REFRESH_DEPENDENCIES
+
+
+class RefreshScheduler(QObject):
+    """Refresh only the reads a change affects, once per burst of changes
+
+    Every change is mapped to the read operations whose data it makes stale.
+    Those reads are marked dirty, and when the coalescing window of the first
+    change ends each dirty read is loaded once, however many changes marked it.
+    """
+
+    def __init__(
+        self,
+        loaders: Dict[str, Callable[[], object]],
+        dependencies: Dict[str, Iterable[str]] = STUDENT_REFRESH_DEPENDENCIES,
+        delay: int = REFRESH_COALESCE_MS,
+        parent=None,
+    ):
+        """Create a refresh scheduler
+
+        Args:
+            loaders (Dict[str, Callable[[], object]]): Read operation -> function
+                starting that read
+            dependencies (Dict[str, Iterable[str]], optional): Change -> read
+                operations it affects. Defaults to STUDENT_REFRESH_DEPENDENCIES.
+            delay (int, optional): Coalescing window in milliseconds. Defaults to
+                REFRESH_COALESCE_MS.
+            parent (QObject, optional): The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.loaders = loaders
+        self.dependencies = dependencies
+
+        self._dirty = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self.flush)
+
+    def invalidate(self, change: str):
+        """Mark the reads affected by a change for the next refresh
+
+        Args:
+            change (str): The change
+        """
+        operations = self.dependencies.get(change)
+        if operations is None:
+            print(f"[RefreshScheduler] Unknown change: {change}")
+            return
+
+        self._dirty.update(operations)
+        if self._dirty and not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """Load the dirty reads right away"""
+        self._timer.stop()
+        dirty, self._dirty = self._dirty, set()
+        for operation, load in self.loaders.items():
+            if operation in dirty:
+                load()
@@ -0,0 +1,163 @@
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from app.config import (
+    RESPONSE_CACHE_MAX_STALE,
+    RESPONSE_CACHE_POLICIES,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_INVALIDATIONS,
+)
+
+
+class ResponseCache:
+    """Cache of the signals emitted by read operations
+
+    Every cached operation has a TTL. Fresh entries are served without
+    touching the network. Operations marked as stale-while-revalidate also
+    serve expired entries (up to RESPONSE_CACHE_MAX_STALE) while the ApiWorker
+    refreshes them in the background. Write operations drop the entries of the
+    read operations they affect. All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        policies: dict = RESPONSE_CACHE_POLICIES,
+        invalidations: dict = RESPONSE_CACHE_INVALIDATIONS,
+        maxStale: float = RESPONSE_CACHE_MAX_STALE,
+        maxEntries: int = RESPONSE_CACHE_MAX_ENTRIES,
+    ):
+        self.policies = policies
+        self.invalidations = invalidations
+        self.maxStale = maxStale
+        self.maxEntries = maxEntries
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (operation, timestamp, emissions)
+        self._generations = {}  # operation -> generation
+
+    def isCacheable(self, operation: str) -> bool:
+        """Check whether the responses of an operation are cached
+
+        Args:
+            operation (str): The operation
+
+        Returns:
+            bool: Whether the operation is cached
+        """
+        return operation in self.policies
+
+    @staticmethod
+    def makeKey(operation: str, params: dict) -> str:
+        """Build the cache key of a request
+
+        Args:
+            operation (str): The operation
+            params (dict): The parameters of the operation
+
+        Returns:
+            str: The cache key
+        """
+        return f"{operation}:{json.dumps(params, sort_keys=True, default=str)}"
+
+    def get(self, key: str) -> Tuple[Optional[List[tuple]], bool]:
+        """Get the cached emissions of a request
+
+        Args:
+            key (str): The cache key
+
+        Returns:
+            Tuple[Optional[List[tuple]], bool]: The emissions, or None on a miss,
+                and whether they are still fresh
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+
+            operation, timestamp, emissions = entry
+            ttl, staleWhileRevalidate = self.policies[operation]
+            age = time.monotonic() - timestamp
+
+            if age <= ttl:
+                self._entries.move_to_end(key)
+                return emissions, True
+            if staleWhileRevalidate and age <= self.maxStale:
+                self._entries.move_to_end(key)
+                return emissions, False
+
+            del self._entries[key]
+            return None, False
+
+    def generation(self, operation: str) -> int:
+        """Get the invalidation generation of an operation
+
+        Args:
+            operation (str): The operation
+
+        Returns:
+            int: The generation, bumped every time the operation is invalidated
+        """
+        with self._lock:
+            return self._generations.get(operation, 0)
+
+    def put(self, key: str, operation: str, emissions: list, generation: int) -> bool:
+        """Store the emissions of a request
+
+        Responses fetched before an invalidation of their operation are dropped,
+        so a slow read can not resurrect data that a write made outdated.
+
+        Args:
+            key (str): The cache key
+            operation (str): The operation
+            emissions (list): The (signal name, args) pairs emitted by the request
+            generation (int): The generation of the operation when the request started
+
+        Returns:
+            bool: Whether the emissions were stored
+        """
+        with self._lock:
+            if self._generations.get(operation, 0) != generation:
+                return False
+
+            self._entries[key] = (operation, time.monotonic(), emissions)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxEntries:
+                self._entries.popitem(last=False)
+            return True
+
+    def invalidateAfter(self, operation: str):
+        """Invalidate the read operations affected by a write operation
+
+        Args:
+            operation (str): The write operation
+        """
+        operations = self.invalidations.get(operation)
+        if operations:
+            self.invalidate(operations)
+
+    def invalidate(self, operations: List[str]):
+        """Drop every cached response of the given operations
+
+        Args:
+            operations (List[str]): The read operations to invalidate
+        """
+        with self._lock:
+            for operation in operations:
+                self._generations[operation] = self._generations.get(operation, 0) + 1
+
+            for key in [
+                key
+                for key, (operation, _, _) in self._entries.items()
+                if operation in operations
+            ]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock:
+            for operation in self.policies:
+                self._generations[operation] = self._generations.get(operation, 0) + 1
+            self._entries.clear()
@@ -0,0 +1,133 @@
+import sys
+import json
+import time
+from typing import List, Optional, Tuple
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import QEvent, QObject, QTimer, pyqtSignal
+
+from app.config import STARTUP_DEFERRED_MODULES
+
+
+class StartupTimer(QObject):
+    """Measure the phases of starting the application up to the first paint
+
+    Each phase is the time since the previous mark, starting from the moment
+    main.py began importing. The report also lists the heavy modules that
+    should only be loaded after sign in but were already imported, so a CI
+    run fails when an import sneaks back onto the startup path.
+    """
+
+    firstPainted = pyqtSignal()
+
+    def __init__(self, started: float, parent=None):
+        """Create a startup timer
+
+        Args:
+            started (float): time.perf_counter() when the process started
+                importing the application
+            parent (QObject, optional): The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.started = started
+        self.marks: List[Tuple[str, float]] = []
+        self.loadedDeferredModules: List[str] = []
+
+        self._watched = None
+        self._paintName = None
+
+    def mark(self, name: str):
+        """End the current phase
+
+        Args:
+            name (str): The name of the phase
+        """
+        self.marks.append((name, time.perf_counter() - self.started))
+
+    def watchFirstPaint(self, widget: QWidget, name: str = "first paint"):
+        """End a phase once the widget has painted for the first time
+
+        Args:
+            widget (QWidget): The widget to watch
+            name (str, optional): The name of the phase. Defaults to "first paint".
+        """
+        self._watched = widget
+        self._paintName = name
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if obj is self._watched and event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            self._watched = None
+            # marked on the next loop iteration, after the paint was handled
+            QTimer.singleShot(0, self._onFirstPaint)
+        return super().eventFilter(obj, event)
+
+    def _onFirstPaint(self):
+        self.mark(self._paintName)
+        self.loadedDeferredModules = [
+            module for module in STARTUP_DEFERRED_MODULES if module in sys.modules
+        ]
+        self.firstPainted.emit()
+
+    @property
+    def total(self) -> float:
+        """The time until the last mark in seconds"""
+        return self.marks[-1][1] if self.marks else 0.0
+
+    def report(self) -> str:
+        """Format the phases as a table
+
+        Returns:
+            str: The report
+        """
+        lines = [f"{'Phase':<32}{'Phase ms':>10}{'Total ms':>10}"]
+        previous = 0.0
+        for name, elapsed in self.marks:
+            lines.append(
+                f"{name:<32}{(elapsed - previous) * 1000:>10.1f}{elapsed * 1000:>10.1f}"
+            )
+            previous = elapsed
+        lines.append(f"{len(sys.modules)} modules loaded")
+        if self.loadedDeferredModules:
+            lines.append(
+                "Loaded before sign in: " + ", ".join(self.loadedDeferredModules)
+            )
+        return "\n".join(lines)
+
+    def writeJson(self, path: str):
+        """Write the phases to a JSON file
+
+        Args:
+            path (str): The path of the file
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "phases": [
+                        {"name": name, "elapsedMs": elapsed * 1000}
+                        for name, elapsed in self.marks
+                    ],
+                    "totalMs": self.total * 1000,
+                    "modules": len(sys.modules),
+                    "loadedDeferredModules": self.loadedDeferredModules,
+                },
+                file,
+                indent=2,
+            )
+
+    def exitCode(self, budgetMs: Optional[float] = None) -> int:
+        """Get the exit code of a startup check
+
+        Args:
+            budgetMs (Optional[float], optional): The longest allowed startup in
+                milliseconds, None for no limit. Defaults to None.
+
+        Returns:
+            int: 1 if a deferred module was loaded or the budget was exceeded,
+                otherwise 0
+        """
+        if self.loadedDeferredModules:
+            return 1
+        if budgetMs is not None and self.total * 1000 > budgetMs:
+            return 1
+        return 0
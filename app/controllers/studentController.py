@@ -1,6 +1,9 @@
+from itertools import count
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from app.controllers.apiWorker import ApiWorker
+from app.controllers.viewModels import AssignmentVM
+from app.controllers.refreshScheduler import RefreshScheduler
 
 
 class StudentController(QObject):
@@ -9,12 +12,17 @@ class StudentController(QObject):
     dashboardDataReady = pyqtSignal(dict)
     classDataReady = pyqtSignal(dict)
     questionsReady = pyqtSignal(list)
-    questionAnsweringDataReady = pyqtSignal(dict)
-    questionReviewDataReady = pyqtSignal(dict)
-    assignmentReviewDataReady = pyqtSignal(dict)
+    questionAnsweringDataReady = pyqtSignal(object)  # AssignmentVM
+    questionReviewDataReady = pyqtSignal(object)  # AssignmentVM
+    assignmentReviewDataReady = pyqtSignal(object)  # AssignmentVM
     subQuestionFeedbackReady = pyqtSignal(int, dict)  # sub_question_id, feedback
-    aiResponseReady = pyqtSignal(str)  # text
+    subQuestionSubmitFailed = pyqtSignal(int, str)  # sub_question_id, error_message
+    subQuestionSubmitQueued = pyqtSignal(int, str)  # sub_question_id, error_message
+    aiResponseReady = pyqtSignal(int, str)  # request_id, text
+    aiResponseChunkReady = pyqtSignal(int, str)  # request_id, text chunk
+    aiResponseFailed = pyqtSignal(int, str)  # request_id, error_message
     joinClassResult = pyqtSignal(bool, str)  # success, message
+    imageReady = pyqtSignal(int, bytes)  # image_id, image
     errorOccurred = pyqtSignal(str, str)  # operation, error_message
 
     navigateToHome = pyqtSignal()
@@ -26,6 +34,16 @@ class StudentController(QObject):
         self.apiWorker = apiWorker
         self.current_student_id = None
         self.current_class_id = None
+        self._pendingImageIds = set()
+        self._aiRequestIds = count(1)
+        self.refreshScheduler = RefreshScheduler(
+            {
+                "load_dashboard_data": self.loadDashboardData,
+                "load_class_data": self.loadClassData,
+                "load_questions": self.loadQuestions,
+            },
+            parent=self,
+        )
 
         self._connectSignals()
 
@@ -46,8 +64,17 @@ class StudentController(QObject):
         self.apiWorker.subQuestionFeedbackReceived.connect(
             self._onSubQuestionFeedbackReceived
         )
+        self.apiWorker.subQuestionSubmitFailed.connect(
+            self.subQuestionSubmitFailed.emit
+        )
+        self.apiWorker.subQuestionSubmitQueued.connect(
+            self.subQuestionSubmitQueued.emit
+        )
         self.apiWorker.aiResponseReceived.connect(self._onAIResponseReceived)
+        self.apiWorker.aiResponseChunkReceived.connect(self.aiResponseChunkReady.emit)
+        self.apiWorker.aiResponseFailed.connect(self.aiResponseFailed.emit)
         self.apiWorker.joinClassFinished.connect(self._onJoinClassFinished)
+        self.apiWorker.imageLoaded.connect(self._onImageLoaded)
         self.apiWorker.operationFailed.connect(self._onOperationFailed)
 
     def setStudentId(self, student_id: str):
@@ -68,13 +95,11 @@ class StudentController(QObject):
 
     def loadDashboardData(self):
         """Load all dashboard data for the home interface"""
-        self.apiWorker.setup("load_dashboard_data")
-        self.apiWorker.start()
+        self.apiWorker.submit("load_dashboard_data")
 
     def loadClassData(self):
         """Load class data for the class interface"""
-        self.apiWorker.setup("load_class_data")
-        self.apiWorker.start()
+        self.apiWorker.submit("load_class_data")
 
     def loadQuestions(self):
         """Load question history for the student
@@ -82,8 +107,7 @@ class StudentController(QObject):
         Args:
             student_id (str, optional): Student ID. Uses current if not provided.
         """
-        self.apiWorker.setup("load_questions")
-        self.apiWorker.start()
+        self.apiWorker.submit("load_questions")
 
     def loadAssignmentData(self, assignment_id: str):
         """Load specific assignment data for question answering
@@ -95,8 +119,7 @@ class StudentController(QObject):
             self.errorOccurred.emit("load_assignment_data", "No assignment ID provided")
             return
 
-        self.apiWorker.setup("load_assignment_data", assignment_id=assignment_id)
-        self.apiWorker.start()
+        self.apiWorker.submit("load_assignment_data", assignment_id=assignment_id)
 
     def loadAssignmentReviewData(self, assignment_id: str):
         """Load specific assignment data for review (read-only)
@@ -110,8 +133,9 @@ class StudentController(QObject):
             )
             return
 
-        self.apiWorker.setup("load_assignment_review_data", assignment_id=assignment_id)
-        self.apiWorker.start()
+        self.apiWorker.submit(
+            "load_assignment_review_data", assignment_id=assignment_id
+        )
 
     def loadQuestionReviewData(self, question_id: str):
         """Load specific question data for review (read-only)
@@ -125,24 +149,40 @@ class StudentController(QObject):
             )
             return
 
-        self.apiWorker.setup("load_question_review_data", question_id=question_id)
-        self.apiWorker.start()
+        self.apiWorker.submit("load_question_review_data", question_id=question_id)
+
+    def loadImage(self, image_id: int):
+        """Load a single image for a lazily loaded thumbnail
 
-    def sendAIMessage(self, message: str, sub_question_id: int, history: list):
+        Args:
+            image_id (int): ID of the image to load
+        """
+        if image_id in self._pendingImageIds:
+            return
+
+        self._pendingImageIds.add(image_id)
+        self.apiWorker.submit("load_image", image_id=image_id)
+
+    def sendAIMessage(self, message: str, sub_question_id: int, history: list) -> int:
         """Send a message to the AI assistant
 
         Args:
             message (str): The message to send
             sub_question_id (int): The ID of the sub-question
             history (list): The history of messages
+
+        Returns:
+            int: The request id the response chunks are tagged with
         """
-        self.apiWorker.setup(
+        request_id = next(self._aiRequestIds)
+        self.apiWorker.submit(
             "send_ai_message",
+            request_id=request_id,
             message=message,
             sub_question_id=sub_question_id,
             history=history,
         )
-        self.apiWorker.start()
+        return request_id
 
     def submitAnswer(self, question_id: int, answer, question_type: str = "text"):
         """Submit an answer for a question
@@ -152,13 +192,12 @@ class StudentController(QObject):
             answer: The answer (could be text or list of selections)
             question_type (str): Type of question ("text" or "multiple_choice")
         """
-        self.apiWorker.setup(
+        self.apiWorker.submit(
             "submit_answer",
             question_id=question_id,
             answer=answer,
             question_type=question_type,
         )
-        self.apiWorker.start()
 
     def submitSubQuestion(self, assignment_id: int, sub_question_id: int, answer):
         """Submit a sub-question answer for instant feedback
@@ -168,13 +207,12 @@ class StudentController(QObject):
             sub_question_id (int): ID of the sub-question
             answer: The answer (could be text or list of selections)
         """
-        self.apiWorker.setup(
+        self.apiWorker.submit(
             "submit_sub_question",
             assignment_id=assignment_id,
             sub_question_id=sub_question_id,
             answer=answer,
         )
-        self.apiWorker.start()
 
     def refreshAllData(self):
         """Refresh all data for the current student"""
@@ -184,6 +222,14 @@ class StudentController(QObject):
 
         self.loadDashboardData()
 
+    def refreshAfter(self, change: str):
+        """Refresh the data a change made stale, coalescing repeated changes
+
+        Args:
+            change (str): The change, a key of STUDENT_REFRESH_DEPENDENCIES
+        """
+        self.refreshScheduler.invalidate(change)
+
     def goToHome(self):
         """Navigate to home interface"""
         self.navigateToHome.emit()
@@ -220,27 +266,27 @@ class StudentController(QObject):
         """
         self.questionsReady.emit(questions)
 
-    def _onQuestionAnsweringDataLoaded(self, data: dict):
+    def _onQuestionAnsweringDataLoaded(self, data: AssignmentVM):
         """Handle question answering data loaded from API
 
         Args:
-            data (dict): The data from the API
+            data (AssignmentVM): The data from the API
         """
         self.questionAnsweringDataReady.emit(data)
 
-    def _onQuestionReviewDataLoaded(self, data: dict):
+    def _onQuestionReviewDataLoaded(self, data: AssignmentVM):
         """Handle question review data loaded from API
 
         Args:
-            data (dict): The data from the API
+            data (AssignmentVM): The data from the API
         """
         self.questionReviewDataReady.emit(data)
 
-    def _onAssignmentReviewDataLoaded(self, data: dict):
+    def _onAssignmentReviewDataLoaded(self, data: AssignmentVM):
         """Handle assignment review data loaded from API
 
         Args:
-            data (dict): The data from the API
+            data (AssignmentVM): The data from the API
         """
         self.assignmentReviewDataReady.emit(data)
 
@@ -253,13 +299,14 @@ class StudentController(QObject):
         """
         self.subQuestionFeedbackReady.emit(sub_question_id, feedback)
 
-    def _onAIResponseReceived(self, response: str):
+    def _onAIResponseReceived(self, request_id: int, response: str):
         """Handle AI response received from API
 
         Args:
+            request_id (int): The id returned by sendAIMessage
             response (str): The response from the API
         """
-        self.aiResponseReady.emit(response)
+        self.aiResponseReady.emit(request_id, response)
 
     def _onJoinClassFinished(self, success: bool, message: str):
         """Handle join class result from API
@@ -270,6 +317,16 @@ class StudentController(QObject):
         """
         self.joinClassResult.emit(success, message)
 
+    def _onImageLoaded(self, image_id: int, image: bytes):
+        """Handle image loaded from API
+
+        Args:
+            image_id (int): The ID of the image
+            image (bytes): The image bytes, empty if loading failed
+        """
+        self._pendingImageIds.discard(image_id)
+        self.imageReady.emit(image_id, image)
+
     def _onOperationFailed(self, operation: str, error_message: str):
         """Handle operation failure
 
@@ -292,10 +349,9 @@ class StudentController(QObject):
             )
             return
 
-        self.apiWorker.setup(
+        self.apiWorker.submit(
             "join_class",
             class_name=class_name,
             enter_code=enter_code,
             student_id=self.current_student_id,
         )
-        self.apiWorker.start()
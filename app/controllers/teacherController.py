@@ -1,7 +1,11 @@
 from datetime import datetime
 from PyQt6.QtCore import QObject, pyqtSignal
+from nanoko.models.question import ConceptType, ProcessType
 
+from app.utils import textToEnumName
 from app.controllers.apiWorker import ApiWorker
+from app.controllers.queryPipeline import QueryPipeline
+from app.controllers.questionIndex import QuestionIndex
 
 
 class TeacherController(QObject):
@@ -22,26 +26,37 @@ class TeacherController(QObject):
     dashboardDataReady = pyqtSignal(dict)
     classesDataReady = pyqtSignal(list)
     assignmentsDataReady = pyqtSignal(list)
-    questionsDataReady = pyqtSignal(list)
+    questionsPageReady = pyqtSignal(object, list, object)  # cursor, data, next cursor
     classDataReady = pyqtSignal(dict)
     studentStatisticsReady = pyqtSignal(dict)
     assignmentCreationResult = pyqtSignal(bool, str)  # success, message
     classCreationResult = pyqtSignal(bool, str)  # success, message
     questionCreationResult = pyqtSignal(bool, str)  # success, message
+    imageUploadProgress = pyqtSignal(int, int, str)  # uploaded, total, path
+    questionImportProgress = pyqtSignal(int, int, str)  # finished, total, name
+    questionImportResult = pyqtSignal(dict)  # report
     classAssignmentReviewReady = pyqtSignal(dict)
     studentRemovalResult = pyqtSignal(bool, str)  # success, message
     assignmentQuestionsDataReady = pyqtSignal(dict)
     assignmentAssignmentResult = pyqtSignal(bool, str)  # success, message
     availableAssignmentsDataReady = pyqtSignal(list)
-    filteredQuestionsDataReady = pyqtSignal(list)
+    filteredQuestionsDataReady = pyqtSignal(object)  # list, shared with the index
     subQuestionStudentPerformanceReady = pyqtSignal(dict)
     questionPreviewDataReady = pyqtSignal(dict)
+    imageReady = pyqtSignal(int, bytes)  # imageId, image
 
     operationError = pyqtSignal(str, str)  # operation, error_message
 
     def __init__(self, apiWorker: ApiWorker):
         super().__init__()
         self.apiWorker = apiWorker
+        self._pendingImageIds = set()
+        self._questionIndex = None
+        self._questionBankRequested = False
+        self._pendingQuestionFilter = None  # (generation, filter)
+        self._questionFilterPipeline = QueryPipeline(
+            self._startQuestionFilter, parent=self
+        )
         self._connectApiWorkerSignals()
 
     def _connectApiWorkerSignals(self):
@@ -51,7 +66,7 @@ class TeacherController(QObject):
         self.apiWorker.teacherAssignmentsDataLoaded.connect(
             self.assignmentsDataReady.emit
         )
-        self.apiWorker.teacherQuestionsDataLoaded.connect(self.questionsDataReady.emit)
+        self.apiWorker.teacherQuestionsPageLoaded.connect(self.questionsPageReady.emit)
         self.apiWorker.teacherClassDataLoaded.connect(self.classDataReady.emit)
         self.apiWorker.teacherStudentStatisticsLoaded.connect(
             self.studentStatisticsReady.emit
@@ -59,6 +74,9 @@ class TeacherController(QObject):
         self.apiWorker.assignmentCreated.connect(self.assignmentCreationResult.emit)
         self.apiWorker.classCreated.connect(self.classCreationResult.emit)
         self.apiWorker.questionCreated.connect(self.questionCreationResult.emit)
+        self.apiWorker.imageUploadProgress.connect(self.imageUploadProgress.emit)
+        self.apiWorker.questionImportProgress.connect(self.questionImportProgress.emit)
+        self.apiWorker.questionImportFinished.connect(self._onQuestionsImported)
         self.apiWorker.classAssignmentReviewLoaded.connect(
             self.classAssignmentReviewReady.emit
         )
@@ -72,14 +90,15 @@ class TeacherController(QObject):
         self.apiWorker.availableAssignmentsDataLoaded.connect(
             self.availableAssignmentsDataReady.emit
         )
-        self.apiWorker.filteredQuestionsLoaded.connect(
-            self.filteredQuestionsDataReady.emit
-        )
+        self.apiWorker.filteredQuestionsLoaded.connect(self._onFilteredQuestionsLoaded)
         self.apiWorker.questionPreviewDataLoaded.connect(
             self.questionPreviewDataReady.emit
         )
+        self.apiWorker.questionBankLoaded.connect(self._onQuestionBankLoaded)
+        self.apiWorker.questionCreated.connect(self._onQuestionCreated)
+        self.apiWorker.imageLoaded.connect(self._onImageLoaded)
 
-        self.apiWorker.operationFailed.connect(self.operationError.emit)
+        self.apiWorker.operationFailed.connect(self._onOperationFailed)
 
     # Navigation methods
     def showClassesOverview(self):
@@ -114,97 +133,116 @@ class TeacherController(QObject):
     def loadDashboardData(self):
         """Load teacher dashboard data"""
         print("[TeacherController] loadDashboardData called")
-        self.apiWorker.setup("load_teacher_dashboard_data")
-        self.apiWorker.start()
+        self.apiWorker.submit("load_teacher_dashboard_data")
 
     def loadAssignmentsData(self):
         """Load teacher assignments data"""
-        self.apiWorker.setup("load_teacher_assignments_data")
-        self.apiWorker.start()
+        self.apiWorker.submit("load_teacher_assignments_data")
 
     def loadQuestionsData(self):
-        """Load teacher questions data"""
-        self.apiWorker.setup("load_teacher_questions_data")
-        self.apiWorker.start()
+        """Load the first page of teacher questions data"""
+        self.apiWorker.submit("load_teacher_questions_page")
+
+    def loadMoreQuestions(self, afterId: int):
+        """Load the page of teacher questions data following a cursor
+
+        Args:
+            afterId (int): The cursor returned with the previous page
+        """
+        self.apiWorker.submit("load_teacher_questions_page", after_id=afterId)
 
     def loadClassData(self, classId: int):
         """Load individual class data"""
-        self.apiWorker.setup("load_teacher_class_data", class_id=classId)
-        self.apiWorker.start()
+        self.apiWorker.submit("load_teacher_class_data", class_id=classId)
 
     def loadStudentStatistics(self, studentId: int, studentName: str, classId: int):
         """Load student statistics data"""
         print(
             f"[TeacherController] loadStudentStatistics called for {studentId} {studentName}"
         )
-        self.apiWorker.setup(
+        self.apiWorker.submit(
             "load_teacher_student_statistics",
             student_id=studentId,
             student_name=studentName,
             class_id=classId,
         )
-        self.apiWorker.start()
 
     def loadClassAssignmentReview(self, assignmentId: int, classId: int):
         """Load class assignment review data"""
-        self.apiWorker.setup(
+        self.apiWorker.submit(
             "load_class_assignment_review",
             assignment_id=assignmentId,
             class_id=classId,
         )
-        self.apiWorker.start()
 
     def loadQuestionPreview(self, questionId: int):
         """Load question preview data"""
-        self.apiWorker.setup("load_question_preview", question_id=questionId)
-        self.apiWorker.start()
+        self.apiWorker.submit("load_question_preview", question_id=questionId)
+
+    def loadImage(self, imageId: int):
+        """Load a single image for a lazily loaded thumbnail"""
+        if imageId in self._pendingImageIds:
+            return
+
+        self._pendingImageIds.add(imageId)
+        self.apiWorker.submit("load_image", image_id=imageId)
+
+    def _onImageLoaded(self, imageId: int, image: bytes):
+        """Forward a loaded image once it is no longer pending"""
+        self._pendingImageIds.discard(imageId)
+        self.imageReady.emit(imageId, image)
 
     # Creation methods
     def createAssignment(self, name: str, description: str, questionIds: list):
         """Create a new assignment"""
-        self.apiWorker.setup(
+        self.apiWorker.submit(
             "create_assignment",
             name=name,
             description=description,
             question_ids=questionIds,
         )
-        self.apiWorker.start()
 
     def createClass(self, className: str, enterCode: str):
         """Create a new class"""
-        self.apiWorker.setup("create_class", class_name=className, enter_code=enterCode)
-        self.apiWorker.start()
+        self.apiWorker.submit(
+            "create_class", class_name=className, enter_code=enterCode
+        )
 
     def createQuestion(self, name: str, source: str, subQuestionsData: list):
         """Create a new question"""
-        self.apiWorker.setup(
+        self.apiWorker.submit(
             "create_question",
             name=name,
             source=source,
             sub_questions_data=subQuestionsData,
         )
-        self.apiWorker.start()
+
+    def importQuestions(self, manifestPath: str):
+        """Create the questions of a manifest file or folder in bulk"""
+        print(f"[TeacherController] importQuestions called for {manifestPath}")
+        self.apiWorker.submit("import_questions", manifest_path=manifestPath)
+
+    def cancelQuestionImport(self):
+        """Stop the running bulk import, it resumes when imported again"""
+        self.apiWorker.cancelQuestionImport()
 
     def removeStudentFromClass(self, studentId: int):
         """Remove a student from a class"""
         print(f"[TeacherController] removeStudentFromClass called for {studentId}")
-        self.apiWorker.setup(
+        self.apiWorker.submit(
             "remove_student_from_class",
             student_id=studentId,
         )
-        self.apiWorker.start()
 
     def loadAssignmentQuestions(self, assignmentId: int):
         """Load assignment questions data"""
         print(f"[TeacherController] loadAssignmentQuestions called for {assignmentId}")
-        self.apiWorker.setup("load_assignment_questions", assignment_id=assignmentId)
-        self.apiWorker.start()
+        self.apiWorker.submit("load_assignment_questions", assignment_id=assignmentId)
 
     def loadAvailableAssignments(self):
         """Load available assignments for assignment"""
         print("[TeacherController] loadAvailableAssignments called")
-        self.apiWorker.setup("load_available_assignments")
-        self.apiWorker.start()
+        self.apiWorker.submit("load_available_assignments")
 
     def assignAssignmentToClass(
         self, assignmentId: int, classId: int, dueDate: datetime
@@ -213,28 +251,130 @@ class TeacherController(QObject):
         print(
             f"[TeacherController] assignAssignmentToClass called: {assignmentId} to {classId}"
         )
-        self.apiWorker.setup(
+        self.apiWorker.submit(
             "assign_assignment_to_class",
             assignment_id=assignmentId,
             class_id=classId,
             due_date=dueDate,
         )
-        self.apiWorker.start()
 
     def loadFilteredQuestions(
-        self, searchText: str = "", conceptFilter: str = "", processFilter: str = ""
+        self,
+        searchText: str = "",
+        conceptFilter: str = "",
+        processFilter: str = "",
+        debounce: bool = False,
     ):
-        """Load filtered questions for selection"""
-        print(
-            f"[TeacherController] loadFilteredQuestions called with search: '{searchText}', concept: '{conceptFilter}', process: '{processFilter}'"
-        )
-        self.apiWorker.setup(
-            "load_filtered_questions",
-            search_text=searchText,
-            concept_filter=conceptFilter,
-            process_filter=processFilter,
+        """Load filtered questions for selection
+
+        The question bank is downloaded and indexed once per session, after
+        which every filter is answered locally without a request. Only the
+        result of the latest filter is ever emitted.
+
+        Args:
+            searchText (str, optional): The search text. Defaults to "".
+            conceptFilter (str, optional): The concept filter. Defaults to "".
+            processFilter (str, optional): The process filter. Defaults to "".
+            debounce (bool, optional): Wait for typing to pause first. Defaults to False.
+        """
+        self._questionFilterPipeline.submit(
+            (searchText, conceptFilter, processFilter), debounce
         )
-        self.apiWorker.start()
+
+    def _startQuestionFilter(self, generation: int, questionFilter: tuple):
+        """Answer a question filter from the index, loading the bank first if needed
+
+        Args:
+            generation (int): The generation of the filter
+            questionFilter (tuple): The search text, concept and process filters
+        """
+        searchText, conceptFilter, processFilter = questionFilter
+        if self._questionIndex is not None:
+            self.filteredQuestionsDataReady.emit(
+                self._questionIndex.search(
+                    searchText,
+                    self._filterValue(ConceptType, conceptFilter, "All Concepts"),
+                    self._filterValue(ProcessType, processFilter, "All Processes"),
+                )
+            )
+            return None
+
+        self._pendingQuestionFilter = (generation, questionFilter)
+        if not self._questionBankRequested:
+            print("[TeacherController] Downloading the question bank for local search")
+            self._questionBankRequested = True
+            self.apiWorker.submit("load_question_bank")
+        return None
+
+    @staticmethod
+    def _filterValue(enumType, text: str, allText: str):
+        """Convert a filter combo box text into an enum value
+
+        Args:
+            enumType: ConceptType or ProcessType
+            text (str): The text of the filter
+            allText (str): The text meaning no filter
+
+        Returns:
+            Optional[int]: The enum value, or None for no filter
+        """
+        if not text or text == allText:
+            return None
+        return enumType[textToEnumName(text)].value
+
+    def _onQuestionBankLoaded(self, index: QuestionIndex):
+        """Keep the indexed question bank and answer the latest filter"""
+        self._questionIndex = index
+        self._questionBankRequested = False
+
+        if self._pendingQuestionFilter is not None:
+            generation, questionFilter = self._pendingQuestionFilter
+            self._pendingQuestionFilter = None
+            if self._questionFilterPipeline.isCurrent(generation):
+                self._startQuestionFilter(generation, questionFilter)
+
+    def _onFilteredQuestionsLoaded(self, generation: int, questionsData: list):
+        """Forward server-side filter results unless a newer filter superseded them"""
+        if not self._questionFilterPipeline.isCurrent(generation):
+            print(f"[TeacherController] Dropping superseded filter #{generation}")
+            return
+
+        self.filteredQuestionsDataReady.emit(questionsData)
+
+    def _onQuestionCreated(self, success: bool, message: str):
+        """Drop the indexed question bank once a new question is added"""
+        if success:
+            self._questionIndex = None
+
+    def _onQuestionsImported(self, report: dict):
+        """Drop the indexed question bank once questions were imported"""
+        if report["imported"]:
+            self._questionIndex = None
+        self.questionImportResult.emit(report)
+
+    def _onOperationFailed(self, operation: str, message: str):
+        """Forward errors, falling back to server-side filtering without a bank"""
+        if operation == "load_question_bank":
+            self._questionBankRequested = False
+            if self._pendingQuestionFilter is not None:
+                generation, questionFilter = self._pendingQuestionFilter
+                self._pendingQuestionFilter = None
+                print(
+                    f"[TeacherController] Failed to load the question bank: {message}"
+                )
+                searchText, conceptFilter, processFilter = questionFilter
+                self._questionFilterPipeline.track(
+                    self.apiWorker.submit(
+                        "load_filtered_questions",
+                        search_text=searchText,
+                        concept_filter=conceptFilter,
+                        process_filter=processFilter,
+                        generation=generation,
+                    )
+                )
+                return
+
+        self.operationError.emit(operation, message)
 
     def loadSubQuestionStudentPerformance(
         self,
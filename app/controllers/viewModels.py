@@ -0,0 +1,186 @@
+from typing import Optional, Tuple, Union
+
+from app.utils import enumNameToText
+
+
+class ViewModel:
+    """Immutable, slotted data passed from the ApiWorker to the views
+
+    View models travel through ``object`` signals, so the GUI thread gets
+    the very object built on the worker thread instead of a converted copy.
+    They can't be changed after they are built. That makes them safe to
+    share between the response cache and any number of views. Use
+    ``replace`` to derive an updated copy.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(
+                f"{type(self).__name__} got unexpected fields: {', '.join(fields)}"
+            )
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getstate__(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def __copy__(self) -> "ViewModel":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "ViewModel":
+        # immutable, so cached responses can share it instead of copying
+        return self
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and self.__getstate__() == other.__getstate__()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.id))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r})"
+
+    def replace(self, **changes) -> "ViewModel":
+        """Create a copy with some fields changed
+
+        Args:
+            **changes: The new values of the changed fields
+
+        Returns:
+            ViewModel: The copy
+        """
+        return type(self)(**{**self.__getstate__(), **changes})
+
+
+class SubQuestionVM(ViewModel):
+    """A sub-question with the student's submission, if any
+
+    Attributes:
+        id (int): The ID of the sub-question
+        type (str): "multiple_choice" or "text"
+        text (str): The description
+        options (Optional[Tuple[str, ...]]): The options of a multiple choice
+            sub-question
+        imageId (Optional[int]): The ID of the image
+        image (Optional[bytes]): The image, shared with the image cache
+        keywords (Tuple[str, ...]): The keywords
+        isSubmitted (bool): Whether the answer was graded
+        userAnswer (Union[str, Tuple[str, ...], None]): The submitted answer,
+            the selected options of a multiple choice sub-question
+        performance (str): The performance of the answer
+        feedback (str): The feedback of the answer
+    """
+
+    __slots__ = (
+        "id",
+        "type",
+        "text",
+        "options",
+        "imageId",
+        "image",
+        "keywords",
+        "isSubmitted",
+        "userAnswer",
+        "performance",
+        "feedback",
+    )
+
+    id: int
+    type: str
+    text: str
+    options: Optional[Tuple[str, ...]]
+    imageId: Optional[int]
+    image: Optional[bytes]
+    keywords: Tuple[str, ...]
+    isSubmitted: bool
+    userAnswer: Union[str, Tuple[str, ...], None]
+    performance: str
+    feedback: str
+
+    @classmethod
+    def fromSubQuestion(
+        cls, subQuestion, image: Optional[bytes] = None, submission=None
+    ) -> "SubQuestionVM":
+        """Build the view model of a sub-question
+
+        Args:
+            subQuestion (SubQuestion): The sub-question from the API
+            image (Optional[bytes], optional): Its image. Defaults to None.
+            submission (SubQuestion, optional): The completed sub-question holding
+                the graded answer, if it was submitted. Defaults to None.
+
+        Returns:
+            SubQuestionVM: The view model
+        """
+        isOptions = subQuestion.options is not None
+        userAnswer = None
+        performance = ""
+        feedback = ""
+        if submission is not None:
+            userAnswer = submission.submitted_answer
+            if isOptions and userAnswer is not None:
+                userAnswer = tuple(userAnswer.split("<OPTION>"))
+            performance = enumNameToText(submission.performance.name)
+            feedback = submission.feedback
+
+        return cls(
+            id=subQuestion.id,
+            type="multiple_choice" if isOptions else "text",
+            text=subQuestion.description,
+            options=tuple(subQuestion.options) if isOptions else None,
+            imageId=subQuestion.image_id if image is not None else None,
+            image=image,
+            keywords=tuple(subQuestion.keywords or ()),
+            isSubmitted=submission is not None,
+            userAnswer=userAnswer,
+            performance=performance,
+            feedback=feedback,
+        )
+
+
+class QuestionVM(ViewModel):
+    """A question of an assignment
+
+    Attributes:
+        id (int): The ID of the question
+        title (str): The name
+        attribution (str): The attribution of its source, may be empty
+        subQuestions (Tuple[SubQuestionVM, ...]): The sub-questions
+    """
+
+    __slots__ = ("id", "title", "attribution", "subQuestions")
+
+    id: int
+    title: str
+    attribution: str
+    subQuestions: Tuple[SubQuestionVM, ...]
+
+
+class AssignmentVM(ViewModel):
+    """An assignment, or a single completed question, to answer or review
+
+    Attributes:
+        id (int): The ID of the assignment, or of the question
+        title (str): The name
+        description (str): The description, empty for a single question
+        questions (Tuple[QuestionVM, ...]): The questions
+    """
+
+    __slots__ = ("id", "title", "description", "questions")
+
+    id: int
+    title: str
+    description: str
+    questions: Tuple[QuestionVM, ...]
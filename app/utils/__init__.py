@@ -1,4 +1,5 @@
 import pytz
+import hashlib
 from typing import Tuple
 from PyQt6.QtCore import Qt
 from datetime import datetime
@@ -51,6 +52,18 @@ def textToEnumName(text: str) -> str:
     return text.replace(" ", "_").upper()
 
 
+def serverKey(baseUrl: str) -> str:
+    """Get a short key separating the locally stored data of each server
+
+    Args:
+        baseUrl (str): The base URL of the server
+
+    Returns:
+        str: The first 12 hex digits of the SHA-1 of the base URL
+    """
+    return hashlib.sha1(baseUrl.rstrip("/").encode("utf-8")).hexdigest()[:12]
+
+
 def getAttribution(source: str) -> str:
     """Get attribution for a source
 
@@ -0,0 +1,624 @@
+from PyQt6.QtGui import QColor, QPixmap
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout
+from typing import Any, List, Tuple, Callable, Hashable, Optional
+from PyQt6.QtCore import Qt, QEvent, QPoint, QTimer, QObject, pyqtSignal
+from qfluentwidgets import (
+    CheckBox,
+    BodyLabel,
+    InfoBadge,
+    CardWidget,
+    PushButton,
+    ImageLabel,
+    CaptionLabel,
+    PlainTextEdit,
+    StrongBodyLabel,
+    SmoothScrollArea,
+    PrimaryPushButton,
+    IndeterminateProgressRing,
+)
+
+from app.utils import levelToColor
+from app.controllers.imageDecoder import ImageDecoder
+
+
+class FeedbackCard(CardWidget):
+    """Feedback card displaying question results"""
+
+    def __init__(self, feedbackText: str, performanceLevel: str, parent=None):
+        super().__init__(parent)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 15, 20, 15)
+        layout.setSpacing(12)
+
+        # Feedback
+        title = StrongBodyLabel("Feedback")
+        layout.addWidget(title)
+
+        message = BodyLabel(feedbackText)
+        message.setWordWrap(True)
+        layout.addWidget(message)
+
+        # Performance
+        badgeLayout = QHBoxLayout()
+        badgeLayout.setAlignment(Qt.AlignmentFlag.AlignLeft)
+
+        performanceBadge = self.CreatePerformanceBadge(performanceLevel)
+        badgeLayout.addWidget(performanceBadge)
+        badgeLayout.addStretch()
+
+        layout.addLayout(badgeLayout)
+
+    def CreatePerformanceBadge(self, level: str):
+        """Create a performance badge based on level"""
+        return InfoBadge.custom(level, *levelToColor(level))
+
+
+class BaseQuestionCard(CardWidget):
+    """Base class for question cards"""
+
+    def __init__(self, questionText: str, parent=None):
+        super().__init__(parent)
+        self.setStyleSheet("background-color: transparent;")
+
+        self.mainLayout = QVBoxLayout(self)
+        self.mainLayout.setContentsMargins(25, 20, 25, 20)
+        self.mainLayout.setSpacing(18)
+
+        # Question
+        self.questionLabel = BodyLabel(questionText)
+        self.questionLabel.setWordWrap(True)
+        self.mainLayout.addWidget(self.questionLabel)
+
+        self.contentWidget = None
+
+        # Feedback
+        self.extraWidgetLayout = QVBoxLayout()
+        self.extraWidgetLayout.setSpacing(15)
+
+        self.actionLayout = QHBoxLayout()
+        self.actionLayout.setContentsMargins(0, 25, 0, 0)
+
+        self.leftButtonsLayout = QHBoxLayout()
+        self.leftButtonsLayout.setSpacing(10)
+
+        self.showKeywordsBtn = PushButton("Show Keywords")
+        self.dontKnowBtn = PushButton("I Don't Know")
+
+        self.leftButtonsLayout.addWidget(self.showKeywordsBtn)
+        self.leftButtonsLayout.addWidget(self.dontKnowBtn)
+
+        self.submitBtn = PrimaryPushButton("Submit")
+
+        # Grading
+        self.pendingRing = IndeterminateProgressRing(start=False)
+        self.pendingRing.setFixedSize(20, 20)
+        self.pendingRing.setStrokeWidth(3)
+        self.pendingRing.hide()
+        self.pendingLabel = CaptionLabel("Grading...")
+        self.pendingLabel.setStyleSheet("color: #666666;")
+        self.pendingLabel.hide()
+
+        self.actionLayout.addLayout(self.leftButtonsLayout)
+        self.actionLayout.addStretch()
+        self.actionLayout.addWidget(self.pendingRing)
+        self.actionLayout.addWidget(self.pendingLabel)
+        self.actionLayout.addWidget(self.submitBtn)
+
+    def finalizeLayout(self):
+        """Call this after adding content to finalize the layout"""
+        if self.contentWidget:
+            self.mainLayout.addWidget(self.contentWidget)
+
+        self.mainLayout.addLayout(self.extraWidgetLayout)
+        self.mainLayout.addLayout(self.actionLayout)
+
+    def addExtraWidget(self, widget: QWidget):
+        """Add a widget between content and action buttons"""
+        self.extraWidgetLayout.addWidget(widget)
+
+    def removeExtraWidget(self, widget: QWidget):
+        """Remove a widget from the extra area"""
+        self.extraWidgetLayout.removeWidget(widget)
+        widget.setParent(None)
+
+    def setInputsEnabled(self, enabled: bool):
+        """Enable or disable editing the answer"""
+        pass
+
+    def setPending(self, pending: bool):
+        """Show or hide the grading state while the answer is being graded
+
+        The answer is locked while pending, so the other cards stay usable
+        and the submitted answer cannot change under the grading.
+        """
+        self.setInputsEnabled(not pending)
+        self.submitBtn.setVisible(not pending)
+        self.showKeywordsBtn.setEnabled(not pending)
+        self.dontKnowBtn.setEnabled(not pending)
+        self.pendingRing.setVisible(pending)
+        self.pendingLabel.setText("Grading...")
+        self.pendingLabel.setVisible(pending)
+        if pending:
+            self.pendingRing.start()
+        else:
+            self.pendingRing.stop()
+
+    def setQueued(self):
+        """Show that the answer was saved offline and is sent again later
+
+        The answer stays locked, since it will be graded as it was submitted.
+        """
+        self.setPending(True)
+        self.pendingRing.stop()
+        self.pendingRing.hide()
+        self.pendingLabel.setText("Saved offline, will retry")
+
+    def setSubmitted(self, feedbackText: str, performanceLevel: str):
+        """Lock the card and show the feedback of the graded answer"""
+        self.setPending(False)
+        self.setInputsEnabled(False)
+        self.addExtraWidget(FeedbackCard(feedbackText, performanceLevel))
+        self.submitBtn.hide()
+        self.showKeywordsBtn.hide()
+        self.dontKnowBtn.hide()
+
+    def showKeywords(self, keywords: Optional[List[str]]):
+        """Bold the keywords"""
+        if keywords is None:
+            return
+
+        for keyword in keywords:
+            self.questionLabel.setText(
+                self.questionLabel.text().replace(keyword, f"<b>{keyword}</b>")
+            )
+
+
+class OptionsQuestionCard(BaseQuestionCard):
+    """Question card with checkbox options"""
+
+    def __init__(self, questionText: str, options: list, parent=None):
+        super().__init__(questionText, parent)
+
+        self.contentWidget = QWidget()
+        contentLayout = QVBoxLayout(self.contentWidget)
+        contentLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        contentLayout.setSpacing(15)
+
+        # Image
+        self.imageContainer = QWidget()
+        self.imageContainer.hide()
+
+        imageLayout = QVBoxLayout(self.imageContainer)
+        imageLayout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.imageLabel = AsyncImageLabel(800, square=False)
+        self.imageLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        imageLayout.addWidget(self.imageLabel)
+
+        contentLayout.addWidget(self.imageContainer)
+
+        # Options
+        self.optionsLayout = QHBoxLayout()
+        self.optionsLayout.setContentsMargins(0, 0, 0, 0)
+        self.optionsLayout.setSpacing(8)
+        self.optionsLayout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.checkboxes = []
+        for option in options:
+            checkbox = CheckBox(option, self)
+            self.checkboxes.append(checkbox)
+            self.optionsLayout.addWidget(checkbox)
+
+        contentLayout.addLayout(self.optionsLayout)
+
+        self.finalizeLayout()
+
+    def setImage(self, image: bytes, imageId: Optional[int] = None):
+        """Set the image, it is decoded in the background"""
+        self.imageLabel.setImageData(image, imageId)
+        self.imageContainer.show()
+
+    def hideImage(self):
+        """Hide the image container"""
+        self.imageContainer.hide()
+
+    def getSelectedOptions(self):
+        """Get list of selected options"""
+        selected = []
+        for checkbox in self.checkboxes:
+            if checkbox.isChecked():
+                selected.append(checkbox.text())
+        return selected
+
+    def setSelectedOptions(self, selected: list):
+        """Check the options in a list of selected options"""
+        for checkbox in self.checkboxes:
+            checkbox.setChecked(checkbox.text() in selected)
+
+    def setInputsEnabled(self, enabled: bool):
+        """Enable or disable the options"""
+        for checkbox in self.checkboxes:
+            checkbox.setEnabled(enabled)
+
+
+class TextQuestionCard(BaseQuestionCard):
+    """Question card with text input"""
+
+    def __init__(
+        self,
+        questionText: str,
+        parent=None,
+    ):
+        super().__init__(questionText, parent)
+
+        self.contentWidget = QWidget()
+        contentLayout = QVBoxLayout(self.contentWidget)
+        contentLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        contentLayout.setSpacing(20)
+
+        # Image
+        self.imageContainer = QWidget()
+        self.imageContainer.hide()
+
+        imageLayout = QVBoxLayout(self.imageContainer)
+        imageLayout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.imageLabel = AsyncImageLabel(800, square=False)
+        self.imageLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        imageLayout.addWidget(self.imageLabel)
+
+        contentLayout.addWidget(self.imageContainer)
+
+        # Answer
+        inputContainer = QWidget()
+        inputContainer.setFixedWidth(820)
+
+        inputLayout = QVBoxLayout(inputContainer)
+        inputLayout.setContentsMargins(20, 0, 20, 0)
+
+        self.answerInput = PlainTextEdit()
+        self.answerInput.setPlaceholderText("Please enter your answer here")
+        self.answerInput.setFixedWidth(820)
+
+        inputLayout.addWidget(self.answerInput)
+
+        inputContainerLayout = QHBoxLayout()
+        inputContainerLayout.addStretch()
+        inputContainerLayout.addWidget(inputContainer)
+        inputContainerLayout.addStretch()
+
+        contentLayout.addLayout(inputContainerLayout)
+
+        self.finalizeLayout()
+
+    def setImage(self, image: bytes, imageId: Optional[int] = None):
+        """Set the image, it is decoded in the background"""
+        self.imageLabel.setImageData(image, imageId)
+        self.imageContainer.show()
+
+    def hideImage(self):
+        """Hide the image container"""
+        self.imageContainer.hide()
+
+    def getAnswerText(self):
+        """Get the text from the answer input"""
+        return self.answerInput.toPlainText()
+
+    def setAnswerText(self, text: str):
+        """Set the text in the answer input"""
+        self.answerInput.setPlainText(text)
+
+    def setInputsEnabled(self, enabled: bool):
+        """Make the answer input editable or read only"""
+        self.answerInput.setReadOnly(not enabled)
+
+
+class CardReconciler:
+    """Keep the cards of a layout in sync with a list of payloads keyed by id
+
+    Every reconcile diffs the new payloads against the cards that are already
+    in the layout. Cards whose key disappeared are removed, cards for new keys
+    are created, and existing cards are only touched when their payload
+    changed, so a refresh with mostly identical data rebuilds almost nothing.
+    """
+
+    def __init__(
+        self,
+        layout,
+        createCard: Callable[[Hashable, Any], QWidget],
+        updateCard: Optional[Callable[[QWidget, Hashable, Any], None]] = None,
+        offset: int = 0,
+    ):
+        """
+        Args:
+            layout: The layout holding the cards
+            createCard (Callable[[Hashable, Any], QWidget]): Builds a card
+                from its key and payload
+            updateCard (Optional[Callable[[QWidget, Hashable, Any], None]]):
+                Updates a card in place, cards are replaced when not given
+            offset (int): Number of leading layout items that are not cards
+        """
+        self.layout = layout
+        self.createCard = createCard
+        self.updateCard = updateCard
+        self.offset = offset
+        self.cards = {}  # key -> card
+        self.payloads = {}  # key -> payload
+
+    def reconcile(
+        self, items: List[Tuple[Hashable, Any]]
+    ) -> Tuple[List[QWidget], List[QWidget]]:
+        """Add, update, remove and reorder cards to match the given payloads
+
+        Args:
+            items (List[Tuple[Hashable, Any]]): The (key, payload) pairs in
+                display order
+
+        Returns:
+            Tuple[List[QWidget], List[QWidget]]: The cards that were added and
+                the cards that were removed
+        """
+        added = []
+        removed = []
+
+        keys = set()
+        uniqueItems = []
+        for key, payload in items:
+            if key not in keys:
+                keys.add(key)
+                uniqueItems.append((key, payload))
+
+        for key in [key for key in self.cards if key not in keys]:
+            removed.append(self._removeCard(key))
+
+        for index, (key, payload) in enumerate(uniqueItems):
+            card = self.cards.get(key)
+            if card is None:
+                card = self.createCard(key, payload)
+                added.append(card)
+            elif payload != self.payloads[key]:
+                if self.updateCard is not None:
+                    self.updateCard(card, key, payload)
+                else:
+                    removed.append(self._removeCard(key))
+                    card = self.createCard(key, payload)
+                    added.append(card)
+
+            self.cards[key] = card
+            self.payloads[key] = payload
+
+            position = self.offset + index
+            if self.layout.indexOf(card) != position:
+                if self.layout.indexOf(card) >= 0:
+                    self.layout.removeWidget(card)
+                self.layout.insertWidget(position, card)
+
+        return added, removed
+
+    def clear(self) -> List[QWidget]:
+        """Remove every card
+
+        Returns:
+            List[QWidget]: The removed cards
+        """
+        return [self._removeCard(key) for key in list(self.cards)]
+
+    def _removeCard(self, key: Hashable) -> QWidget:
+        """Remove a card from the layout and schedule its deletion
+
+        Args:
+            key (Hashable): The key of the card
+
+        Returns:
+            QWidget: The removed card
+        """
+        card = self.cards.pop(key)
+        self.payloads.pop(key, None)
+        self.layout.removeWidget(card)
+        card.setParent(None)
+        card.deleteLater()
+        return card
+
+
+class AsyncImageLabel(ImageLabel):
+    """Image label whose image is decoded and scaled off the GUI thread
+
+    The label stays empty until the ImageDecoder has produced the image at the
+    label's size, and only listens to the decoder while it is waiting.
+    """
+
+    def __init__(self, size: int, square: bool = True, parent=None):
+        super().__init__(parent)
+        self.imageSize = size
+        self.square = square
+        self.imageKey = None
+        self._waiting = False
+
+    def setImageData(self, imageData: bytes, imageId: Optional[Hashable] = None):
+        """Show an image once it is decoded
+
+        Args:
+            imageData (bytes): Raw image bytes
+            imageId (Optional[Hashable], optional): The id of the image, None to
+                key it by its data. Defaults to None.
+        """
+        decoder = ImageDecoder.instance()
+        self.imageKey, pixmap = decoder.request(
+            imageId, imageData, self.imageSize, self.square, self.devicePixelRatioF()
+        )
+        if pixmap is not None:
+            self._stopWaiting()
+            self.showPixmap(pixmap)
+        elif not self._waiting:
+            self._waiting = True
+            decoder.imageReady.connect(self._onImageDecoded)
+
+    def showPixmap(self, pixmap: QPixmap):
+        """Show a decoded image at the label's size"""
+        self.setImage(pixmap)
+        if self.square:
+            self.setFixedSize(self.imageSize, self.imageSize)
+        else:
+            self.scaledToWidth(self.imageSize)
+
+    def _onImageDecoded(self, key: tuple, pixmap: QPixmap):
+        if key != self.imageKey:
+            return
+
+        self._stopWaiting()
+        self.showPixmap(pixmap)
+
+    def _stopWaiting(self):
+        if self._waiting:
+            self._waiting = False
+            ImageDecoder.instance().imageReady.disconnect(self._onImageDecoded)
+
+
+class LazyImageLabel(AsyncImageLabel):
+    """Square thumbnail that shows a placeholder until its image is loaded"""
+
+    def __init__(self, imageId: int, size: int = 80, parent=None):
+        super().__init__(size, parent=parent)
+        self.imageId = imageId
+        self.thumbnailSize = size
+        self.isLoaded = False
+        self.showPlaceholder()
+
+    def showPlaceholder(self):
+        """Show the placeholder and release the thumbnail"""
+        self._stopWaiting()
+        placeholder = QPixmap(self.thumbnailSize, self.thumbnailSize)
+        placeholder.fill(QColor("#f0f0f0"))
+        self.setImage(placeholder)
+        self.isLoaded = False
+
+    def showCached(self) -> bool:
+        """Show the thumbnail right away if it was decoded before
+
+        Returns:
+            bool: Whether the thumbnail was cached
+        """
+        pixmap = ImageDecoder.instance().cached(
+            ImageDecoder.makeKey(
+                self.imageId, None, self.thumbnailSize, True, self.devicePixelRatioF()
+            )
+        )
+        if pixmap is None:
+            return False
+
+        self.showPixmap(pixmap)
+        return True
+
+    def setImageData(self, imageData: bytes):
+        """Show the thumbnail for the given image data
+
+        Args:
+            imageData (bytes): Raw image bytes
+        """
+        super().setImageData(imageData, self.imageId)
+
+    def showPixmap(self, pixmap: QPixmap):
+        super().showPixmap(pixmap)
+        self.isLoaded = True
+
+
+class LazyImageLoader(QObject):
+    """Request thumbnails only when they scroll into a scroll area's viewport
+
+    Thumbnails that scroll far away are reset to their placeholder again, so
+    only the images around the visible part of the list are kept in memory.
+    """
+
+    imageRequested = pyqtSignal(int)  # imageId
+
+    def __init__(self, scrollArea: SmoothScrollArea, preloadScreens: float = 1.0):
+        super().__init__(scrollArea)
+        self.scrollArea = scrollArea
+        self.preloadScreens = preloadScreens
+        self.labels = []
+        self.requestedImageIds = set()
+
+        self.checkTimer = QTimer(self)
+        self.checkTimer.setSingleShot(True)
+        self.checkTimer.setInterval(50)
+        self.checkTimer.timeout.connect(self.checkVisibleLabels)
+
+        self.scrollArea.verticalScrollBar().valueChanged.connect(self.scheduleCheck)
+        self.scrollArea.verticalScrollBar().rangeChanged.connect(self.scheduleCheck)
+        self.scrollArea.viewport().installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        """Re-check visible thumbnails when the viewport is resized or shown"""
+        if event.type() in (QEvent.Type.Resize, QEvent.Type.Show):
+            self.scheduleCheck()
+        return super().eventFilter(obj, event)
+
+    def register(self, labels: List[LazyImageLabel]):
+        """Track thumbnails and load the ones that are already visible
+
+        Args:
+            labels (List[LazyImageLabel]): The thumbnails to track
+        """
+        self.labels.extend(labels)
+        self.scheduleCheck()
+
+    def unregister(self, labels: List[LazyImageLabel]):
+        """Stop tracking the given thumbnails
+
+        Args:
+            labels (List[LazyImageLabel]): The thumbnails to forget
+        """
+        labels = set(labels)
+        self.labels = [label for label in self.labels if label not in labels]
+
+    def clear(self):
+        """Stop tracking every thumbnail"""
+        self.labels.clear()
+        self.requestedImageIds.clear()
+
+    def scheduleCheck(self, *args):
+        """Check visible thumbnails once scrolling settles"""
+        self.checkTimer.start()
+
+    def checkVisibleLabels(self):
+        """Request visible thumbnails and release distant ones"""
+        if not self.scrollArea.isVisible():
+            return
+
+        viewport = self.scrollArea.viewport()
+        viewportHeight = viewport.height()
+        margin = int(viewportHeight * self.preloadScreens)
+
+        for label in self.labels:
+            top = label.mapTo(viewport, QPoint(0, 0)).y()
+            bottom = top + label.height()
+
+            if bottom >= -margin and top <= viewportHeight + margin:
+                if (
+                    label.isLoaded
+                    or label.imageId in self.requestedImageIds
+                    or label.showCached()
+                ):
+                    continue
+                self.requestedImageIds.add(label.imageId)
+                self.imageRequested.emit(label.imageId)
+            elif label.isLoaded and (
+                bottom < -3 * margin or top > viewportHeight + 3 * margin
+            ):
+                label.showPlaceholder()
+
+    def onImageLoaded(self, imageId: int, imageData: bytes):
+        """Show a loaded image on every visible thumbnail waiting for it
+
+        Args:
+            imageId (int): The id of the image
+            imageData (bytes): Raw image bytes
+        """
+        if imageId not in self.requestedImageIds:
+            return
+
+        self.requestedImageIds.discard(imageId)
+        for label in self.labels:
+            if label.imageId == imageId and not label.isLoaded:
+                label.setImageData(imageData)
@@ -1,5 +1,5 @@
 import keyring
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QThreadPool, QTimer, pyqtSignal
 from qframelesswindow import FramelessWindow
 from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QWidget
 from qfluentwidgets import (
@@ -21,6 +21,10 @@ class SignInDialog(FramelessWindow):
 
     signinRequested = pyqtSignal(str, str, bool)  # username, password, remember
     signupRequested = pyqtSignal()
+    # after the first paint and whenever the user types, while nothing else happens
+    warmUpRequested = pyqtSignal()
+
+    _savedCredentialsLoaded = pyqtSignal(str, str)  # username, password
 
     KEYRING_SERVICE = "NanokoClient"
     KEYRING_USERNAME_KEY = "username"
@@ -31,7 +35,11 @@ class SignInDialog(FramelessWindow):
         super().__init__(parent)
         setTheme(Theme.LIGHT)
         self.setupUi()
-        self._loadSavedCredentials()
+        self._painted = False
+
+        # the keyring can be slow to unlock, so it is read in the background
+        self._savedCredentialsLoaded.connect(self._showSavedCredentials)
+        QThreadPool.globalInstance().start(self._loadSavedCredentials)
 
     def setupUi(self):
         """Set up the user interface using qfluentwidgets"""
@@ -128,9 +136,17 @@ class SignInDialog(FramelessWindow):
 
         self.usernameInput.returnPressed.connect(self.handleSignin)
         self.passwordInput.returnPressed.connect(self.handleSignin)
+        self.usernameInput.textEdited.connect(self.warmUpRequested)
+        self.passwordInput.textEdited.connect(self.warmUpRequested)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            QTimer.singleShot(0, self.warmUpRequested.emit)
 
     def _loadSavedCredentials(self):
-        """Load saved credentials if they exist"""
+        """Load saved credentials if they exist, on a background thread"""
         try:
             rememberEnabled = keyring.get_password(
                 self.KEYRING_SERVICE, self.KEYRING_REMEMBER_KEY
@@ -144,11 +160,23 @@ class SignInDialog(FramelessWindow):
                 )
 
                 if username and password:
-                    self.usernameInput.setText(username)
-                    self.passwordInput.setText(password)
-                    self.rememberCheckbox.setChecked(True)
-        except Exception:
-            pass
+                    self._savedCredentialsLoaded.emit(username, password)
+        except Exception as e:
+            print(f"[SignInDialog] Could not load saved credentials: {e}")
+
+    def _showSavedCredentials(self, username: str, password: str):
+        """Fill in the saved credentials unless the user has started typing
+
+        Args:
+            username (str): The saved username
+            password (str): The saved password
+        """
+        if self.usernameInput.text() or self.passwordInput.text():
+            return
+
+        self.usernameInput.setText(username)
+        self.passwordInput.setText(password)
+        self.rememberCheckbox.setChecked(True)
 
     def _saveCredentials(self, username, password):
         """Save credentials to keyring
@@ -220,13 +248,13 @@ class SignInDialog(FramelessWindow):
             self.usernameInput.setFocus()
             return
 
+        self.signinRequested.emit(username, password, remember)
+
         if not remember:
             self._clearSavedCredentials()
         else:
             self._saveCredentials(username, password)
 
-        self.signinRequested.emit(username, password, remember)
-
     def handleSignup(self):
         """Handle sign-up link click"""
         self.signupRequested.emit()
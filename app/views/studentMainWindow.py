@@ -1,28 +1,41 @@
 from datetime import datetime
 from PyQt6.QtGui import QColor
-from typing import Optional, List
+from typing import List, Tuple, Optional
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QPixmap, QImage, QIcon
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QEasingCurve
+from PyQt6.QtGui import QPixmap, QIcon, QFont, QPen, QPainter, QFontMetrics
+from PyQt6.QtCore import (
+    Qt,
+    QSize,
+    QRect,
+    QRectF,
+    QTimer,
+    pyqtSignal,
+    QModelIndex,
+    QEasingCurve,
+    QAbstractListModel,
+)
 from PyQt6.QtWidgets import (
+    QStyle,
     QWidget,
+    QListView,
     QHBoxLayout,
     QVBoxLayout,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
 )
 from qfluentwidgets import (
     Theme,
     InfoBar,
     LineEdit,
     setTheme,
-    CheckBox,
     BodyLabel,
-    InfoBadge,
     CardWidget,
+    getFont,
+    themeColor,
     TitleLabel,
     FlowLayout,
     PushButton,
     FluentIcon,
-    ImageLabel,
     CaptionLabel,
     SplashScreen,
     FluentWindow,
@@ -33,11 +46,21 @@ from qfluentwidgets import (
     InfoBarPosition,
     SmoothScrollArea,
     PrimaryPushButton,
+    SmoothScrollDelegate,
     TransparentToolButton,
 )
 
-from app.utils import levelToColor, cropImageToSquare
+from app.utils import levelToColor
+from app.controllers.imageDecoder import ImageDecoder
 from app.controllers.studentController import StudentController
+from app.controllers.viewModels import AssignmentVM, QuestionVM, SubQuestionVM
+from app.views.components import (
+    FeedbackCard,
+    CardReconciler,
+    BaseQuestionCard,
+    TextQuestionCard,
+    OptionsQuestionCard,
+)
 
 
 class ClassCard(CardWidget):
@@ -224,7 +247,7 @@ class StatsCard(CardWidget):
             statLayout.setContentsMargins(0, 0, 0, 0)
 
             labelWidget = StrongBodyLabel(label)
-            valueWidget = StrongBodyLabel(value)
+            valueWidget = StrongBodyLabel(str(value))
 
             statLayout.addWidget(labelWidget)
             statLayout.addWidget(valueWidget)
@@ -501,237 +524,6 @@ class AssignmentCard(CardWidget):
         super().mousePressEvent(event)
 
 
-class FeedbackCard(CardWidget):
-    """Feedback card displaying question results"""
-
-    def __init__(self, feedbackText: str, performanceLevel: str, parent=None):
-        super().__init__(parent)
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 15, 20, 15)
-        layout.setSpacing(12)
-
-        # Feedback
-        title = StrongBodyLabel("Feedback")
-        layout.addWidget(title)
-
-        message = BodyLabel(feedbackText)
-        message.setWordWrap(True)
-        layout.addWidget(message)
-
-        # Performance
-        badgeLayout = QHBoxLayout()
-        badgeLayout.setAlignment(Qt.AlignmentFlag.AlignLeft)
-
-        performanceBadge = self.CreatePerformanceBadge(performanceLevel)
-        badgeLayout.addWidget(performanceBadge)
-        badgeLayout.addStretch()
-
-        layout.addLayout(badgeLayout)
-
-    def CreatePerformanceBadge(self, level: str):
-        """Create a performance badge based on level"""
-        return InfoBadge.custom(level, *levelToColor(level))
-
-
-class BaseQuestionCard(CardWidget):
-    """Base class for question cards"""
-
-    def __init__(self, questionText: str, parent=None):
-        super().__init__(parent)
-        self.setStyleSheet("background-color: transparent;")
-
-        self.mainLayout = QVBoxLayout(self)
-        self.mainLayout.setContentsMargins(25, 20, 25, 20)
-        self.mainLayout.setSpacing(18)
-
-        # Question
-        self.questionLabel = BodyLabel(questionText)
-        self.questionLabel.setWordWrap(True)
-        self.mainLayout.addWidget(self.questionLabel)
-
-        self.contentWidget = None
-
-        # Feedback
-        self.extraWidgetLayout = QVBoxLayout()
-        self.extraWidgetLayout.setSpacing(15)
-
-        self.actionLayout = QHBoxLayout()
-        self.actionLayout.setContentsMargins(0, 25, 0, 0)
-
-        self.leftButtonsLayout = QHBoxLayout()
-        self.leftButtonsLayout.setSpacing(10)
-
-        self.showKeywordsBtn = PushButton("Show Keywords")
-        self.dontKnowBtn = PushButton("I Don't Know")
-
-        self.leftButtonsLayout.addWidget(self.showKeywordsBtn)
-        self.leftButtonsLayout.addWidget(self.dontKnowBtn)
-
-        self.submitBtn = PrimaryPushButton("Submit")
-
-        self.actionLayout.addLayout(self.leftButtonsLayout)
-        self.actionLayout.addStretch()
-        self.actionLayout.addWidget(self.submitBtn)
-
-    def finalizeLayout(self):
-        """Call this after adding content to finalize the layout"""
-        if self.contentWidget:
-            self.mainLayout.addWidget(self.contentWidget)
-
-        self.mainLayout.addLayout(self.extraWidgetLayout)
-        self.mainLayout.addLayout(self.actionLayout)
-
-    def addExtraWidget(self, widget: QWidget):
-        """Add a widget between content and action buttons"""
-        self.extraWidgetLayout.addWidget(widget)
-
-    def removeExtraWidget(self, widget: QWidget):
-        """Remove a widget from the extra area"""
-        self.extraWidgetLayout.removeWidget(widget)
-        widget.setParent(None)
-
-    def showKeywords(self, keywords: Optional[List[str]]):
-        """Bold the keywords"""
-        if keywords is None:
-            return
-
-        for keyword in keywords:
-            self.questionLabel.setText(
-                self.questionLabel.text().replace(keyword, f"<b>{keyword}</b>")
-            )
-
-
-class OptionsQuestionCard(BaseQuestionCard):
-    """Question card with checkbox options"""
-
-    def __init__(self, questionText: str, options: list, parent=None):
-        super().__init__(questionText, parent)
-
-        self.contentWidget = QWidget()
-        contentLayout = QVBoxLayout(self.contentWidget)
-        contentLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        contentLayout.setSpacing(15)
-
-        # Image
-        self.imageContainer = QWidget()
-        self.imageContainer.hide()
-
-        imageLayout = QVBoxLayout(self.imageContainer)
-        imageLayout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        self.imageLabel = ImageLabel()
-        self.imageLabel.scaledToWidth(800)
-        self.imageLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        imageLayout.addWidget(self.imageLabel)
-
-        contentLayout.addWidget(self.imageContainer)
-
-        # Options
-        self.optionsLayout = QHBoxLayout()
-        self.optionsLayout.setContentsMargins(0, 0, 0, 0)
-        self.optionsLayout.setSpacing(8)
-        self.optionsLayout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        self.checkboxes = []
-        for option in options:
-            checkbox = CheckBox(option, self)
-            self.checkboxes.append(checkbox)
-            self.optionsLayout.addWidget(checkbox)
-
-        contentLayout.addLayout(self.optionsLayout)
-
-        self.finalizeLayout()
-
-    def setImage(self, image: bytes):
-        """Set the image"""
-        self.imageLabel.setPixmap(QPixmap.fromImage(QImage.fromData(image)))
-        self.imageLabel.scaledToWidth(800)
-        self.imageContainer.show()
-
-    def hideImage(self):
-        """Hide the image container"""
-        self.imageContainer.hide()
-
-    def getSelectedOptions(self):
-        """Get list of selected options"""
-        selected = []
-        for checkbox in self.checkboxes:
-            if checkbox.isChecked():
-                selected.append(checkbox.text())
-        return selected
-
-
-class TextQuestionCard(BaseQuestionCard):
-    """Question card with text input"""
-
-    def __init__(
-        self,
-        questionText: str,
-        parent=None,
-    ):
-        super().__init__(questionText, parent)
-
-        self.contentWidget = QWidget()
-        contentLayout = QVBoxLayout(self.contentWidget)
-        contentLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        contentLayout.setSpacing(20)
-
-        # Image
-        self.imageContainer = QWidget()
-        self.imageContainer.hide()
-
-        imageLayout = QVBoxLayout(self.imageContainer)
-        imageLayout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        self.imageLabel = ImageLabel()
-        self.imageLabel.scaledToWidth(800)
-        self.imageLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        imageLayout.addWidget(self.imageLabel)
-
-        contentLayout.addWidget(self.imageContainer)
-
-        # Answer
-        inputContainer = QWidget()
-        inputContainer.setFixedWidth(820)
-
-        inputLayout = QVBoxLayout(inputContainer)
-        inputLayout.setContentsMargins(20, 0, 20, 0)
-
-        self.answerInput = PlainTextEdit()
-        self.answerInput.setPlaceholderText("Please enter your answer here")
-        self.answerInput.setFixedWidth(820)
-
-        inputLayout.addWidget(self.answerInput)
-
-        inputContainerLayout = QHBoxLayout()
-        inputContainerLayout.addStretch()
-        inputContainerLayout.addWidget(inputContainer)
-        inputContainerLayout.addStretch()
-
-        contentLayout.addLayout(inputContainerLayout)
-
-        self.finalizeLayout()
-
-    def setImage(self, image: bytes):
-        """Set the image"""
-        self.imageLabel.setPixmap(QPixmap.fromImage(QImage.fromData(image)))
-        self.imageLabel.scaledToWidth(800)
-        self.imageContainer.show()
-
-    def hideImage(self):
-        """Hide the image container"""
-        self.imageContainer.hide()
-
-    def getAnswerText(self):
-        """Get the text from the answer input"""
-        return self.answerInput.toPlainText()
-
-    def setAnswerText(self, text: str):
-        """Set the text in the answer input"""
-        self.answerInput.setPlainText(text)
-
-
 class AskAIPanel(CardWidget):
     """AI assistant panel that appears when user clicks 'I don't know'"""
 
@@ -795,6 +587,9 @@ class AskAIPanel(CardWidget):
         self.chatLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
         self.chatHistory = []
+        self.streamingLabel = None
+        self.pendingRequestId = None  # the request whose reply is shown
+        self.awaitingReply = False
 
         self.addAIMessage(
             "Hi! I'm here to help you with this question. What would you like to know?"
@@ -846,11 +641,17 @@ class AskAIPanel(CardWidget):
     def _onSendClicked(self):
         """Handle send button click"""
         message = self.messageInput.toPlainText().strip()
-        if message:
+        if message and not self.awaitingReply:
             self.addUserMessage(message)
             self.messageInput.clear()
+            self._setAwaitingReply(True)
             self.sendMessage.emit(message, self.chatHistory)
 
+    def _setAwaitingReply(self, awaiting: bool):
+        """Block sending another message until the current reply is complete"""
+        self.awaitingReply = awaiting
+        self.sendButton.setEnabled(not awaiting)
+
     def addUserMessage(self, message: str):
         """Add a user message to the chat"""
         messageWidget = self._createMessageWidget(message, isUser=True)
@@ -865,6 +666,61 @@ class AskAIPanel(CardWidget):
         self.chatHistory.append({"role": "assistant", "content": message})
         self._scrollToBottom()
 
+    def appendAIMessageChunk(self, requestId: int, chunk: str):
+        """Append a streamed chunk to the AI message that is being received
+
+        Args:
+            requestId (int): The request the chunk belongs to, chunks of other
+                requests are ignored
+            chunk (str): The text chunk
+        """
+        if requestId != self.pendingRequestId:
+            return
+
+        if self.streamingLabel is None:
+            messageWidget = self._createMessageWidget("", isUser=False)
+            self.chatLayout.addWidget(messageWidget)
+            self.streamingLabel = messageWidget.messageLabel
+
+        self.streamingLabel.setText(self.streamingLabel.text() + chunk)
+        self._scrollToBottom()
+
+    def finishAIMessage(self, requestId: int, message: str):
+        """Complete the AI message that is being received
+
+        Args:
+            requestId (int): The request the message answers, messages of other
+                requests are ignored
+            message (str): The full message, added as a new message if nothing
+                was streamed
+        """
+        if requestId != self.pendingRequestId:
+            return
+
+        self.pendingRequestId = None
+        self._setAwaitingReply(False)
+        if self.streamingLabel is None:
+            self.addAIMessage(message)
+            return
+
+        self.streamingLabel.setText(message)
+        self.streamingLabel = None
+        self.chatHistory.append({"role": "assistant", "content": message})
+        self._scrollToBottom()
+
+    def failAIMessage(self, requestId: int):
+        """Let the user send again after the AI message could not be received
+
+        Args:
+            requestId (int): The request that failed
+        """
+        if requestId != self.pendingRequestId:
+            return
+
+        self.pendingRequestId = None
+        self.streamingLabel = None
+        self._setAwaitingReply(False)
+
     def _createMessageWidget(self, message: str, isUser: bool):
         """Create a message widget"""
         messageContainer = QWidget()
@@ -886,6 +742,7 @@ class AskAIPanel(CardWidget):
             containerLayout.addWidget(messageLabel)
             containerLayout.addStretch()
 
+        messageContainer.messageLabel = messageLabel
         return messageContainer
 
     def _scrollToBottom(self):
@@ -901,6 +758,9 @@ class AskAIPanel(CardWidget):
 
     def _clearChat(self):
         """Clear the chat area"""
+        self.streamingLabel = None
+        self.pendingRequestId = None
+        self._setAwaitingReply(False)
         while self.chatLayout.count() > 1:
             item = self.chatLayout.takeAt(1)
             if item.widget():
@@ -1032,15 +892,11 @@ class ClassInterface(QWidget):
         todoTitle.setStyleSheet("color: #333333; font-weight: 600;")
         todoLayout.addWidget(todoTitle)
 
-        for assignment in self.todoAssignments:
-            card = AssignmentCard(
-                assignment["id"],
-                assignment["name"],
-                assignment["due_date"],
-                assignment["description"],
-                assignment.get("image", None),
-            )
-            todoLayout.addWidget(card)
+        self.todoCards = CardReconciler(
+            todoLayout,
+            lambda _, assignment: self._createAssignmentCard(assignment, True),
+            offset=1,
+        )
 
         # Done
         doneLayout = QVBoxLayout()
@@ -1052,22 +908,18 @@ class ClassInterface(QWidget):
         doneTitle.setStyleSheet("color: #333333; font-weight: 600;")
         doneLayout.addWidget(doneTitle)
 
-        for assignment in self.doneAssignments:
-            card = AssignmentCard(
-                assignment["id"],
-                assignment["name"],
-                assignment["due_date"],
-                assignment["description"],
-                assignment.get("image", None),
-            )
-            doneLayout.addWidget(card)
+        self.doneCards = CardReconciler(
+            doneLayout,
+            lambda _, assignment: self._createAssignmentCard(assignment, False),
+            offset=1,
+        )
 
         contentLayout.addLayout(todoLayout, 1)
         contentLayout.addLayout(doneLayout, 1)
 
         mainLayout.addLayout(contentLayout)
 
-        self._connectAssignmentSignals()
+        self._updateAssignmentSections()
 
     def _onJoinClassClicked(self):
         """Handle join class button click"""
@@ -1088,74 +940,32 @@ class ClassInterface(QWidget):
         if hasattr(self, "createdLabel"):
             self.createdLabel.setText(f"Created by {self.teacherName}")
 
-        if (
-            hasattr(self, "mainLayout")
-            and self.mainLayout is not None
-            and self.findChild(QVBoxLayout, "todoLayout") is not None
-        ):
+        if hasattr(self, "todoCards"):
             self._updateAssignmentSections()
 
-    def _connectAssignmentSignals(self):
-        """Connect signals for assignment cards after creating the interface"""
-        todoLayout = self.findChild(QVBoxLayout, "todoLayout")
-        doneLayout = self.findChild(QVBoxLayout, "doneLayout")
-
-        if todoLayout is not None:
-            self._connectAssignmentCardsInLayout(todoLayout, True)
-        if doneLayout is not None:
-            self._connectAssignmentCardsInLayout(doneLayout, False)
-
     def _updateAssignmentSections(self):
-        """Update assignment cards in todo and done sections"""
-        todoLayout = self.findChild(QVBoxLayout, "todoLayout")
-        doneLayout = self.findChild(QVBoxLayout, "doneLayout")
-
-        if todoLayout is not None:
-            self._clearAndAddAssignments(todoLayout, self.todoAssignments, True)
-        if doneLayout is not None:
-            self._clearAndAddAssignments(doneLayout, self.doneAssignments, False)
-
-    def _connectAssignmentCardsInLayout(self, layout, isTodo):
-        """Connect signals for assignment cards in a specific layout"""
-        if layout is None:
-            return
-
-        for i in range(1, layout.count()):
-            item = layout.itemAt(i)
-            if item and item.widget() and isinstance(item.widget(), AssignmentCard):
-                card = item.widget()
-                try:
-                    card.assignmentClicked.disconnect()
-                except Exception:
-                    pass
-
-                if isTodo:
-                    card.assignmentClicked.connect(self.assignmentClicked.emit)
-                else:
-                    card.assignmentClicked.connect(self.doneAssignmentClicked.emit)
-
-    def _clearAndAddAssignments(self, layout, assignments, isTodo):
-        """Clear existing assignment cards and add new ones"""
-        if layout is None:
-            return
-
-        while layout.count() > 1:
-            item = layout.takeAt(1)
-            if item and item.widget():
-                item.widget().deleteLater()
-                item.widget().setParent(None)
-
-        for assignment in assignments:
-            card = AssignmentCard(
-                assignment["id"],
-                assignment["name"],
-                assignment["due_date"],
-                assignment["description"],
-                assignment.get("image", None),
-            )
-            layout.addWidget(card)
+        """Reconcile the assignment cards in the todo and done sections"""
+        self.todoCards.reconcile(
+            [(assignment["id"], assignment) for assignment in self.todoAssignments]
+        )
+        self.doneCards.reconcile(
+            [(assignment["id"], assignment) for assignment in self.doneAssignments]
+        )
 
-        self._connectAssignmentCardsInLayout(layout, isTodo)
+    def _createAssignmentCard(self, assignment: dict, isTodo: bool) -> AssignmentCard:
+        """Create an assignment card connected to the matching click signal"""
+        card = AssignmentCard(
+            assignment["id"],
+            assignment["name"],
+            assignment["due_date"],
+            assignment["description"],
+            assignment.get("image", None),
+        )
+        if isTodo:
+            card.assignmentClicked.connect(self.assignmentClicked.emit)
+        else:
+            card.assignmentClicked.connect(self.doneAssignmentClicked.emit)
+        return card
 
 
 class HomeInterface(QWidget):
@@ -1219,24 +1029,8 @@ class HomeInterface(QWidget):
         flowLayout.setVerticalSpacing(20)
         flowLayout.setHorizontalSpacing(10)
 
-        # Class card
-        if self.className is None:
-            joinClassCard = JoinClassCard()
-            joinClassCard.joinClassClicked.connect(self._onJoinClassClicked)
-            flowLayout.addWidget(joinClassCard)
-        else:
-            classCard = ClassCard(self.className, self.assignments)
-            classCard.clicked.connect(self.classClicked.emit)
-            flowLayout.addWidget(classCard)
-
-        # Stats card
-        if self.className is not None:
-            statsCard = StatsCard(self.stats)
-            flowLayout.addWidget(statsCard)
-
-            # Numeracy matrix card
-            matrixCard = NumeracyMatrixCard(self.matrix, self.displayName)
-            flowLayout.addWidget(matrixCard)
+        self.cards = CardReconciler(flowLayout, self._createCard, self._updateCard)
+        self._reconcileCards()
 
         mainLayout.addLayout(flowLayout)
         mainLayout.addStretch(1)
@@ -1260,152 +1054,438 @@ class HomeInterface(QWidget):
         self.matrix = dashboardData.get("matrix", [[0] * 3 for _ in range(7)])
         self.displayName = dashboardData.get("display_name", "Loading...")
 
-        for child in self.findChildren(FlowLayout):
-            flowLayout = child
-
-            while flowLayout.count() > 0:
-                item = flowLayout.takeAt(0)
-                if item:
-                    if hasattr(item, "widget"):
-                        widget = item.widget()
-                    else:
-                        widget = item
-                    if widget:
-                        widget.setParent(None)
-                        widget.deleteLater()
-
-            if self.className is None:
-                joinClassCard = JoinClassCard()
-                joinClassCard.joinClassClicked.connect(self._onJoinClassClicked)
-                flowLayout.addWidget(joinClassCard)
-            else:
-                classCard = ClassCard(self.className, self.assignments)
-                classCard.clicked.connect(self.classClicked.emit)
-                flowLayout.addWidget(classCard)
+        self._reconcileCards()
+
+    def _reconcileCards(self):
+        """Reconcile the dashboard cards with the current data"""
+        if self.className is None:
+            self.cards.reconcile([("join", None)])
+        else:
+            self.cards.reconcile(
+                [
+                    ("class", (self.className, self.assignments)),
+                    ("stats", self.stats),
+                    ("matrix", (self.matrix, self.displayName)),
+                ]
+            )
+
+    def _createCard(self, key: str, payload) -> QWidget:
+        """Create the dashboard card for a key"""
+        match key:
+            case "join":
+                card = JoinClassCard()
+                card.joinClassClicked.connect(self._onJoinClassClicked)
+            case "class":
+                card = ClassCard(*payload)
+                card.clicked.connect(self.classClicked.emit)
+            case "stats":
+                card = StatsCard(payload)
+            case "matrix":
+                card = NumeracyMatrixCard(*payload)
+        return card
+
+    def _updateCard(self, card: QWidget, key: str, payload):
+        """Update a dashboard card in place"""
+        match key:
+            case "class":
+                className, assignments = payload
+                card.title.setText(className)
+                card.setAssignments(assignments)
+            case "stats":
+                card.setStats(payload)
+            case "matrix":
+                card.setAttributes(*payload)
+
+
+class QuestionListModel(QAbstractListModel):
+    """List model of completed questions with lazily loaded thumbnails
+
+    Thumbnails are requested the first time a row that shows them is painted
+    and decoded in the background into the ImageDecoder's bounded cache, so
+    only the images around the visible rows are decoded and held in memory.
+    """
+
+    imageRequested = pyqtSignal(int)  # imageId
+
+    QuestionRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, questionsData: list = None, parent=None):
+        super().__init__(parent)
+        self.questionsData = []
+        self.requestedImageIds = set()
+        self._imageRows = {}  # imageId -> rows
+        self.setQuestions(questionsData or [])
+
+        ImageDecoder.instance().imageReady.connect(self._onThumbnailDecoded)
+        ImageDecoder.instance().imageFailed.connect(self._onThumbnailFailed)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.questionsData)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.questionsData):
+            return None
+
+        questionGroup = self.questionsData[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return questionGroup["title"]
+        if role == self.QuestionRole:
+            return questionGroup
+        return None
+
+    def setQuestions(self, questionsData: list):
+        """Replace the questions shown by the model
+
+        Args:
+            questionsData (list): The question groups to show
+        """
+        self.beginResetModel()
+        self.questionsData = list(questionsData)
+        self._imageRows = {}
+        for row, questionGroup in enumerate(self.questionsData):
+            for subQuestion in questionGroup["sub_questions"]:
+                imageId = subQuestion.get("image_id", None)
+                if imageId is not None:
+                    self._imageRows.setdefault(imageId, set()).add(row)
+        self.endResetModel()
+
+    def thumbnail(self, imageId: int) -> Optional[QPixmap]:
+        """Get the thumbnail of an image, requesting it when it is not loaded
+
+        Args:
+            imageId (int): The id of the image
+
+        Returns:
+            Optional[QPixmap]: The thumbnail, or None while it is loading
+        """
+        pixmap = ImageDecoder.instance().cached(
+            ImageDecoder.makeKey(imageId, None, QuestionCardDelegate.IMAGE_SIZE)
+        )
+        if pixmap is not None:
+            return pixmap
+
+        if imageId not in self.requestedImageIds:
+            self.requestedImageIds.add(imageId)
+            self.imageRequested.emit(imageId)
+        return None
+
+    def onImageLoaded(self, imageId: int, imageData: bytes):
+        """Decode a loaded thumbnail and repaint the rows showing it
+
+        Args:
+            imageId (int): The id of the image
+            imageData (bytes): Raw image bytes
+        """
+        if imageId not in self.requestedImageIds:
+            return
+        if not imageData:
+            # the download failed, let the next paint request it again
+            self.requestedImageIds.discard(imageId)
+            return
 
-                statsCard = StatsCard(self.stats)
-                flowLayout.addWidget(statsCard)
+        key, pixmap = ImageDecoder.instance().request(
+            imageId, imageData, QuestionCardDelegate.IMAGE_SIZE
+        )
+        if pixmap is not None:
+            self._onThumbnailDecoded(key, pixmap)
+
+    def _onThumbnailDecoded(self, key: tuple, pixmap: QPixmap):
+        """Repaint the rows showing a thumbnail once it is decoded"""
+        imageId, size = key[0], key[1]
+        if imageId not in self.requestedImageIds or (
+            size != QuestionCardDelegate.IMAGE_SIZE
+        ):
+            return
 
-                matrixCard = NumeracyMatrixCard(self.matrix, self.displayName)
-                flowLayout.addWidget(matrixCard)
-            break
+        self.requestedImageIds.discard(imageId)
+        for row in self._imageRows.get(imageId, ()):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [self.QuestionRole])
 
+    def _onThumbnailFailed(self, key: tuple):
+        """Forget a thumbnail that could not be decoded so it can be requested again"""
+        if key[1] == QuestionCardDelegate.IMAGE_SIZE:
+            self.requestedImageIds.discard(key[0])
 
-class QuestionCard(CardWidget):
-    """Individual question card displaying question information"""
 
-    questionClicked = pyqtSignal(int)  # questionId
+class QuestionCardDelegate(QStyledItemDelegate):
+    """Paint completed questions as cards without creating any widgets
 
-    def __init__(
-        self,
-        questionId: int,
-        question: str,
-        subQuestions: list,
-        footerText: str = None,
-        parent=None,
-    ):
+    The card layout mirrors the widget based question cards: a title with a
+    divider, one block per sub-question with its tags and thumbnail, and an
+    optional footer. Row heights are cached per question and card width.
+    """
+
+    CARD_WIDTH = 760
+    MARGIN = 25
+    ROW_SPACING = 20
+    PADDING = 20
+    SPACING = 15
+    IMAGE_SIZE = 80
+    TAG_HEIGHT = 20
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.questionId = questionId
-        self.setStyleSheet("background-color: white; border-radius: 8px;")
-        self.setFixedWidth(760)
+        self.titleFont = getFont(20, QFont.Weight.DemiBold)
+        self.subTitleFont = getFont(14, QFont.Weight.DemiBold)
+        self.textFont = getFont(14)
+        self.tagFont = getFont(12, QFont.Weight.DemiBold)
+        self.footerFont = getFont(11)
+        self._heights = {}  # (row, cardWidth) -> height
+
+    def clearCache(self):
+        """Forget the cached row heights"""
+        self._heights.clear()
+
+    def cardWidth(self, option: QStyleOptionViewItem) -> int:
+        """Get the width of a card in the given view
+
+        Args:
+            option (QStyleOptionViewItem): The style option of the row
+
+        Returns:
+            int: The card width
+        """
+        view = self.parent()
+        available = view.viewport().width() if view else option.rect.width()
+        return max(200, min(self.CARD_WIDTH, available - 2 * self.MARGIN))
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        width = self.cardWidth(option)
+        key = (index.row(), width)
+        height = self._heights.get(key)
+        if height is None:
+            questionGroup = index.data(QuestionListModel.QuestionRole)
+            height = self._layoutCard(None, QRect(0, 0, width, 0), questionGroup, None)
+            self._heights[key] = height
+        return QSize(width + 2 * self.MARGIN, height + self.ROW_SPACING)
+
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex
+    ):
+        questionGroup = index.data(QuestionListModel.QuestionRole)
+        if questionGroup is None:
+            return
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 20, 20, 20)
-        layout.setSpacing(15)
+        width = self.cardWidth(option)
+        cardRect = QRect(
+            option.rect.x() + self.MARGIN,
+            option.rect.y(),
+            width,
+            option.rect.height() - self.ROW_SPACING,
+        )
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        hovered = option.state & QStyle.StateFlag.State_MouseOver
+        painter.setPen(QPen(QColor("#e5e5e5"), 1))
+        painter.setBrush(QColor("#fafafa") if hovered else QColor("white"))
+        painter.drawRoundedRect(QRectF(cardRect).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+
+        self._layoutCard(painter, cardRect, questionGroup, index.model())
+        painter.restore()
+
+    def _textHeight(self, font: QFont, text: str, width: int) -> int:
+        """Measure the height of word wrapped text"""
+        return (
+            QFontMetrics(font)
+            .boundingRect(
+                QRect(0, 0, width, 100000),
+                Qt.TextFlag.TextWordWrap | Qt.AlignmentFlag.AlignLeft,
+                text,
+            )
+            .height()
+        )
+
+    def _drawText(
+        self,
+        painter: Optional[QPainter],
+        font: QFont,
+        color: str,
+        rect: QRect,
+        text: str,
+    ) -> int:
+        """Draw word wrapped text, or only measure it without a painter
+
+        Returns:
+            int: The height of the text
+        """
+        height = self._textHeight(font, text, rect.width())
+        if painter is not None:
+            painter.setFont(font)
+            painter.setPen(QColor(color))
+            painter.drawText(
+                QRect(rect.x(), rect.y(), rect.width(), height),
+                Qt.TextFlag.TextWordWrap | Qt.AlignmentFlag.AlignLeft,
+                text,
+            )
+        return height
+
+    def _layoutCard(
+        self,
+        painter: Optional[QPainter],
+        cardRect: QRect,
+        questionGroup: dict,
+        model: Optional[QuestionListModel],
+    ) -> int:
+        """Draw a question card, or only measure it without a painter
+
+        Args:
+            painter (Optional[QPainter]): The painter, None to only measure
+            cardRect (QRect): The rect of the card, its height is ignored
+            questionGroup (dict): The question to lay out
+            model (Optional[QuestionListModel]): The model providing thumbnails
+
+        Returns:
+            int: The height of the card
+        """
+        left = cardRect.x() + self.PADDING
+        width = cardRect.width() - 2 * self.PADDING
+        y = cardRect.y() + self.PADDING
 
         # Title
-        questionTitle = SubtitleLabel(question)
-        questionTitle.setStyleSheet(
-            "color: #333333; font-weight: 600; font-size: 20px; padding-bottom: 10px; border-bottom: 1px solid #eee;"
+        y += self._drawText(
+            painter,
+            self.titleFont,
+            "#333333",
+            QRect(left, y, width, 0),
+            questionGroup["title"],
         )
-        layout.addWidget(questionTitle)
+        y += 10
+        if painter is not None:
+            painter.setPen(QPen(QColor("#eeeeee"), 1))
+            painter.drawLine(left, y, left + width, y)
+        y += 1
 
         # Sub-questions
-        for subQuestion in subQuestions:
-            questionLayout = self.createSubQuestionItem(subQuestion)
-            layout.addLayout(questionLayout)
+        for subQuestion in questionGroup["sub_questions"]:
+            y += self.SPACING
+            y += self._layoutSubQuestion(
+                painter, QRect(left, y, width, 0), subQuestion, model
+            )
 
         # Footer
+        footerText = questionGroup.get("footer", None)
         if footerText:
-            footerLabel = CaptionLabel(footerText)
-            footerLabel.setStyleSheet(
-                "color: #6c757d; font-size: 11px; padding-top: 15px; "
-                "border-top: 1px solid #f0f0f0; margin-top: 20px;"
+            y += self.SPACING + 20
+            if painter is not None:
+                painter.setPen(QPen(QColor("#f0f0f0"), 1))
+                painter.drawLine(left, y, left + width, y)
+            y += 15
+            y += self._drawText(
+                painter,
+                self.footerFont,
+                "#6c757d",
+                QRect(left, y, width, 0),
+                footerText,
             )
-            footerLabel.setWordWrap(True)
-            layout.addWidget(footerLabel)
 
-    def createSubQuestionItem(self, subQuestion):
-        """Create a single sub-question item layout"""
-        questionLayout = QHBoxLayout()
-        questionLayout.setSpacing(20)
+        return y + self.PADDING - cardRect.y()
 
-        # Content
-        contentLayout = QVBoxLayout()
-        contentLayout.setSpacing(8)
-
-        # Title
-        questionTitle = StrongBodyLabel(subQuestion["title"])
-        contentLayout.addWidget(questionTitle)
-
-        # Description
-        questionText = BodyLabel(subQuestion["text"])
-        questionText.setAlignment(Qt.AlignmentFlag.AlignTop)
-        questionText.setWordWrap(True)
-        contentLayout.addWidget(questionText)
+    def _layoutSubQuestion(
+        self,
+        painter: Optional[QPainter],
+        rect: QRect,
+        subQuestion: dict,
+        model: Optional[QuestionListModel],
+    ) -> int:
+        """Draw a sub-question block, or only measure it without a painter
+
+        Returns:
+            int: The height of the block
+        """
+        imageId = subQuestion.get("image_id", None)
+        hasImage = imageId is not None or bool(subQuestion.get("image", None))
+        contentWidth = rect.width() - (self.IMAGE_SIZE + 20 if hasImage else 0)
+        y = rect.y()
+
+        y += self._drawText(
+            painter,
+            self.subTitleFont,
+            "#333333",
+            QRect(rect.x(), y, contentWidth, 0),
+            subQuestion["title"],
+        )
+        y += 8
+        y += self._drawText(
+            painter,
+            self.textFont,
+            "#333333",
+            QRect(rect.x(), y, contentWidth, 0),
+            subQuestion["text"],
+        )
 
-        # Tags
-        tagsLayout = QHBoxLayout()
-        tagsLayout.setSpacing(8)
-        tagsLayout.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        if subQuestion["tags"]:
+            y += 8
+            if painter is not None:
+                self._drawTags(painter, rect.x(), y, subQuestion["tags"])
+            y += self.TAG_HEIGHT
+
+        height = y - rect.y()
+        if not hasImage:
+            return height
+
+        if painter is not None:
+            imageRect = QRect(
+                rect.right() - self.IMAGE_SIZE + 1,
+                rect.y(),
+                self.IMAGE_SIZE,
+                self.IMAGE_SIZE,
+            )
+            pixmap = None
+            if imageId is not None and model is not None:
+                pixmap = model.thumbnail(imageId)
+            elif subQuestion.get("image", None):
+                # shown from the decoder's cache on a later repaint
+                _, pixmap = ImageDecoder.instance().request(
+                    None, subQuestion["image"], self.IMAGE_SIZE
+                )
 
-        for tagText, tagType in subQuestion["tags"]:
-            tag = self.createTag(tagText, tagType)
-            tagsLayout.addWidget(tag)
+            if pixmap is not None and not pixmap.isNull():
+                painter.drawPixmap(imageRect, pixmap)
+            else:
+                painter.fillRect(imageRect, QColor("#f0f0f0"))
 
-        tagsLayout.addStretch()
-        contentLayout.addLayout(tagsLayout)
+        return max(height, self.IMAGE_SIZE)
 
-        questionLayout.addLayout(contentLayout, 1)
+    def _drawTags(self, painter: QPainter, x: int, y: int, tags: list):
+        """Draw the colored tags of a sub-question"""
+        metrics = QFontMetrics(self.tagFont)
+        painter.setFont(self.tagFont)
 
-        # Image
-        if subQuestion.get("image", None):
-            imageWidget = ImageLabel(cropImageToSquare(subQuestion["image"], 80))
-            imageWidget.setFixedSize(80, 80)
-            questionLayout.addWidget(imageWidget)
-
-        return questionLayout
-
-    def createTag(self, text: str, tagType: str):
-        """Create a colored tag widget"""
-        colorMap = {
-            "concept": lambda text: InfoBadge.custom(
-                text, QColor("#0f7b0f"), QColor("#7ED321")
-            ),
-            "process": lambda text: InfoBadge.custom(
-                text, QColor("#005fb7"), QColor("#4A90E2")
-            ),
-            "result": lambda text: InfoBadge.custom(text, *levelToColor(text)),
-        }
+        for tagText, tagType in tags:
+            tagWidth = metrics.horizontalAdvance(tagText) + 16
+            tagRect = QRectF(x, y, tagWidth, self.TAG_HEIGHT)
 
-        tag = colorMap.get(
-            tagType.lower(),
-            lambda text: InfoBadge.info(text),
-        )(text)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._tagColor(tagText, tagType))
+            painter.drawRoundedRect(tagRect, self.TAG_HEIGHT / 2, self.TAG_HEIGHT / 2)
 
-        return tag
+            painter.setPen(QColor("white"))
+            painter.drawText(tagRect, Qt.AlignmentFlag.AlignCenter, tagText)
+            x += tagWidth + 8
 
-    def mousePressEvent(self, event):
-        """Handle mouse click"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.questionClicked.emit(self.questionId)
-        super().mousePressEvent(event)
+    def _tagColor(self, text: str, tagType: str) -> QColor:
+        """Get the background color of a tag"""
+        match tagType.lower():
+            case "concept":
+                return QColor("#0f7b0f")
+            case "process":
+                return QColor("#005fb7")
+            case "result":
+                return levelToColor(text)[0]
+            case _:
+                return themeColor()
 
 
 class QuestionsInterface(QWidget):
     """Questions interface displaying completed questions"""
 
     questionClicked = pyqtSignal(int)  # questionId
+    imageRequested = pyqtSignal(int)  # imageId
 
     def __init__(self, questionsData: list = None, parent=None):
         super().__init__(parent)
@@ -1418,24 +1498,12 @@ class QuestionsInterface(QWidget):
     def setupUi(self):
         self.setStyleSheet("background-color: #f5f5f5;")
 
-        scrollArea = SmoothScrollArea(self)
-        scrollArea.setScrollAnimation(
-            Qt.Orientation.Vertical, 400, QEasingCurve.Type.OutQuint
-        )
-        scrollArea.setScrollAnimation(
-            Qt.Orientation.Horizontal, 400, QEasingCurve.Type.OutQuint
-        )
-        scrollArea.setWidgetResizable(True)
-        scrollArea.setStyleSheet("background-color: #f5f5f5; border: none;")
-
-        container = QWidget()
-        scrollArea.setWidget(container)
-
-        mainLayout = QVBoxLayout(container)
-        mainLayout.setContentsMargins(25, 25, 25, 25)
+        mainLayout = QVBoxLayout(self)
+        mainLayout.setContentsMargins(0, 25, 0, 0)
         mainLayout.setSpacing(20)
 
         headerLayout = QVBoxLayout()
+        headerLayout.setContentsMargins(25, 0, 25, 0)
         headerLayout.setSpacing(5)
 
         title = TitleLabel("Questions")
@@ -1450,53 +1518,48 @@ class QuestionsInterface(QWidget):
 
         mainLayout.addLayout(headerLayout)
 
-        questionsLayout = QVBoxLayout()
-        questionsLayout.setObjectName("questionsLayout")
-        questionsLayout.setSpacing(20)
+        self.questionsModel = QuestionListModel(self.questionsData, parent=self)
+        self.questionsModel.imageRequested.connect(self.imageRequested.emit)
 
-        for questionGroup in self.questionsData:
-            questionCard = QuestionCard(
-                questionGroup.get("id", ""),
-                questionGroup["title"],
-                questionGroup["sub_questions"],
-                questionGroup.get("footer", None),
-            )
-            questionCard.questionClicked.connect(self.questionClicked.emit)
-            questionsLayout.addWidget(questionCard)
-
-        mainLayout.addLayout(questionsLayout)
-        mainLayout.addStretch(1)
+        self.questionsView = QListView(self)
+        self.questionsView.setStyleSheet(
+            "QListView { background-color: #f5f5f5; border: none; }"
+        )
+        self.scrollDelegate = SmoothScrollDelegate(self.questionsView)
+        self.questionsDelegate = QuestionCardDelegate(self.questionsView)
+        self.questionsView.setItemDelegate(self.questionsDelegate)
+        self.questionsView.setModel(self.questionsModel)
+        self.questionsView.setResizeMode(QListView.ResizeMode.Adjust)
+        self.questionsView.setLayoutMode(QListView.LayoutMode.Batched)
+        self.questionsView.setBatchSize(100)
+        self.questionsView.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.questionsView.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.questionsView.setMouseTracking(True)
+        self.questionsView.clicked.connect(self._onQuestionClicked)
+        self.questionsModel.modelAboutToBeReset.connect(
+            self.questionsDelegate.clearCache
+        )
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(scrollArea)
+        mainLayout.addWidget(self.questionsView, 1)
 
     def updateContent(self, questionsData: list):
         """Update the interface content with new data"""
         self.questionsData = questionsData
 
-        for layout in self.findChildren(QVBoxLayout):
-            if layout.objectName() != "questionsLayout":
-                continue
+        scrollBar = self.questionsView.verticalScrollBar()
+        scrollValue = scrollBar.value()
+        self.questionsModel.setQuestions(questionsData)
+        QTimer.singleShot(0, lambda: scrollBar.setValue(scrollValue))
 
-            for i in reversed(range(layout.count())):
-                item = layout.itemAt(i)
-                if item and item.widget() and isinstance(item.widget(), QuestionCard):
-                    widget = item.widget()
-                    layout.removeWidget(widget)
-                    widget.setParent(None)
-                    widget.deleteLater()
-
-            for questionGroup in self.questionsData:
-                questionCard = QuestionCard(
-                    questionGroup.get("id", ""),
-                    questionGroup["title"],
-                    questionGroup["sub_questions"],
-                    questionGroup.get("footer", None),
-                )
-                questionCard.questionClicked.connect(self.questionClicked.emit)
-                layout.addWidget(questionCard)
-            break
+    def _onQuestionClicked(self, index: QModelIndex):
+        """Forward a clicked row as a question click"""
+        questionGroup = index.data(QuestionListModel.QuestionRole)
+        if questionGroup is not None:
+            self.questionClicked.emit(questionGroup.get("id", ""))
+
+    def onImageLoaded(self, imageId: int, imageData: bytes):
+        """Handle a thumbnail image loaded from the controller"""
+        self.questionsModel.onImageLoaded(imageId, imageData)
 
 
 class QuestionAnsweringInterface(QWidget):
@@ -1507,19 +1570,22 @@ class QuestionAnsweringInterface(QWidget):
     )  # assignmentId, subQuestionId, answer
     submitAssignment = pyqtSignal(dict)  # allAnswers
 
-    def __init__(self, questionData: dict = None, studentController=None, parent=None):
+    def __init__(self, questionData: AssignmentVM, studentController=None, parent=None):
         super().__init__(parent)
         self.setObjectName("questionAnsweringInterface")
         self.studentController = studentController
 
-        self.questionData = questionData or {}
-        self.assignmentId = self.questionData.get("id", None)
-        self.assignment_title = self.questionData.get("title", "Assignment")
-        self.questions = self.questionData.get("questions", [])
+        self.questionData = questionData
+        self.assignmentId = questionData.id
+        self.assignment_title = questionData.title
+        # updated copies of the questions replace the loaded ones as answers are graded
+        self.questions: List[QuestionVM] = list(questionData.questions)
 
         self.currentQuestionIndex = 0
         self.totalQuestions = len(self.questions)
         self.allAnswers = {}
+        self.pendingSubQuestionIds = set()
+        self.queuedSubQuestionIds = set()  # pending, saved in the outbox
 
         self.current_question_title = "Question"
 
@@ -1561,9 +1627,9 @@ class QuestionAnsweringInterface(QWidget):
         # Attribution
         self.attributionLabel = BodyLabel("")
         self.attributionLabel.hide()
-        if self.questions[self.currentQuestionIndex].get("attribution", None):
+        if self.questions[self.currentQuestionIndex].attribution:
             self.attributionLabel = BodyLabel(
-                self.questions[self.currentQuestionIndex].get("attribution", "")
+                self.questions[self.currentQuestionIndex].attribution
             )
             self.attributionLabel.setTextInteractionFlags(
                 Qt.TextInteractionFlag.TextBrowserInteraction
@@ -1637,11 +1703,11 @@ class QuestionAnsweringInterface(QWidget):
         self._clearQuestionContainer()
 
         current_question = self.questions[self.currentQuestionIndex]
-        question_title = current_question.get(
-            "title", f"Question {self.currentQuestionIndex + 1}"
+        question_title = (
+            current_question.title or f"Question {self.currentQuestionIndex + 1}"
         )
-        attribution = current_question.get("attribution", None)
-        sub_questions = current_question.get("sub_questions", [])
+        attribution = current_question.attribution
+        sub_questions = current_question.subQuestions
 
         self.current_question_title = question_title
         self.titleLabel.setText(question_title)
@@ -1674,6 +1740,7 @@ class QuestionAnsweringInterface(QWidget):
         """Clear all widgets from the question container"""
         if hasattr(self, "currentSubQuestionCards"):
             for card in self.currentSubQuestionCards:
+                card.pendingRing.stop()
                 if hasattr(card, "extraWidgetLayout"):
                     while card.extraWidgetLayout.count():
                         item = card.extraWidgetLayout.takeAt(0)
@@ -1685,34 +1752,22 @@ class QuestionAnsweringInterface(QWidget):
             if item.widget():
                 item.widget().deleteLater()
 
-    def _createSubQuestionCard(self, subQuestionData: dict, subQuestionIndex: int):
+    def _createSubQuestionCard(
+        self, subQuestionData: SubQuestionVM, subQuestionIndex: int
+    ):
         """Create a sub-question card based on the sub-question data"""
-        question_type = subQuestionData.get("type", "text")
-        question_text = subQuestionData.get("text", "")
-        is_submitted = subQuestionData.get("is_submitted", False)
-
-        if question_type == "multiple_choice" or question_type == "options":
-            options = subQuestionData.get("options", [])
-            questionCard = OptionsQuestionCard(question_text, options, parent=self)
-
-            image_data = subQuestionData.get("image", None)
-            if image_data:
-                questionCard.setImage(image_data)
-            elif not subQuestionData.get("show_image", True):
-                questionCard.hideImage()
-
-        elif question_type == "text" or question_type == "text_input":
-            questionCard = TextQuestionCard(question_text, parent=self)
-
-            image_data = subQuestionData.get("image", None)
-            if image_data:
-                questionCard.setImage(image_data)
-            elif not subQuestionData.get("show_image", True):
-                questionCard.hideImage()
+        question_text = subQuestionData.text
 
+        if subQuestionData.type == "multiple_choice":
+            questionCard = OptionsQuestionCard(
+                question_text, subQuestionData.options, parent=self
+            )
         else:
             questionCard = TextQuestionCard(question_text, parent=self)
 
+        if subQuestionData.image:
+            questionCard.setImage(subQuestionData.image, subQuestionData.imageId)
+
         if hasattr(questionCard, "submitBtn"):
             questionCard.submitBtn.clicked.connect(
                 lambda checked, idx=subQuestionIndex: self._onSubQuestionSubmit(idx)
@@ -1726,30 +1781,164 @@ class QuestionAnsweringInterface(QWidget):
                 lambda checked, idx=subQuestionIndex: self._onDontKnow(idx)
             )
 
-        if is_submitted:
-            if isinstance(questionCard, TextQuestionCard):
-                questionCard.setAnswerText(subQuestionData.get("user_answer", ""))
-                questionCard.answerInput.setReadOnly(True)
-            elif isinstance(questionCard, OptionsQuestionCard):
-                for checkbox in questionCard.checkboxes:
-                    checkbox.setChecked(
-                        subQuestionData.get("user_answer", []).count(checkbox.text())
-                        > 0
-                    )
-                    checkbox.setEnabled(False)
-
-            questionCard.addExtraWidget(
-                FeedbackCard(
-                    subQuestionData.get("feedback", ""),
-                    subQuestionData.get("performance", ""),
-                )
+        if subQuestionData.isSubmitted:
+            self._setCardAnswer(questionCard, subQuestionData.userAnswer)
+            questionCard.setSubmitted(
+                subQuestionData.feedback, subQuestionData.performance
             )
-            questionCard.submitBtn.hide()
-            questionCard.showKeywordsBtn.hide()
-            questionCard.dontKnowBtn.hide()
+        elif subQuestionData.id in self.queuedSubQuestionIds:
+            self._setCardAnswer(questionCard, subQuestionData.userAnswer)
+            questionCard.setQueued()
+        elif subQuestionData.id in self.pendingSubQuestionIds:
+            self._setCardAnswer(questionCard, subQuestionData.userAnswer)
+            questionCard.setPending(True)
 
         return questionCard
 
+    def _setCardAnswer(self, questionCard: BaseQuestionCard, answer):
+        """Show an answer in a sub-question card"""
+        if isinstance(questionCard, TextQuestionCard) and isinstance(answer, str):
+            questionCard.setAnswerText(answer)
+        elif isinstance(questionCard, OptionsQuestionCard) and isinstance(
+            answer, (list, tuple)
+        ):
+            questionCard.setSelectedOptions(answer)
+
+    def _findSubQuestion(
+        self, subQuestionId: int
+    ) -> Tuple[int, int, Optional[SubQuestionVM]]:
+        """Find a sub-question of the assignment by its id
+
+        Args:
+            subQuestionId (int): The ID of the sub-question
+
+        Returns:
+            Tuple[int, int, Optional[SubQuestionVM]]: The question index,
+                sub-question index and sub-question, or (-1, -1, None) if it is
+                not in the assignment
+        """
+        for questionIndex, question in enumerate(self.questions):
+            for subQuestionIndex, subQuestion in enumerate(question.subQuestions):
+                if subQuestion.id == subQuestionId:
+                    return questionIndex, subQuestionIndex, subQuestion
+        return -1, -1, None
+
+    def _updateSubQuestion(
+        self, questionIndex: int, subQuestionIndex: int, **changes
+    ) -> SubQuestionVM:
+        """Replace a sub-question with a copy that has some fields changed
+
+        Args:
+            questionIndex (int): The index of its question
+            subQuestionIndex (int): The index of the sub-question
+            **changes: The new values of the changed fields
+
+        Returns:
+            SubQuestionVM: The updated sub-question
+        """
+        question = self.questions[questionIndex]
+        subQuestions = list(question.subQuestions)
+        subQuestions[subQuestionIndex] = subQuestions[subQuestionIndex].replace(
+            **changes
+        )
+        self.questions[questionIndex] = question.replace(
+            subQuestions=tuple(subQuestions)
+        )
+        return subQuestions[subQuestionIndex]
+
+    def _visibleCard(
+        self, questionIndex: int, subQuestionIndex: int
+    ) -> Optional[BaseQuestionCard]:
+        """Get the card of a sub-question if its question is on screen"""
+        if questionIndex != self.currentQuestionIndex or subQuestionIndex >= len(
+            getattr(self, "currentSubQuestionCards", [])
+        ):
+            return None
+        return self.currentSubQuestionCards[subQuestionIndex]
+
+    def showSubQuestionFeedback(self, subQuestionId: int, feedback: dict) -> bool:
+        """Attach the feedback of a graded sub-question to its card
+
+        The feedback is also stored with the sub-question, so it is shown when
+        the student comes back to a question that was graded in the meantime.
+
+        Args:
+            subQuestionId (int): The ID of the sub-question
+            feedback (dict): The feedback and performance of the answer
+
+        Returns:
+            bool: Whether the sub-question belongs to this assignment
+        """
+        questionIndex, subQuestionIndex, subQuestion = self._findSubQuestion(
+            subQuestionId
+        )
+        if subQuestion is None:
+            return False
+
+        self.pendingSubQuestionIds.discard(subQuestionId)
+        self.queuedSubQuestionIds.discard(subQuestionId)
+        subQuestion = self._updateSubQuestion(
+            questionIndex,
+            subQuestionIndex,
+            isSubmitted=True,
+            feedback=feedback.get("feedback", "No feedback available"),
+            performance=feedback.get("performance", "Unknown"),
+        )
+
+        questionCard = self._visibleCard(questionIndex, subQuestionIndex)
+        if questionCard is not None:
+            questionCard.setSubmitted(subQuestion.feedback, subQuestion.performance)
+        return True
+
+    def changeOfSubmission(self, subQuestionId: int) -> str:
+        """Get how far a graded sub-question moved the assignment
+
+        Args:
+            subQuestionId (int): The ID of the graded sub-question
+
+        Returns:
+            str: "complete_assignment" if every sub-question is graded,
+                "complete_question" if every sub-question of its question is
+                graded, else "submit_sub_question"
+        """
+        questionIndex, _, _ = self._findSubQuestion(subQuestionId)
+
+        def isComplete(question: QuestionVM) -> bool:
+            return all(subQuestion.isSubmitted for subQuestion in question.subQuestions)
+
+        if all(isComplete(question) for question in self.questions):
+            return "complete_assignment"
+        if questionIndex >= 0 and isComplete(self.questions[questionIndex]):
+            return "complete_question"
+        return "submit_sub_question"
+
+    def onSubQuestionSubmitFailed(self, subQuestionId: int):
+        """Unlock a sub-question card whose answer could not be graded"""
+        questionIndex, subQuestionIndex, subQuestion = self._findSubQuestion(
+            subQuestionId
+        )
+        if subQuestion is None:
+            return
+
+        self.pendingSubQuestionIds.discard(subQuestionId)
+        self.queuedSubQuestionIds.discard(subQuestionId)
+        questionCard = self._visibleCard(questionIndex, subQuestionIndex)
+        if questionCard is not None:
+            questionCard.setPending(False)
+
+    def onSubQuestionSubmitQueued(self, subQuestionId: int):
+        """Label a sub-question card whose answer waits in the outbox"""
+        questionIndex, subQuestionIndex, subQuestion = self._findSubQuestion(
+            subQuestionId
+        )
+        if subQuestion is None or subQuestionId not in self.pendingSubQuestionIds:
+            return
+
+        self.queuedSubQuestionIds.add(subQuestionId)
+        questionCard = self._visibleCard(questionIndex, subQuestionIndex)
+        if questionCard is not None:
+            questionCard.setQueued()
+
     def _onSubQuestionSubmit(self, subQuestionIndex: int):
         """Handle sub-question submission"""
         if subQuestionIndex < len(self.currentSubQuestionCards):
@@ -1763,29 +1952,36 @@ class QuestionAnsweringInterface(QWidget):
                 answer = None
 
             current_question = self.questions[self.currentQuestionIndex]
-            sub_question_id = current_question["sub_questions"][subQuestionIndex]["id"]
+            sub_question_id = current_question.subQuestions[subQuestionIndex].id
+            if sub_question_id in self.pendingSubQuestionIds:
+                return
+
+            # grading runs in the background, the other cards stay usable
+            self._updateSubQuestion(
+                self.currentQuestionIndex, subQuestionIndex, userAnswer=answer
+            )
+            self.pendingSubQuestionIds.add(sub_question_id)
+            questionCard.setPending(True)
 
             self.submitSubQuestion.emit(self.assignmentId, sub_question_id, answer)
 
     def _onShowKeywords(self, subQuestionIndex: int):
         """Handle show keywords button click"""
         if self.currentQuestionIndex < len(self.questions) and subQuestionIndex < len(
-            self.questions[self.currentQuestionIndex].get("sub_questions", [])
+            self.questions[self.currentQuestionIndex].subQuestions
         ):
             currentQuestion = self.questions[self.currentQuestionIndex]
-            subQuestions = currentQuestion.get("sub_questions", [])
-            keywords = subQuestions[subQuestionIndex].get("keywords", [])
+            keywords = currentQuestion.subQuestions[subQuestionIndex].keywords
             questionCard = self.currentSubQuestionCards[subQuestionIndex]
             questionCard.showKeywords(keywords)
 
     def _onDontKnow(self, subQuestionIndex: int):
         """Handle don't know button click"""
         if self.currentQuestionIndex < len(self.questions) and subQuestionIndex < len(
-            self.questions[self.currentQuestionIndex].get("sub_questions", [])
+            self.questions[self.currentQuestionIndex].subQuestions
         ):
             currentQuestion = self.questions[self.currentQuestionIndex]
-            subQuestions = currentQuestion.get("sub_questions", [])
-            subQuestionId = subQuestions[subQuestionIndex].get("id", 0)
+            subQuestionId = currentQuestion.subQuestions[subQuestionIndex].id
             self.aiPanel.setSubQuestionContext(subQuestionId)
             self.aiPanelContainer.show()
             self.aiPanel.show()
@@ -1821,13 +2017,13 @@ class QuestionAnsweringInterface(QWidget):
             return
 
         current_question = self.questions[self.currentQuestionIndex]
-        question_id = current_question["id"]
+        question_id = current_question.id
 
         if question_id not in self.allAnswers:
             self.allAnswers[question_id] = {}
 
         for i, questionCard in enumerate(self.currentSubQuestionCards):
-            sub_question_id = current_question["sub_questions"][i]["id"]
+            sub_question_id = current_question.subQuestions[i].id
 
             if isinstance(questionCard, OptionsQuestionCard):
                 answer = questionCard.getSelectedOptions()
@@ -1847,26 +2043,24 @@ class QuestionAnsweringInterface(QWidget):
             return
 
         current_question = self.questions[self.currentQuestionIndex]
-        question_id = current_question["id"]
+        question_id = current_question.id
 
         if question_id not in self.allAnswers:
             return
 
         for i, questionCard in enumerate(self.currentSubQuestionCards):
-            sub_question_id = current_question["sub_questions"][i]["id"]
+            sub_question = current_question.subQuestions[i]
+            sub_question_id = sub_question.id
+            if (
+                sub_question.isSubmitted
+                or sub_question_id in self.pendingSubQuestionIds
+            ):
+                continue
 
             if sub_question_id in self.allAnswers[question_id]:
-                answer = self.allAnswers[question_id][sub_question_id]
-
-                if isinstance(questionCard, OptionsQuestionCard) and isinstance(
-                    answer, list
-                ):
-                    for j, checkbox in enumerate(questionCard.checkboxes):
-                        checkbox.setChecked((j + 1) in answer)
-                elif isinstance(questionCard, TextQuestionCard) and isinstance(
-                    answer, str
-                ):
-                    questionCard.setAnswerText(answer)
+                self._setCardAnswer(
+                    questionCard, self.allAnswers[question_id][sub_question_id]
+                )
 
     def _onAIPanelClose(self):
         """Handle AI panel close button click"""
@@ -1879,7 +2073,7 @@ class QuestionReviewInterface(QWidget):
 
     def __init__(
         self,
-        questionData: dict = None,
+        questionData: AssignmentVM,
         studentController=None,
         previousInterface="class",
         parent=None,
@@ -1889,9 +2083,9 @@ class QuestionReviewInterface(QWidget):
         self.studentController = studentController
         self.previousInterface = previousInterface
 
-        self.questionData = questionData or {}
-        self.assignment_title = self.questionData.get("title", "Assignment Review")
-        self.questions = self.questionData.get("questions", [])
+        self.questionData = questionData
+        self.assignment_title = questionData.title or "Assignment Review"
+        self.questions = questionData.questions
 
         self.currentQuestionIndex = 0
         self.totalQuestions = len(self.questions)
@@ -1934,9 +2128,9 @@ class QuestionReviewInterface(QWidget):
         # Attribution
         self.attributionLabel = BodyLabel("")
         self.attributionLabel.hide()
-        if self.questions[self.currentQuestionIndex].get("attribution", None):
+        if self.questions[self.currentQuestionIndex].attribution:
             self.attributionLabel = BodyLabel(
-                self.questions[self.currentQuestionIndex].get("attribution", "")
+                self.questions[self.currentQuestionIndex].attribution
             )
             self.attributionLabel.setTextInteractionFlags(
                 Qt.TextInteractionFlag.TextBrowserInteraction
@@ -1997,11 +2191,11 @@ class QuestionReviewInterface(QWidget):
         self._clearQuestionContainer()
 
         current_question = self.questions[self.currentQuestionIndex]
-        attribution = current_question.get("attribution", "")
-        question_title = current_question.get(
-            "title", f"Question {self.currentQuestionIndex + 1}"
+        attribution = current_question.attribution
+        question_title = (
+            current_question.title or f"Question {self.currentQuestionIndex + 1}"
         )
-        sub_questions = current_question.get("sub_questions", [])
+        sub_questions = current_question.subQuestions
 
         self.current_question_title = question_title
         self.titleLabel.setText(question_title)
@@ -2040,43 +2234,25 @@ class QuestionReviewInterface(QWidget):
                 item.widget().deleteLater()
 
     def _createReadOnlySubQuestionCard(
-        self, subQuestionData: dict, subQuestionIndex: int
+        self, subQuestionData: SubQuestionVM, subQuestionIndex: int
     ):
         """Create a read-only sub-question card based on the sub-question data"""
-        question_type = subQuestionData.get("type", "text")
-        question_text = subQuestionData.get("text", "")
-
-        if question_type == "multiple_choice" or question_type == "options":
-            options = subQuestionData.get("options", [])
-            questionCard = OptionsQuestionCard(question_text, options, parent=self)
-
-            image_data = subQuestionData.get("image", None)
-            if image_data:
-                questionCard.setImage(image_data)
-            else:
-                questionCard.hideImage()
+        question_text = subQuestionData.text
 
-            user_answer = subQuestionData.get("user_answer", [])
-            for checkbox in questionCard.checkboxes:
-                checkbox.setChecked(user_answer.count(checkbox.text()) > 0)
-                checkbox.setEnabled(False)
-
-        elif question_type == "text" or question_type == "text_input":
+        if subQuestionData.type == "multiple_choice":
+            questionCard = OptionsQuestionCard(
+                question_text, subQuestionData.options, parent=self
+            )
+            questionCard.setSelectedOptions(subQuestionData.userAnswer or ())
+        else:
             questionCard = TextQuestionCard(question_text, parent=self)
+            questionCard.setAnswerText(subQuestionData.userAnswer or "")
 
-            image_data = subQuestionData.get("image", None)
-            if image_data:
-                questionCard.setImage(image_data)
-            else:
-                questionCard.hideImage()
-
-            user_answer = subQuestionData.get("user_answer", "")
-            questionCard.answerInput.setReadOnly(True)
-            questionCard.answerInput.setPlainText(user_answer)
-
+        if subQuestionData.image:
+            questionCard.setImage(subQuestionData.image, subQuestionData.imageId)
         else:
-            questionCard = TextQuestionCard(question_text, parent=self)
-            questionCard.answerInput.setReadOnly(True)
+            questionCard.hideImage()
+        questionCard.setInputsEnabled(False)
 
         if hasattr(questionCard, "submitBtn"):
             questionCard.submitBtn.hide()
@@ -2089,8 +2265,8 @@ class QuestionReviewInterface(QWidget):
             questionCard.actionLayout.setContentsMargins(0, 0, 0, 0)
 
         feedbackCard = FeedbackCard(
-            subQuestionData.get("feedback", "No feedback available"),
-            subQuestionData.get("performance", "Unknown"),
+            subQuestionData.feedback or "No feedback available",
+            subQuestionData.performance or "Unknown",
         )
         questionCard.addExtraWidget(feedbackCard)
 
@@ -2315,23 +2491,6 @@ class StudentMainWindow(FluentWindow):
         self.studentController.loadClassData()
         self.studentController.loadQuestions()
 
-    def refreshBackgroundData(self):
-        """Refresh background data"""
-        self._isBackgroundRefresh = True
-        self._backgroundRefreshCount = 0
-
-        self.studentController.loadDashboardData()
-        self.studentController.loadClassData()
-        self.studentController.loadQuestions()
-
-    def _checkBackgroundRefreshComplete(self):
-        """Check if background refresh is complete and reset flag"""
-        self._backgroundRefreshCount = getattr(self, "_backgroundRefreshCount", 0) + 1
-
-        if self._backgroundRefreshCount >= 3:
-            self._isBackgroundRefresh = False
-            self._backgroundRefreshCount = 0
-
     def _updateHomeInterfaceContent(self, dashboardData: dict):
         """Update home interface content"""
         if not self.homeInterface:
@@ -2379,7 +2538,7 @@ class StudentMainWindow(FluentWindow):
         """Handle question card click"""
         self.studentController.loadQuestionReviewData(questionId)
 
-    def onQuestionAnsweringDataReady(self, questionData: dict):
+    def onQuestionAnsweringDataReady(self, questionData: AssignmentVM):
         """Handle question answering data ready"""
         questionAnsweringInterface = QuestionAnsweringInterface(
             questionData, self.studentController, self
@@ -2398,7 +2557,7 @@ class StudentMainWindow(FluentWindow):
 
         self.currentQuestionAnsweringInterface = questionAnsweringInterface
 
-    def onQuestionReviewDataReady(self, questionData: dict):
+    def onQuestionReviewDataReady(self, questionData: AssignmentVM):
         """Handle question review data ready"""
         questionReviewInterface = QuestionReviewInterface(
             questionData, self.studentController, "questions", self
@@ -2411,7 +2570,7 @@ class StudentMainWindow(FluentWindow):
 
         self.stackedWidget.setCurrentWidget(questionReviewInterface)
 
-    def onAssignmentReviewDataReady(self, assignmentData: dict):
+    def onAssignmentReviewDataReady(self, assignmentData: AssignmentVM):
         """Handle assignment review data ready"""
         questionReviewInterface = QuestionReviewInterface(
             assignmentData, self.studentController, "class", self
@@ -2447,55 +2606,66 @@ class StudentMainWindow(FluentWindow):
             hasattr(self, "currentQuestionAnsweringInterface")
             and self.currentQuestionAnsweringInterface
         ):
-            feedbackCard = FeedbackCard(
-                feedback.get("feedback", "No feedback available"),
-                feedback.get("performance", "Unknown"),
+            interface = self.currentQuestionAnsweringInterface
+            if interface.showSubQuestionFeedback(sub_question_id, feedback):
+                self.studentController.refreshAfter(
+                    interface.changeOfSubmission(sub_question_id)
+                )
+                return
+
+        self.studentController.refreshAfter("complete_assignment")
+
+    def onSubQuestionSubmitFailed(self, sub_question_id: int, error_message: str):
+        """Handle a sub-question answer that could not be graded"""
+        if (
+            hasattr(self, "currentQuestionAnsweringInterface")
+            and self.currentQuestionAnsweringInterface
+        ):
+            self.currentQuestionAnsweringInterface.onSubQuestionSubmitFailed(
+                sub_question_id
             )
 
-            interface = self.currentQuestionAnsweringInterface
-            if (
-                hasattr(interface, "currentSubQuestionCards")
-                and interface.currentSubQuestionCards
-                and hasattr(interface, "questions")
-                and interface.currentQuestionIndex < len(interface.questions)
-            ):
-                current_question = interface.questions[interface.currentQuestionIndex]
-                sub_questions = current_question.get("sub_questions", [])
-
-                target_card_index = None
-                for i, sub_question in enumerate(sub_questions):
-                    if sub_question.get("id") == sub_question_id:
-                        target_card_index = i
-                        break
-
-                if target_card_index is not None and target_card_index < len(
-                    interface.currentSubQuestionCards
-                ):
-                    targetCard = interface.currentSubQuestionCards[target_card_index]
-                    targetCard.addExtraWidget(feedbackCard)
-
-                    if hasattr(targetCard, "submitBtn"):
-                        targetCard.submitBtn.hide()
-                    if hasattr(targetCard, "showKeywordsBtn"):
-                        targetCard.showKeywordsBtn.hide()
-                    if hasattr(targetCard, "dontKnowBtn"):
-                        targetCard.dontKnowBtn.hide()
-
-                    if hasattr(targetCard, "checkboxes"):
-                        for i, checkbox in enumerate(targetCard.checkboxes):
-                            checkbox.setEnabled(False)
-                    if hasattr(targetCard, "answerInput"):
-                        targetCard.answerInput.setReadOnly(True)
-
-            self.refreshBackgroundData()
-
-    def onAIResponseReady(self, response: str):
+    def onSubQuestionSubmitQueued(self, sub_question_id: int, error_message: str):
+        """Handle a sub-question answer that was saved offline to be retried"""
+        print(
+            f"[StudentMainWindow] Answer to {sub_question_id} saved offline: "
+            f"{error_message}"
+        )
+        if (
+            hasattr(self, "currentQuestionAnsweringInterface")
+            and self.currentQuestionAnsweringInterface
+        ):
+            self.currentQuestionAnsweringInterface.onSubQuestionSubmitQueued(
+                sub_question_id
+            )
+
+    def onAIResponseReady(self, request_id: int, response: str):
         """Handle AI response ready from controller"""
         if (
             hasattr(self, "currentQuestionAnsweringInterface")
             and self.currentQuestionAnsweringInterface
         ):
-            self.currentQuestionAnsweringInterface.aiPanel.addAIMessage(response)
+            self.currentQuestionAnsweringInterface.aiPanel.finishAIMessage(
+                request_id, response
+            )
+
+    def onAIResponseChunkReady(self, request_id: int, chunk: str):
+        """Append a streamed piece of the AI response as it arrives"""
+        if (
+            hasattr(self, "currentQuestionAnsweringInterface")
+            and self.currentQuestionAnsweringInterface
+        ):
+            self.currentQuestionAnsweringInterface.aiPanel.appendAIMessageChunk(
+                request_id, chunk
+            )
+
+    def onAIResponseFailed(self, request_id: int, error_message: str):
+        """Let the user ask again after an AI response failed"""
+        if (
+            hasattr(self, "currentQuestionAnsweringInterface")
+            and self.currentQuestionAnsweringInterface
+        ):
+            self.currentQuestionAnsweringInterface.aiPanel.failAIMessage(request_id)
 
     def _onAIMessageSent(self, message: str, history: list):
         """Handle AI message sent from the panel"""
@@ -2506,7 +2676,9 @@ class StudentMainWindow(FluentWindow):
             aiPanel = self.currentQuestionAnsweringInterface.aiPanel
             subQuestionId = getattr(aiPanel, "currentSubQuestionId", 0)
 
-            self.studentController.sendAIMessage(message, subQuestionId, history)
+            aiPanel.pendingRequestId = self.studentController.sendAIMessage(
+                message, subQuestionId, history
+            )
 
     def _onSubQuestionSubmit(self, assignment_id: int, sub_question_id: int, answer):
         """Handle sub-question submission for instant feedback"""
@@ -2570,7 +2742,17 @@ class StudentMainWindow(FluentWindow):
             self.studentController.subQuestionFeedbackReady.connect(
                 self.onSubQuestionFeedbackReady
             )
+            self.studentController.subQuestionSubmitFailed.connect(
+                self.onSubQuestionSubmitFailed
+            )
+            self.studentController.subQuestionSubmitQueued.connect(
+                self.onSubQuestionSubmitQueued
+            )
             self.studentController.aiResponseReady.connect(self.onAIResponseReady)
+            self.studentController.aiResponseChunkReady.connect(
+                self.onAIResponseChunkReady
+            )
+            self.studentController.aiResponseFailed.connect(self.onAIResponseFailed)
             self.studentController.joinClassResult.connect(self.onJoinClassResult)
             self.studentController.errorOccurred.connect(self.handleError)
 
@@ -2599,59 +2781,52 @@ class StudentMainWindow(FluentWindow):
             self.homeInterface.joinClassRequested.connect(self.onJoinClassRequested)
         if self.questionsInterface:
             self.questionsInterface.questionClicked.connect(self.onQuestionClicked)
+            self.questionsInterface.imageRequested.connect(
+                self.studentController.loadImage
+            )
+            self.studentController.imageReady.connect(
+                self.questionsInterface.onImageLoaded
+            )
 
     def onDashboardDataReady(self, dashboardData: dict):
         """Handle dashboard data ready"""
-        if getattr(self, "_isBackgroundRefresh", False):
-            if self.homeInterface:
-                self._updateHomeInterfaceContent(dashboardData)
-
-            self._checkBackgroundRefreshComplete()
+        self._loadStatus["dashboard"] = True
+        if self.homeInterface:
+            self._updateHomeInterfaceContent(dashboardData)
         else:
-            self._loadStatus["dashboard"] = True
-            if self.homeInterface:
-                self._updateHomeInterfaceContent(dashboardData)
-            else:
-                self.homeInterface = HomeInterface(dashboardData, self)
-            self._finishLoading()
+            self.homeInterface = HomeInterface(dashboardData, self)
+        self._finishLoading()
 
     def onClassDataReady(self, classData: dict):
         """Handle class data ready"""
-        if getattr(self, "_isBackgroundRefresh", False):
-            if self.classInterface:
-                self._updateClassInterfaceContent(classData)
-
-            self._checkBackgroundRefreshComplete()
+        self._loadStatus["class"] = True
+        if self.classInterface:
+            self._updateClassInterfaceContent(classData)
         else:
-            self._loadStatus["class"] = True
-            if self.classInterface:
-                self._updateClassInterfaceContent(classData)
-            else:
-                self.classInterface = ClassInterface(classData, self)
-            self._finishLoading()
+            self.classInterface = ClassInterface(classData, self)
+        self._finishLoading()
 
     def onQuestionsDataReady(self, questionsData: list):
         """Handle questions data ready"""
-        if getattr(self, "_isBackgroundRefresh", False):
-            if self.questionsInterface:
-                self._updateQuestionsInterfaceContent(questionsData)
-
-            self._checkBackgroundRefreshComplete()
+        self._loadStatus["questions"] = True
+        if self.questionsInterface:
+            self._updateQuestionsInterfaceContent(questionsData)
         else:
-            self._loadStatus["questions"] = True
-            if self.questionsInterface:
-                self._updateQuestionsInterfaceContent(questionsData)
-            else:
-                self.questionsInterface = QuestionsInterface(questionsData, self)
-            self._finishLoading()
+            self.questionsInterface = QuestionsInterface(questionsData, self)
+        self._finishLoading()
 
     def _finishLoading(self):
         """Finish loading data"""
+        if getattr(self, "_isLoaded", False):
+            # a revalidated response arrived after a cached one
+            return
+
         if (
             self._loadStatus["dashboard"]
             and self._loadStatus["class"]
             and self._loadStatus["questions"]
         ):
+            self._isLoaded = True
             self.initNavigation()
             self.connectInterfaceSignals()
             self.switchTo(self.homeInterface)
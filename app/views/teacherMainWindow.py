@@ -1,11 +1,24 @@
+import os
 from datetime import datetime
-from matplotlib.figure import Figure
+from typing import Optional
 from PyQt6.QtWidgets import QApplication
 from qframelesswindow import FramelessWindow
-from PyQt6.QtGui import QColor, QPixmap, QImage, QIcon
+from PyQt6.QtGui import QColor, QPixmap, QIcon, QPainter
 from nanoko.models.question import ConceptType, ProcessType
-from PyQt6.QtCore import Qt, pyqtSignal, QTime, QSize, QEasingCurve, QPoint
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from PyQt6.QtCore import (
+    Qt,
+    QRect,
+    QSize,
+    QTime,
+    QEvent,
+    QPoint,
+    QTimer,
+    pyqtSignal,
+    QModelIndex,
+    QEasingCurve,
+    QAbstractTableModel,
+    QSortFilterProxyModel,
+)
 from PyQt6.QtWidgets import (
     QLabel,
     QWidget,
@@ -14,7 +27,7 @@ from PyQt6.QtWidgets import (
     QHeaderView,
     QFileDialog,
     QStackedWidget,
-    QTableWidgetItem,
+    QStyleOptionViewItem,
 )
 from qfluentwidgets import (
     Pivot,
@@ -37,12 +50,13 @@ from qfluentwidgets import (
     TitleLabel,
     FluentIcon,
     FlowLayout,
-    TableWidget,
+    TableView,
     InfoBarIcon,
     TeachingTip,
     CaptionLabel,
     SplashScreen,
     FluentWindow,
+    StateToolTip,
     SubtitleLabel,
     PlainTextEdit,
     CalendarPicker,
@@ -51,6 +65,7 @@ from qfluentwidgets import (
     InfoBarPosition,
     SmoothScrollArea,
     SimpleCardWidget,
+    TableItemDelegate,
     PrimaryPushButton,
     FlyoutAnimationType,
     TransparentToolButton,
@@ -58,8 +73,16 @@ from qfluentwidgets import (
 )
 
 from app.controllers.teacherController import TeacherController
-from app.utils import enumNameToText, levelToColor, cropImageToSquare
-from app.views.studentMainWindow import OptionsQuestionCard, TextQuestionCard
+from app.controllers.chartRenderer import ChartRenderer, plotPerformanceChart
+from app.utils import enumNameToText, levelToColor
+from app.views.components import (
+    CardReconciler,
+    AsyncImageLabel,
+    LazyImageLabel,
+    LazyImageLoader,
+    TextQuestionCard,
+    OptionsQuestionCard,
+)
 
 
 class TeacherClassCard(CardWidget):
@@ -158,9 +181,8 @@ class TeacherAssignmentCard(CardWidget):
 
         # Image
         if image is not None:
-            scaled_pixmap = cropImageToSquare(image)
-            imageWidget = ImageLabel(scaled_pixmap)
-            imageWidget.setFixedSize(60, 60)
+            imageWidget = AsyncImageLabel(60)
+            imageWidget.setImageData(image)
             layout.addWidget(imageWidget)
 
     def mousePressEvent(self, event):
@@ -189,6 +211,7 @@ class SelectableQuestionCard(CardWidget):
         self.questionId = questionId
         self.questionTitle = questionTitle
         self.questions = questions
+        self.lazyImages = []
 
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignTop)
@@ -269,7 +292,12 @@ class SelectableQuestionCard(CardWidget):
         # Image area
         imageData = questionData.get("image", None)
         if imageData:
-            imageWidget = ImageLabel(cropImageToSquare(imageData, 80))
+            imageWidget = AsyncImageLabel(80)
+            imageWidget.setImageData(imageData, questionData.get("image_id", None))
+            rightLayout.addWidget(imageWidget)
+        elif questionData.get("image_id", None) is not None:
+            imageWidget = LazyImageLabel(questionData["image_id"], 80)
+            self.lazyImages.append(imageWidget)
             rightLayout.addWidget(imageWidget)
 
         questionLayout.addLayout(rightLayout)
@@ -330,6 +358,8 @@ class SelectQuestionsWindow(FramelessWindow):
 
         if self.controller:
             self.controller.filteredQuestionsDataReady.connect(self.onQuestionsLoaded)
+            self.controller.imageReady.connect(self.imageLoader.onImageLoaded)
+            self.imageLoader.imageRequested.connect(self.controller.loadImage)
 
         if parent:
             parentGeometry = parent.geometry()
@@ -400,6 +430,8 @@ class SelectQuestionsWindow(FramelessWindow):
         scrollContainer = QWidget()
         scrollArea.setWidget(scrollContainer)
 
+        self.imageLoader = LazyImageLoader(scrollArea)
+
         self.questionsLayout = QVBoxLayout(scrollContainer)
         self.questionsLayout.setContentsMargins(0, 20, 0, 20)
         self.questionsLayout.setSpacing(20)
@@ -435,8 +467,12 @@ class SelectQuestionsWindow(FramelessWindow):
 
         self.setLayout(mainLayout)
 
-    def loadQuestions(self):
-        """Load questions with current filters"""
+    def loadQuestions(self, debounce: bool = False):
+        """Load questions with current filters
+
+        Args:
+            debounce (bool, optional): Wait for typing to pause first. Defaults to False.
+        """
         if not self.controller:
             return
 
@@ -444,7 +480,9 @@ class SelectQuestionsWindow(FramelessWindow):
         conceptFilter = self.conceptFilter.currentText()
         processFilter = self.processFilter.currentText()
 
-        self.controller.loadFilteredQuestions(searchText, conceptFilter, processFilter)
+        self.controller.loadFilteredQuestions(
+            searchText, conceptFilter, processFilter, debounce
+        )
 
     def onQuestionsLoaded(self, questionsData: list):
         """Handle when questions data is loaded from the API"""
@@ -477,9 +515,11 @@ class SelectQuestionsWindow(FramelessWindow):
                 self.questionsLayout.addWidget(questionCard)
 
             self.questionCards.append(questionCard)
+            self.imageLoader.register(questionCard.lazyImages)
 
     def clearQuestionCards(self):
         """Clear all existing question cards"""
+        self.imageLoader.clear()
         for questionCard in self.questionCards:
             self.questionsLayout.removeWidget(questionCard)
             questionCard.setParent(None)
@@ -488,7 +528,7 @@ class SelectQuestionsWindow(FramelessWindow):
 
     def handleSearch(self, text):
         """Handle search input"""
-        self.loadQuestions()
+        self.loadQuestions(debounce=True)
 
     def handleFilterChange(self, text):
         """Handle filter dropdown changes"""
@@ -637,42 +677,14 @@ class PerformanceChartWidget(QWidget):
         self.setupChart()
 
     def setupChart(self):
+        # matplotlib is slow to import, so it is only loaded with the first chart
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+
         self.figure = Figure(figsize=(5, 3), dpi=80, facecolor="white")
         self.canvas = FigureCanvas(self.figure)
 
-        dates = self.performanceData.get("dates", [])
-        scores = self.performanceData.get("scores", [])
-
-        ax = self.figure.add_subplot(111)
-
-        if dates and scores and len(dates) == len(scores):
-            ax.plot(dates, scores, "o-", color="#0078d4", linewidth=2, markersize=6)
-        else:
-            ax.text(
-                0.5,
-                0.5,
-                "No performance data available",
-                horizontalalignment="center",
-                verticalalignment="center",
-                transform=ax.transAxes,
-                fontsize=12,
-            )
-
-        ax.set_ylim(0, 4)
-        ax.set_ylabel("Score")
-        ax.set_title(
-            f"{self.studentName}'s Recent Average Performance",
-            fontsize=12,
-            fontweight="bold",
-        )
-        ax.grid(True, alpha=0.3)
-        ax.set_facecolor("#f8f9fa")
-
-        ax.spines["top"].set_visible(False)
-        ax.spines["right"].set_visible(False)
-        ax.spines["left"].set_color("#ccc")
-        ax.spines["bottom"].set_color("#ccc")
-
+        plotPerformanceChart(self.figure, self.studentName, self.performanceData)
         self.figure.tight_layout()
 
         layout = QVBoxLayout(self)
@@ -684,52 +696,26 @@ class PerformanceChartWidget(QWidget):
         self.studentName = studentName
         self.performanceData = performanceData
 
-        self.figure.clear()
-
-        dates = self.performanceData.get("dates", [])
-        scores = self.performanceData.get("scores", [])
-
-        ax = self.figure.add_subplot(111)
-
-        if dates and scores and len(dates) == len(scores):
-            ax.plot(dates, scores, "o-", color="#0078d4", linewidth=2, markersize=6)
-        else:
-            ax.text(
-                0.5,
-                0.5,
-                "No performance data available",
-                horizontalalignment="center",
-                verticalalignment="center",
-                transform=ax.transAxes,
-                fontsize=12,
-            )
-
-        ax.set_ylim(0, 4)
-        ax.set_ylabel("Score")
-        ax.set_title(
-            f"{self.studentName}'s Recent Average Performance",
-            fontsize=12,
-            fontweight="bold",
-        )
-        ax.grid(True, alpha=0.3)
-        ax.set_facecolor("#f8f9fa")
-
-        ax.spines["top"].set_visible(False)
-        ax.spines["right"].set_visible(False)
-        ax.spines["left"].set_color("#ccc")
-        ax.spines["bottom"].set_color("#ccc")
-
+        plotPerformanceChart(self.figure, self.studentName, self.performanceData)
         self.figure.tight_layout()
         self.canvas.draw()
 
 
 class StudentPerformanceCard(CardWidget):
-    """Student performance card with chart"""
+    """Student performance card showing a chart rendered in the background"""
 
-    def __init__(self, studentName: str, performanceData: dict = None, parent=None):
+    def __init__(
+        self,
+        studentId: int,
+        studentName: str,
+        performanceData: dict,
+        chartRenderer: ChartRenderer,
+        parent=None,
+    ):
         super().__init__(parent)
-        self.studentName = studentName
-        self.performanceData = performanceData
+        self.studentId = studentId
+        self.chartRenderer = chartRenderer
+        self.chartKey = None
         self.setStyleSheet("background-color: white; border-radius: 8px;")
         self.setFixedWidth(450)
         self.setFixedHeight(280)
@@ -738,104 +724,474 @@ class StudentPerformanceCard(CardWidget):
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
 
-        self.chartWidget = PerformanceChartWidget(
-            self.studentName, self.performanceData
-        )
-        layout.addWidget(self.chartWidget)
+        self.chartLabel = QLabel()
+        self.chartLabel.setFixedSize(chartRenderer.width, chartRenderer.height)
+        self.chartLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.chartLabel)
+
+        self.chartRenderer.chartReady.connect(self._onChartReady)
+        self.updateData(studentName, performanceData)
 
     def updateData(self, studentName: str, performanceData: dict):
         """Update the card with new student data"""
         self.studentName = studentName
-        self.performanceData = performanceData
-        self.chartWidget.updateChart(studentName, performanceData)
+        self.performanceData = performanceData or {"dates": [], "scores": []}
 
+        self.chartKey, pixmap = self.chartRenderer.request(
+            self.studentId, self.studentName, self.performanceData
+        )
+        if pixmap is not None:
+            self.chartLabel.setPixmap(pixmap)
+        else:
+            self.chartLabel.clear()
+            self.chartLabel.setText("Loading chart...")
 
-class StudentTableWidget(TableWidget):
-    """Custom table widget for displaying students"""
+    def _onChartReady(self, key: tuple, pixmap: QPixmap):
+        """Show the chart once it has been rendered"""
+        if key == self.chartKey:
+            self.chartLabel.setPixmap(pixmap)
 
-    studentStatisticsClicked = pyqtSignal(
-        int, str, int
-    )  # studentId, studentName, classId
-    studentRemovalRequested = pyqtSignal(int, str)  # studentId, studentName
 
-    def __init__(self, classId: int, controller: TeacherController = None, parent=None):
+class RecordTableModel(QAbstractTableModel):
+    """Table model of records, one dict per row
+
+    Subclasses describe their columns with HEADERS and ``displayText``. Each
+    row is keyed by its record's id, so ``setRecords`` only inserts, removes
+    and repaints the rows that changed instead of rebuilding the table, and
+    resets the model only when the rows were reordered.
+
+    The model sorts its records itself with ``sortValue``. Sorting in a proxy
+    model would call back into Python for every comparison, which takes
+    hundreds of milliseconds for a few thousand rows. New records are placed
+    by the current sort order.
+    """
+
+    HEADERS = ()
+
+    RecordRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, records: list = None, parent=None):
         super().__init__(parent)
-        self.controller = controller
-        self.classId = classId
-        self.students = []
-        self.setupTable()
-        self.setupContextMenu()
+        self.records = []
+        self.sortColumn = -1
+        self.sortOrder = Qt.SortOrder.AscendingOrder
+        if records:
+            self.setRecords(records)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.records)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(self.HEADERS)
+        ):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.records):
+            return None
+
+        record = self.records[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.displayText(record, column)
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self.foreground(record, column)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.toolTip(record, column)
+        if role == self.RecordRole:
+            return record
+        return None
+
+    def displayText(self, record: dict, column: int) -> str:
+        """Get the text of a cell
+
+        Args:
+            record (dict): The record of the row
+            column (int): The column
+
+        Returns:
+            str: The text
+        """
+        return ""
+
+    def foreground(self, record: dict, column: int) -> Optional[QColor]:
+        """Get the text color of a cell, None for the default color"""
+        return None
+
+    def toolTip(self, record: dict, column: int) -> Optional[str]:
+        """Get the tooltip of a cell, None for no tooltip"""
+        return None
+
+    def sortValue(self, record: dict, column: int):
+        """Get the value a column is sorted by, its lower case text by default"""
+        return self.displayText(record, column).lower()
+
+    def recordKey(self, record: dict):
+        """Get the key identifying the row of a record"""
+        return record.get("id")
+
+    def searchText(self, row: int) -> str:
+        """Get the lower case text of a row that filters are matched against
+
+        Args:
+            row (int): The row
+
+        Returns:
+            str: The text of all its cells
+        """
+        record = self.records[row]
+        return "\n".join(
+            self.displayText(record, column) for column in range(len(self.HEADERS))
+        ).lower()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        self.sortColumn = column
+        self.sortOrder = order
+        if column < 0 or not self.records:
+            return
 
-    def setupTable(self):
-        self.setColumnCount(3)
-        self.setHorizontalHeaderLabels(["Name", "Username", ""])
+        self.layoutAboutToBeChanged.emit()
+        oldIndexes = self.persistentIndexList()
+        oldRecords = [self.records[index.row()] for index in oldIndexes]
+        self.records = self._sorted(self.records)
+        rows = {id(record): row for row, record in enumerate(self.records)}
+        self.changePersistentIndexList(
+            oldIndexes,
+            [
+                self.index(rows[id(record)], index.column())
+                for record, index in zip(oldRecords, oldIndexes)
+            ],
+        )
+        self.layoutChanged.emit()
+
+    def _sorted(self, records: list) -> list:
+        """Sort records by the current sort order, keeping them when unsorted"""
+        if self.sortColumn < 0:
+            return list(records)
+        return sorted(
+            records,
+            key=lambda record: self.sortValue(record, self.sortColumn),
+            reverse=self.sortOrder == Qt.SortOrder.DescendingOrder,
+        )
 
-        self.setRowCount(0)
+    def setRecords(self, records: list):
+        """Show new records, touching only the rows that changed
+
+        Args:
+            records (list): The records, in display order unless sorted
+        """
+        records = self._sorted(records)
+        keys = [self.recordKey(record) for record in records]
+        newKeys = set(keys)
+        oldKeys = [self.recordKey(record) for record in self.records]
+        if None in newKeys or len(newKeys) != len(keys) or newKeys.isdisjoint(oldKeys):
+            self._resetRecords(records)
+            return
 
-        self.setSelectionBehavior(TableWidget.SelectionBehavior.SelectRows)
-        self.verticalHeader().setVisible(False)
-        self.setSelectRightClickedRow(True)
-        self.doubleClicked.connect(self.handleDoubleClick)
+        # remove the rows of records that are gone, a run of rows at a time
+        row = len(self.records)
+        while row > 0:
+            row -= 1
+            if oldKeys[row] in newKeys:
+                continue
+            last = row
+            while row > 0 and oldKeys[row - 1] not in newKeys:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row, last)
+            del self.records[row : last + 1]
+            del oldKeys[row : last + 1]
+            self.endRemoveRows()
+
+        kept = set(oldKeys)
+        if oldKeys != [key for key in keys if key in kept]:
+            self._resetRecords(records)
+            return
 
-        header = self.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
+        # insert the new records and repaint the changed ones
+        lastColumn = self.columnCount() - 1
+        row = 0
+        while row < len(records):
+            if keys[row] in kept:
+                if self.records[row] != records[row]:
+                    self.records[row] = records[row]
+                    self.dataChanged.emit(
+                        self.index(row, 0), self.index(row, lastColumn)
+                    )
+                row += 1
+                continue
+
+            last = row
+            while last + 1 < len(records) and keys[last + 1] not in kept:
+                last += 1
+            self.beginInsertRows(QModelIndex(), row, last)
+            self.records[row:row] = records[row : last + 1]
+            self.endInsertRows()
+            row = last + 1
+
+    def appendRecords(self, records: list):
+        """Add records after the last row
+
+        Args:
+            records (list): The records to add
+        """
+        if not records:
+            return
+        if self.sortColumn >= 0:
+            self.setRecords(self.records + list(records))
+            return
 
-        self.setColumnWidth(2, 20)
+        start = len(self.records)
+        self.beginInsertRows(QModelIndex(), start, start + len(records) - 1)
+        self.records.extend(records)
+        self.endInsertRows()
 
-    def handleDoubleClick(self, item):
-        """Handle double-click on student item to view statistics"""
-        if item is None:
+    def _resetRecords(self, records: list):
+        self.beginResetModel()
+        self.records = records
+        self.endResetModel()
+
+
+class RecordProxyModel(QSortFilterProxyModel):
+    """Filter the rows of a RecordTableModel by a text
+
+    Each row is matched once against the text of all its cells instead of
+    once per cell, and sorting is left to the source model.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.filterText = ""
+
+    def setFilterText(self, text: str):
+        """Show only the rows containing a text, ignoring case
+
+        Args:
+            text (str): The text, empty to show every row
+        """
+        self.filterText = text.strip().lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, sourceRow: int, sourceParent: QModelIndex) -> bool:
+        if not self.filterText:
+            return True
+        return self.filterText in self.sourceModel().searchText(sourceRow)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+
+class MoreColumnDelegate(TableItemDelegate):
+    """Table delegate painting a "more" icon in one column
+
+    Clicking the icon emits ``moreClicked`` with the index of the cell, so
+    the rows don't need a tool button widget each.
+    """
+
+    moreClicked = pyqtSignal(QModelIndex)
+
+    ICON_SIZE = 16
+
+    def __init__(self, moreColumn: int, parent):
+        super().__init__(parent)
+        self.moreColumn = moreColumn
+
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex
+    ):
+        super().paint(painter, option, index)
+        if index.column() != self.moreColumn:
             return
-        row = item.row()
-        studentId = self.students[row].get("id")
-        studentName = self.students[row].get("name")
-        print(f"Student ID: {studentId}, Student Name: {studentName}")
-        print(f"Students: {self.students}")
-        self.studentStatisticsClicked.emit(studentId, studentName, self.classId)
 
-    def setupContextMenu(self):
-        """Setup context menu for right-click actions"""
+        rect = option.rect
+        iconRect = QRect(
+            rect.x() + (rect.width() - self.ICON_SIZE) // 2,
+            rect.y() + (rect.height() - self.ICON_SIZE) // 2,
+            self.ICON_SIZE,
+            self.ICON_SIZE,
+        )
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        FluentIcon.MORE.render(painter, iconRect)
+        painter.restore()
+
+    def editorEvent(self, event: QEvent, model, option, index: QModelIndex) -> bool:
+        if (
+            index.column() == self.moreColumn
+            and event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+        ):
+            self.moreClicked.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class RecordTableView(TableView):
+    """Sortable and filterable table showing a RecordTableModel
+
+    Rows are painted by a delegate, clicking a header sorts the rows and
+    ``setFilterText`` hides the rows not containing a text, both locally on
+    the loaded records. Right clicking a row, or clicking its "more" icon,
+    shows the menu built by ``createMenu``.
+    """
+
+    def __init__(
+        self,
+        sourceModel: RecordTableModel,
+        moreColumn: Optional[int] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.sourceModel = sourceModel
+        self.moreColumn = moreColumn
+
+        self.proxyModel = RecordProxyModel(self)
+        self.proxyModel.setSourceModel(sourceModel)
+        self.setModel(self.proxyModel)
+
+        if moreColumn is not None:
+            delegate = MoreColumnDelegate(moreColumn, self)
+            delegate.moreClicked.connect(self.showContextMenuForIndex)
+            self.setItemDelegate(delegate)
+
+        self.setSelectionBehavior(TableView.SelectionBehavior.SelectRows)
+        self.setEditTriggers(TableView.EditTrigger.NoEditTriggers)
+        self.verticalHeader().setVisible(False)
+        self.setSelectRightClickedRow(True)
+
+        # keep the order of the records until a header is clicked
+        self.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.setSortingEnabled(True)
+
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.showContextMenu)
+        self.doubleClicked.connect(self._onDoubleClicked)
+
+    def setFilterText(self, text: str):
+        """Show only the rows containing a text
+
+        Args:
+            text (str): The text, empty to show every row
+        """
+        self.proxyModel.setFilterText(text)
+
+    def recordAt(self, index: QModelIndex) -> Optional[dict]:
+        """Get the record of the row of an index
 
-    def showContextMenu(self, position):
+        Args:
+            index (QModelIndex): The index in the table
+
+        Returns:
+            Optional[dict]: The record, None for an invalid index
+        """
+        if not index.isValid():
+            return None
+        return index.data(RecordTableModel.RecordRole)
+
+    def createMenu(self, record: dict) -> Optional[RoundMenu]:
+        """Build the menu of a row
+
+        Args:
+            record (dict): The record of the row
+
+        Returns:
+            Optional[RoundMenu]: The menu, None for no menu
+        """
+        return None
+
+    def handleRecordDoubleClick(self, record: dict):
+        """Handle double-click on a row"""
+
+    def showContextMenu(self, position: QPoint):
         """Show context menu on right-click"""
-        item = self.itemAt(position)
-        print(position)
-        if item is None:
+        record = self.recordAt(self.indexAt(position))
+        if record is None:
             return
 
-        row = item.row()
-        studentId = self.students[row].get("id")
-        studentName = self.students[row].get("name")
+        menu = self.createMenu(record)
+        if menu is not None:
+            menu.exec(self.viewport().mapToGlobal(position))
 
-        menu = RoundMenu(parent=self)
+    def showContextMenuForIndex(self, index: QModelIndex):
+        """Show context menu for a row below its "more" icon"""
+        record = self.recordAt(index)
+        if record is None:
+            return
 
-        statsAction = Action(FluentIcon.PIE_SINGLE, "View Statistics")
-        statsAction.triggered.connect(
-            lambda: self.handleStatisticsClick(studentId, studentName)
-        )
-        menu.addAction(statsAction)
+        menu = self.createMenu(record)
+        if menu is None:
+            return
 
-        menu.addSeparator()
+        cellRect = self.visualRect(index)
+        globalPos = self.viewport().mapToGlobal(cellRect.bottomLeft())
+        menu.exec(QPoint(globalPos.x() + cellRect.width() // 2, globalPos.y()))
 
-        removeAction = Action(FluentIcon.DELETE, "Remove Student")
-        removeAction.triggered.connect(
-            lambda: self.handleRemoveStudent(studentId, studentName)
-        )
-        menu.addAction(removeAction)
+    def _onDoubleClicked(self, index: QModelIndex):
+        if index.column() == self.moreColumn:
+            return
 
-        menu.exec(self.mapToGlobal(position))
+        record = self.recordAt(index)
+        if record is not None:
+            self.handleRecordDoubleClick(record)
 
-    def showContextMenuForRow(self, row: int):
-        """Show context menu for a specific row at the button's position"""
-        if row >= len(self.students):
-            return
 
-        studentId = self.students[row].get("id")
-        studentName = self.students[row].get("name")
+class StudentTableModel(RecordTableModel):
+    """Students of a class"""
+
+    HEADERS = ("Name", "Username", "")
+
+    def displayText(self, record: dict, column: int) -> str:
+        if column == 0:
+            return record.get("name", "Unknown")
+        if column == 1:
+            return record.get("username", "unknown")
+        return ""
+
+
+class StudentTableWidget(RecordTableView):
+    """Custom table widget for displaying students"""
+
+    studentStatisticsClicked = pyqtSignal(
+        int, str, int
+    )  # studentId, studentName, classId
+    studentRemovalRequested = pyqtSignal(int, str)  # studentId, studentName
+
+    def __init__(self, classId: int, controller: TeacherController = None, parent=None):
+        super().__init__(StudentTableModel(), moreColumn=2, parent=parent)
+        self.controller = controller
+        self.classId = classId
+        self.setupTable()
+
+    def setupTable(self):
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
+
+        self.setColumnWidth(2, 20)
+
+    def handleRecordDoubleClick(self, record: dict):
+        """Handle double-click on student item to view statistics"""
+        self.handleStatisticsClick(record.get("id"), record.get("name"))
+
+    def createMenu(self, record: dict) -> RoundMenu:
+        studentId = record.get("id")
+        studentName = record.get("name")
 
         menu = RoundMenu(parent=self)
 
@@ -853,11 +1209,7 @@ class StudentTableWidget(TableWidget):
         )
         menu.addAction(removeAction)
 
-        cellRect = self.visualRect(self.model().index(row, 2))
-        globalPos = self.mapToGlobal(cellRect.bottomLeft())
-        menuPos = QPoint(globalPos.x() + cellRect.width() // 2, globalPos.y())
-
-        menu.exec(menuPos)
+        return menu
 
     def handleStatisticsClick(self, studentId: int, studentName: str):
         """Handle statistics button click"""
@@ -869,59 +1221,55 @@ class StudentTableWidget(TableWidget):
 
     def updateStudents(self, studentsData: list):
         """Update the students table with new data"""
-        self.setRowCount(len(studentsData))
-        self.students = studentsData
-
-        for row, studentData in enumerate(studentsData):
-            name = studentData.get("name", "Unknown")
-            username = studentData.get("username", "unknown")
-
-            # Name column
-            nameItem = QTableWidgetItem(name)
-            nameItem.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-            self.setItem(row, 0, nameItem)
-
-            # Username column
-            usernameItem = QTableWidgetItem(username)
-            usernameItem.setFlags(
-                Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-            )
-            self.setItem(row, 1, usernameItem)
-
-            # More column
-            moreButton = TransparentToolButton(FluentIcon.MORE, parent=self)
-            moreButton.setFixedSize(20, 20)
-            moreButton.setCursor(Qt.CursorShape.PointingHandCursor)
-            moreButton.clicked.connect(
-                lambda checked, row=row: self.showContextMenuForRow(row)
-            )
-            self.setCellWidget(row, 2, moreButton)
+        self.sourceModel.setRecords(studentsData)
+
 
+class AssignmentsTableModel(RecordTableModel):
+    """Assignments of a class"""
 
-class AssignmentsTableWidget(TableWidget):
+    HEADERS = ("Assignment Name", "Description", "Status", "Due Date", "")
+
+    def displayText(self, record: dict, column: int) -> str:
+        if column == 0:
+            return record.get("name", "Unknown Assignment")
+        if column == 1:
+            return record.get("description", "")
+        if column == 2:
+            return record.get("status", "Unknown")
+        if column == 3:
+            return record.get("due_date", "")
+        return ""
+
+    def foreground(self, record: dict, column: int) -> Optional[QColor]:
+        if column == 2:
+            status = record.get("status")
+            if status == "Assigned":
+                return QColor("#4CAF50")
+            if status == "Closed":
+                return QColor("#9E9E9E")
+        return None
+
+    def sortValue(self, record: dict, column: int):
+        if column == 3:
+            # due dates of the current year are shown without the year
+            dueDate = record.get("due_date", "")
+            if dueDate.count("/") == 1:
+                return f"{datetime.now().year}/{dueDate}"
+            return dueDate
+        return super().sortValue(record, column)
+
+
+class AssignmentsTableWidget(RecordTableView):
     """Custom table widget for displaying assignments"""
 
     def __init__(self, controller: TeacherController = None, parent=None):
-        super().__init__(parent)
+        super().__init__(AssignmentsTableModel(), moreColumn=4, parent=parent)
         self.controller = controller
         self.classId = None
         self.setupTable()
-        self.setupContextMenu()
 
     def setupTable(self):
-        self.setColumnCount(5)
-        self.setHorizontalHeaderLabels(
-            ["Assignment Name", "Description", "Status", "Due Date", ""]
-        )
-
-        self.assignments = []
-        self.setRowCount(0)
-
-        self.setSelectionBehavior(TableWidget.SelectionBehavior.SelectRows)
-        self.verticalHeader().setVisible(False)
-        self.setSelectRightClickedRow(True)
-
-        self.itemDoubleClicked.connect(self.handleItemDoubleClick)
+        self.verticalHeader().setDefaultSectionSize(50)
 
         header = self.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
@@ -935,44 +1283,12 @@ class AssignmentsTableWidget(TableWidget):
         self.setColumnWidth(3, 120)  # Due Date
         self.setColumnWidth(4, 20)  # More column
 
-    def setupContextMenu(self):
-        """Setup context menu for right-click actions"""
-        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.customContextMenuRequested.connect(self.showContextMenu)
-
-    def handleItemDoubleClick(self, item):
+    def handleRecordDoubleClick(self, record: dict):
         """Handle double-click on assignment item to review"""
-        if item is None:
-            return
-
-        row = item.row()
-        if row < len(self.assignments):
-            assignmentId = self.assignments[row][4]
-            self.handleReviewClick(assignmentId)
+        self.handleReviewClick(record.get("id"))
 
-    def showContextMenu(self, position):
-        """Show context menu on right-click"""
-        item = self.itemAt(position)
-        if item is None:
-            return
-
-        row = item.row()
-        assignmentId = self.assignments[row][4] if row < len(self.assignments) else 1
-
-        menu = RoundMenu(parent=self)
-
-        reviewAction = Action(FluentIcon.LINK, "Review Assignment")
-        reviewAction.triggered.connect(lambda: self.handleReviewClick(assignmentId))
-        menu.addAction(reviewAction)
-
-        menu.exec(self.mapToGlobal(position))
-
-    def showContextMenuForRow(self, row: int):
-        """Show context menu for a specific row at the button's position"""
-        if row >= len(self.assignments):
-            return
-
-        assignmentId = self.assignments[row][4]
+    def createMenu(self, record: dict) -> RoundMenu:
+        assignmentId = record.get("id")
 
         menu = RoundMenu(parent=self)
 
@@ -980,11 +1296,7 @@ class AssignmentsTableWidget(TableWidget):
         reviewAction.triggered.connect(lambda: self.handleReviewClick(assignmentId))
         menu.addAction(reviewAction)
 
-        cellRect = self.visualRect(self.model().index(row, 4))
-        globalPos = self.mapToGlobal(cellRect.bottomLeft())
-        menuPos = QPoint(globalPos.x() + cellRect.width() // 2, globalPos.y())
-
-        menu.exec(menuPos)
+        return menu
 
     def setClassId(self, classId: int):
         """Set the class name for this table"""
@@ -997,59 +1309,7 @@ class AssignmentsTableWidget(TableWidget):
 
     def updateAssignments(self, assignmentsData: list):
         """Update the assignments table with new data"""
-        self.assignments = []
-        self.setRowCount(len(assignmentsData))
-
-        for row, assignmentData in enumerate(assignmentsData):
-            name = assignmentData.get("name", "Unknown Assignment")
-            description = assignmentData.get("description", "")
-            status = assignmentData.get("status", "Unknown")
-            due_date = assignmentData.get("due_date", "")
-            assignment_id = assignmentData.get("id")
-
-            self.assignments.append(
-                (name, description, status, due_date, assignment_id)
-            )
-
-            # Name column
-            nameItem = QTableWidgetItem(name)
-            nameItem.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-            self.setItem(row, 0, nameItem)
-
-            # Description column
-            descItem = QTableWidgetItem(description)
-            descItem.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-            self.setItem(row, 1, descItem)
-
-            # Status column
-            statusItem = QTableWidgetItem(status)
-            statusItem.setFlags(
-                Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-            )
-
-            if status == "Assigned":
-                statusItem.setForeground(QColor("#4CAF50"))
-            elif status == "Closed":
-                statusItem.setForeground(QColor("#9E9E9E"))
-
-            self.setItem(row, 2, statusItem)
-
-            # Due date column
-            dueItem = QTableWidgetItem(due_date)
-            dueItem.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-            self.setItem(row, 3, dueItem)
-
-            # More column
-            moreButton = TransparentToolButton(FluentIcon.MORE, parent=self)
-            moreButton.setFixedSize(20, 20)
-            moreButton.setCursor(Qt.CursorShape.PointingHandCursor)
-            moreButton.clicked.connect(
-                lambda checked, row=row: self.showContextMenuForRow(row)
-            )
-            self.setCellWidget(row, 4, moreButton)
-
-            # Set row height
-            self.setRowHeight(row, 50)
+        self.sourceModel.setRecords(assignmentsData)
 
 
 class ClassPerformanceTableWidget(CardWidget):
@@ -1467,13 +1727,17 @@ class IndividualClassInterface(QWidget):
         layout.setSpacing(20)
         layout.setContentsMargins(0, 20, 0, 0)
 
+        searchInput = SearchLineEdit()
+        searchInput.setPlaceholderText("Search students")
+        searchInput.setFixedWidth(200)
+        layout.addWidget(searchInput)
+
         # Student table
         self.studentTable = StudentTableWidget(self.classId, self.controller)
+        searchInput.textChanged.connect(self.studentTable.setFilterText)
         self.studentTable.studentStatisticsClicked.connect(
-            lambda studentId,
-            studentName,
-            classId: self.controller.showStudentStatistics(
-                studentId, studentName, classId
+            lambda studentId, studentName, classId: (
+                self.controller.showStudentStatistics(studentId, studentName, classId)
             )
         )
         self.studentTable.studentRemovalRequested.connect(
@@ -1491,9 +1755,15 @@ class IndividualClassInterface(QWidget):
         layout.setSpacing(20)
         layout.setContentsMargins(0, 20, 0, 0)
 
+        searchInput = SearchLineEdit()
+        searchInput.setPlaceholderText("Search assignments")
+        searchInput.setFixedWidth(200)
+        layout.addWidget(searchInput)
+
         # Assignments table
         self.assignmentsTable = AssignmentsTableWidget(self.controller)
         self.assignmentsTable.setClassId(self.classId)
+        searchInput.textChanged.connect(self.assignmentsTable.setFilterText)
         layout.addWidget(self.assignmentsTable)
 
         layout.addStretch()
@@ -2147,62 +2417,83 @@ class TeacherHomeInterface(QWidget):
         mainLayout.addLayout(studentsLayout)
         mainLayout.addStretch(1)
 
+        self.classCards = CardReconciler(
+            self.classesGrid, lambda _, classData: self._createClassCard(classData)
+        )
+        self.assignmentCards = CardReconciler(
+            self.assignmentsGrid,
+            lambda _, assignmentData: self._createAssignmentCard(assignmentData),
+        )
+        self.chartRenderer = ChartRenderer(parent=self)
+        self.studentCards = CardReconciler(
+            self.studentsGrid,
+            lambda _, studentData: self._createStudentCard(studentData),
+            lambda card, _, studentData: card.updateData(
+                studentData.get("name", "Unknown Student"),
+                studentData.get("performance_data", {"dates": [], "scores": []}),
+            ),
+        )
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(scrollArea)
 
     def updateContent(self, dashboardData: dict):
         """Update the home interface with new data"""
-        while self.classesGrid.count() > 1:
-            item = self.classesGrid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        while self.assignmentsGrid.count() > 1:
-            item = self.assignmentsGrid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        while self.studentsGrid.count() > 1:
-            item = self.studentsGrid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        classes = dashboardData.get("classes", [])
-        for classData in classes:
-            classId = classData.get("id")
-            className = classData.get("name", "Unknown Class")
-            assignments = classData.get("assignments", [])
-            classCard = TeacherClassCard(classId, className, assignments)
-            classCard.classClicked.connect(
-                lambda classId: self.controller.showIndividualClass(classId, "students")
-            )
-            self.classesGrid.insertWidget(self.classesGrid.count() - 1, classCard)
-
-        assignments = dashboardData.get("recent_assignments", [])
-        for assignmentData in assignments:
-            assignmentId = assignmentData.get("id", None)
-            assignmentName = assignmentData.get("name", "Unknown Assignment")
-            description = assignmentData.get("description", "")
-            image = assignmentData.get("image", None)
-            assignmentCard = TeacherAssignmentCard(
-                assignmentId, assignmentName, description, image=image
-            )
-            assignmentCard.assignmentClicked.connect(
-                lambda assignmentId: self.controller.showAssignmentReview(assignmentId)
-            )
-            self.assignmentsGrid.insertWidget(
-                self.assignmentsGrid.count() - 1, assignmentCard
-            )
+        self.classCards.reconcile(
+            [
+                (classData.get("id"), classData)
+                for classData in dashboardData.get("classes", [])
+            ]
+        )
+        self.assignmentCards.reconcile(
+            [
+                (assignmentData.get("id", None), assignmentData)
+                for assignmentData in dashboardData.get("recent_assignments", [])
+            ]
+        )
+        self.studentCards.reconcile(
+            [
+                (studentData.get("id", studentData.get("name")), studentData)
+                for studentData in dashboardData.get("students", [])
+            ]
+        )
 
-        students = dashboardData.get("students", [])
-        for studentData in students:
-            studentName = studentData.get("name", "Unknown Student")
-            performanceData = studentData.get(
-                "performance_data", {"dates": [], "scores": []}
-            )
-            studentCard = StudentPerformanceCard(studentName, performanceData)
-            self.studentsGrid.insertWidget(self.studentsGrid.count() - 1, studentCard)
+    def _createClassCard(self, classData: dict) -> TeacherClassCard:
+        """Create a class card that opens the class when clicked"""
+        classId = classData.get("id")
+        className = classData.get("name", "Unknown Class")
+        assignments = classData.get("assignments", [])
+        classCard = TeacherClassCard(classId, className, assignments)
+        classCard.classClicked.connect(
+            lambda classId: self.controller.showIndividualClass(classId, "students")
+        )
+        return classCard
+
+    def _createAssignmentCard(self, assignmentData: dict) -> TeacherAssignmentCard:
+        """Create an assignment card that opens the review when clicked"""
+        assignmentId = assignmentData.get("id", None)
+        assignmentName = assignmentData.get("name", "Unknown Assignment")
+        description = assignmentData.get("description", "")
+        image = assignmentData.get("image", None)
+        assignmentCard = TeacherAssignmentCard(
+            assignmentId, assignmentName, description, image=image
+        )
+        assignmentCard.assignmentClicked.connect(
+            lambda assignmentId: self.controller.showAssignmentReview(assignmentId)
+        )
+        return assignmentCard
+
+    def _createStudentCard(self, studentData: dict) -> StudentPerformanceCard:
+        """Create a student performance card"""
+        studentId = studentData.get("id", None)
+        studentName = studentData.get("name", "Unknown Student")
+        performanceData = studentData.get(
+            "performance_data", {"dates": [], "scores": []}
+        )
+        return StudentPerformanceCard(
+            studentId, studentName, performanceData, self.chartRenderer
+        )
 
 
 class RemoveStudentDialog(CardWidget):
@@ -2598,28 +2889,66 @@ class CreateAssignmentDialog(CardWidget):
         )
 
 
-class QuestionsTableWidget(TableWidget):
-    """Custom table widget for displaying questions"""
+class QuestionsTableModel(RecordTableModel):
+    """Questions of the teacher"""
+
+    HEADERS = ("Name", "Source", "Status", "Sub-Questions", "")
+
+    def displayText(self, record: dict, column: int) -> str:
+        if column == 0:
+            return record.get("name", "Unknown")
+        if column == 1:
+            return record.get("source", "Unknown")
+        if column == 2:
+            return "Approved" if record.get("is_audited", False) else "Auditing"
+        if column == 3:
+            return str(record.get("sub_questions_count", "0"))
+        return ""
+
+    def foreground(self, record: dict, column: int) -> Optional[QColor]:
+        if column == 2:
+            if record.get("is_audited", False):
+                return QColor("#4CAF50")
+            return QColor("#FF9800")
+        return None
+
+    def sortValue(self, record: dict, column: int):
+        if column == 3:
+            return int(record.get("sub_questions_count", 0) or 0)
+        return super().sortValue(record, column)
+
+
+class QuestionsTableWidget(RecordTableView):
+    """Table of the teacher's questions, loaded a page at a time
+
+    The next page is requested when the user scrolls close to the last row,
+    or right away while the rows don't fill the table yet. Sorting and
+    filtering apply to the questions loaded so far. While a filter is active
+    pages are only loaded through ``loadMore``, so a filter matching few
+    questions doesn't download every page.
+    """
+
+    loadMoreAvailable = pyqtSignal(bool)  # filtering and more pages exist
+
+    LOAD_MORE_THRESHOLD_ROWS = 10
+    ROW_HEIGHT = 50
 
     def __init__(self, controller: TeacherController = None, parent=None):
-        super().__init__(parent)
+        super().__init__(QuestionsTableModel(), moreColumn=4, parent=parent)
         self.controller = controller
-        self.questions = []
+        self.nextCursor = None
+        self.pendingCursor = None
+        self.filterText = ""
         self.setupTable()
 
-    def setupTable(self):
-        self.setColumnCount(5)
-        self.setHorizontalHeaderLabels(
-            ["Name", "Source", "Status", "Sub-Questions", ""]
-        )
-
-        self.setRowCount(0)
+        self.verticalScrollBar().valueChanged.connect(self._loadMoreIfNeeded)
+        self.proxyModel.layoutChanged.connect(self._loadMoreIfNeeded)
+        self.proxyModel.rowsRemoved.connect(self._loadMoreIfNeeded)
+        if self.controller:
+            self.controller.operationError.connect(self._onOperationError)
 
-        self.setSelectionBehavior(TableWidget.SelectionBehavior.SelectRows)
-        self.verticalHeader().setVisible(False)
-        self.doubleClicked.connect(self.handleItemDoubleClick)
-        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.customContextMenuRequested.connect(self.showContextMenu)
+    def setupTable(self):
+        self.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
 
         header = self.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
@@ -2634,93 +2963,102 @@ class QuestionsTableWidget(TableWidget):
         self.setColumnWidth(3, 100)  # Sub-questions
         self.setColumnWidth(4, 20)  # More column
 
-    def updateQuestions(self, questionsData: list):
-        """Update the questions table with new data"""
-        self.questions = questionsData
-        self.setRowCount(len(questionsData))
-
-        for row, questionData in enumerate(questionsData):
-            name = questionData.get("name", "Unknown")
-            source = questionData.get("source", "Unknown")
-            is_audited = questionData.get("is_audited", False)
-            subQuestions = str(questionData.get("sub_questions_count", "0"))
-
-            # Name
-            nameItem = QTableWidgetItem(name)
-            nameItem.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-            self.setItem(row, 0, nameItem)
-
-            # Source
-            sourceItem = QTableWidgetItem(source)
-            sourceItem.setFlags(
-                Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-            )
-            self.setItem(row, 1, sourceItem)
+    def updateQuestions(self, questionsData: list, nextCursor: Optional[int] = None):
+        """Replace the rows with the first page of questions
 
-            # Status
-            statusItem = QTableWidgetItem("Approved" if is_audited else "Auditing")
-            statusItem.setFlags(
-                Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-            )
+        Args:
+            questionsData (list): The questions of the first page
+            nextCursor (Optional[int], optional): The cursor of the next page,
+                None if there are no more questions. Defaults to None.
+        """
+        self.nextCursor = nextCursor
+        self.pendingCursor = None
+        self.sourceModel.setRecords(questionsData)
+        self._updateLoadMoreAvailable()
 
-            if is_audited:
-                statusItem.setForeground(QColor("#4CAF50"))
-            else:
-                statusItem.setForeground(QColor("#FF9800"))
+        QTimer.singleShot(0, self._loadMoreIfNeeded)
+
+    def appendQuestions(
+        self, cursor: int, questionsData: list, nextCursor: Optional[int]
+    ):
+        """Append the page of questions that was requested last
+
+        Args:
+            cursor (int): The cursor the page was requested with
+            questionsData (list): The questions of the page
+            nextCursor (Optional[int]): The cursor of the following page, None if
+                there are no more questions
+        """
+        if cursor != self.pendingCursor:
+            return
 
-            self.setItem(row, 2, statusItem)
+        self.pendingCursor = None
+        self.nextCursor = nextCursor
+        self.sourceModel.appendRecords(questionsData)
+        self._updateLoadMoreAvailable()
 
-            # Sub-questions
-            subQuestionsItem = QTableWidgetItem(subQuestions)
-            subQuestionsItem.setFlags(
-                Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-            )
-            self.setItem(row, 3, subQuestionsItem)
-
-            # More column
-            moreButton = TransparentToolButton(FluentIcon.MORE, parent=self)
-            moreButton.setFixedSize(20, 20)
-            moreButton.setCursor(Qt.CursorShape.PointingHandCursor)
-            moreButton.clicked.connect(
-                lambda checked, row=row: self.showContextMenuForRow(row)
-            )
-            self.setCellWidget(row, 4, moreButton)
+        QTimer.singleShot(0, self._loadMoreIfNeeded)
 
-            self.setRowHeight(row, 50)
+    def addQuestion(self, questionData: dict):
+        """Add a question after the loaded ones
 
-    def handleItemDoubleClick(self, item):
-        """Handle double-click on assignment item to review"""
-        if item is None:
-            return
+        Args:
+            questionData (dict): The question
+        """
+        self.sourceModel.appendRecords([questionData])
 
-        row = item.row()
-        if row < len(self.questions):
-            questionId = self.questions[row]["id"]
-            self.handlePreviewClick(questionId)
+    def setFilterText(self, text: str):
+        super().setFilterText(text)
+        self.filterText = text
+        self._updateLoadMoreAvailable()
+        QTimer.singleShot(0, self._loadMoreIfNeeded)
 
-    def showContextMenu(self, position):
-        """Show context menu on right-click"""
-        item = self.itemAt(position)
-        if item is None:
+    def loadMore(self):
+        """Request the next page of questions, if any"""
+        if self.nextCursor is None or self.pendingCursor is not None:
+            return
+        if not self.controller:
             return
 
-        row = item.row()
-        questionId = self.questions[row]["id"]
-
-        menu = RoundMenu(parent=self)
+        self.pendingCursor = self.nextCursor
+        self.controller.loadMoreQuestions(self.nextCursor)
 
-        previewAction = Action(FluentIcon.VIEW, "Preview Question")
-        previewAction.triggered.connect(lambda: self.handlePreviewClick(questionId))
-        menu.addAction(previewAction)
+    def _updateLoadMoreAvailable(self):
+        self.loadMoreAvailable.emit(
+            bool(self.filterText) and self.nextCursor is not None
+        )
 
-        menu.exec(self.mapToGlobal(position))
+    def _loadMoreIfNeeded(self):
+        """Request the next page when the last rows are about to be shown"""
+        if self.nextCursor is None or self.pendingCursor is not None:
+            return
+        if self.filterText:
+            # the matching rows may never fill the table, let the user ask
+            return
 
-    def showContextMenuForRow(self, row: int):
-        """Show context menu for a specific row at the button's position"""
-        if row >= len(self.questions):
+        lastVisibleRow = self.rowAt(self.viewport().height() - 1)
+        if lastVisibleRow != -1 and (
+            self.proxyModel.rowCount() - 1 - lastVisibleRow
+            > self.LOAD_MORE_THRESHOLD_ROWS
+        ):
             return
 
-        questionId = self.questions[row]["id"]
+        self.loadMore()
+
+    def _onOperationError(self, operation: str, message: str):
+        if operation == "load_teacher_questions_page":
+            # scrolling again retries the page
+            self.pendingCursor = None
+
+    def handleRecordDoubleClick(self, record: dict):
+        """Handle double-click on question item to preview"""
+        if record.get("id") is not None:
+            self.handlePreviewClick(record["id"])
+
+    def createMenu(self, record: dict) -> Optional[RoundMenu]:
+        questionId = record.get("id")
+        if questionId is None:
+            return None
 
         menu = RoundMenu(parent=self)
 
@@ -2728,11 +3066,7 @@ class QuestionsTableWidget(TableWidget):
         previewAction.triggered.connect(lambda: self.handlePreviewClick(questionId))
         menu.addAction(previewAction)
 
-        cellRect = self.visualRect(self.model().index(row, 4))
-        globalPos = self.mapToGlobal(cellRect.bottomLeft())
-        menuPos = QPoint(globalPos.x() + cellRect.width() // 2, globalPos.y())
-
-        menu.exec(menuPos)
+        return menu
 
     def handlePreviewClick(self, questionId: int):
         """Handle preview button click"""
@@ -2901,6 +3235,18 @@ class TeacherQuestionsInterface(QWidget):
 
         headerLayout.addStretch()
 
+        # Search
+        self.searchInput = SearchLineEdit()
+        self.searchInput.setPlaceholderText("Search")
+        self.searchInput.setFixedWidth(200)
+        headerLayout.addWidget(self.searchInput)
+
+        # Import button
+        self.importBtn = PushButton("Import")
+        self.importBtn.setIcon(FluentIcon.FOLDER_ADD)
+        self.importBtn.clicked.connect(self.handleImportQuestions)
+        headerLayout.addWidget(self.importBtn)
+
         # Upload button
         uploadBtn = PrimaryPushButton("Upload")
         uploadBtn.setIcon(FluentIcon.CLOUD)
@@ -2912,6 +3258,14 @@ class TeacherQuestionsInterface(QWidget):
         # Questions table
         self.questionsTable = QuestionsTableWidget(self.controller)
         mainLayout.addWidget(self.questionsTable)
+        self.searchInput.textChanged.connect(self.questionsTable.setFilterText)
+
+        # Load more button, shown while a search hides the unloaded questions
+        self.loadMoreBtn = PushButton("Load More Questions")
+        self.loadMoreBtn.setVisible(False)
+        self.loadMoreBtn.clicked.connect(self.questionsTable.loadMore)
+        self.questionsTable.loadMoreAvailable.connect(self.loadMoreBtn.setVisible)
+        mainLayout.addWidget(self.loadMoreBtn, 0, Qt.AlignmentFlag.AlignHCenter)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -2925,6 +3279,39 @@ class TeacherQuestionsInterface(QWidget):
         self.uploadDialog.raise_()
         self.uploadDialog.activateWindow()
 
+    def handleImportQuestions(self):
+        """Handle import button click, asking for a manifest file or folder"""
+        menu = RoundMenu(parent=self)
+
+        fileAction = Action(FluentIcon.DOCUMENT, "From Manifest File")
+        fileAction.triggered.connect(self.importFromFile)
+        menu.addAction(fileAction)
+
+        folderAction = Action(FluentIcon.FOLDER, "From Folder")
+        folderAction.triggered.connect(self.importFromFolder)
+        menu.addAction(folderAction)
+
+        menu.exec(self.importBtn.mapToGlobal(QPoint(0, self.importBtn.height())))
+
+    def importFromFile(self):
+        """Import the questions of a JSON or CSV manifest"""
+        filePath, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select Question Manifest",
+            "",
+            "Question Manifests (*.json *.csv);;All Files (*)",
+        )
+
+        if filePath:
+            self.controller.importQuestions(filePath)
+
+    def importFromFolder(self):
+        """Import the questions of a folder holding a manifest and its images"""
+        folderPath = QFileDialog.getExistingDirectory(self, "Select Question Folder")
+
+        if folderPath:
+            self.controller.importQuestions(folderPath)
+
     def onQuestionSaved(self, name: str, source: str, subQuestionsData: list):
         """Handle when a new question is saved from the editor"""
         subQuestionCount = len(subQuestionsData)
@@ -2932,34 +3319,24 @@ class TeacherQuestionsInterface(QWidget):
 
     def addQuestionToTable(self, name: str, source: str, subQuestionCount: str):
         """Add a new question to the questions table"""
-        table = self.questionsTable
-        rowCount = table.rowCount()
-        table.setRowCount(rowCount + 1)
-
-        nameItem = QTableWidgetItem(name)
-        nameItem.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-        table.setItem(rowCount, 0, nameItem)
-
-        statusItem = QTableWidgetItem("Auditing")
-        statusItem.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-        statusItem.setForeground(QColor("#FF9800"))
-        table.setItem(rowCount, 1, statusItem)
-
-        sourceItem = QTableWidgetItem(source)
-        sourceItem.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-        table.setItem(rowCount, 2, sourceItem)
-
-        subQuestionsItem = QTableWidgetItem(subQuestionCount)
-        subQuestionsItem.setFlags(
-            Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        self.questionsTable.addQuestion(
+            {
+                "name": name,
+                "source": source,
+                "is_audited": False,
+                "sub_questions_count": subQuestionCount,
+            }
         )
-        table.setItem(rowCount, 3, subQuestionsItem)
 
-        table.setRowHeight(rowCount, 50)
+    def updateContent(self, questionsData: list, nextCursor: Optional[int] = None):
+        """Show the first page of questions"""
+        self.questionsTable.updateQuestions(questionsData, nextCursor)
 
-    def updateContent(self, questionsData: list):
-        """Update the questions display with new data"""
-        self.questionsTable.updateQuestions(questionsData)
+    def appendQuestions(
+        self, cursor: int, questionsData: list, nextCursor: Optional[int]
+    ):
+        """Show a following page of questions"""
+        self.questionsTable.appendQuestions(cursor, questionsData, nextCursor)
 
 
 class SubQuestionWidget(SimpleCardWidget):
@@ -3369,6 +3746,47 @@ class QuestionEditorWindow(FramelessWindow):
         self.close()
 
 
+class StudentPerformanceTableModel(RecordTableModel):
+    """Answers of the students to a sub-question"""
+
+    HEADERS = ("Student", "Answer", "Performance", "Feedback")
+
+    def displayText(self, record: dict, column: int) -> str:
+        if column == 0:
+            return record["user"]["display_name"]
+        if column == 1:
+            return record["answer"] or "No answer provided"
+        if column == 2:
+            return enumNameToText(self._performance(record))
+        return record["feedback"] or "No feedback provided"
+
+    def foreground(self, record: dict, column: int) -> Optional[QColor]:
+        if column == 1 and not record["answer"]:
+            return QColor("#999999")
+        if column == 2:
+            color, _ = levelToColor(self._performance(record))
+            return color
+        return None
+
+    def toolTip(self, record: dict, column: int) -> Optional[str]:
+        if column in (1, 3):
+            return self.displayText(record, column)
+        return None
+
+    def sortValue(self, record: dict, column: int):
+        if column == 2:
+            performance = record["performance"]
+            return performance.value if performance else -1
+        return super().sortValue(record, column)
+
+    def recordKey(self, record: dict):
+        return record["user"].get("id")
+
+    def _performance(self, record: dict) -> str:
+        performance = record["performance"]
+        return performance.name.lower() if performance else "Not Submitted"
+
+
 class StudentPerformanceWindow(FramelessWindow):
     """Window showing detailed student performance for an assignment"""
 
@@ -3437,53 +3855,10 @@ class StudentPerformanceWindow(FramelessWindow):
 
     def createStudentTable(self):
         """Create a single table showing all students"""
-        self.studentTable = TableWidget()
-        self.studentTable.setColumnCount(4)
-        self.studentTable.setHorizontalHeaderLabels(
-            ["Student", "Answer", "Performance", "Feedback"]
+        self.studentTable = RecordTableView(
+            StudentPerformanceTableModel(self.data.get("student_performances"))
         )
 
-        all_students = self.data.get("student_performances")
-
-        self.studentTable.setRowCount(len(all_students))
-
-        for row, student in enumerate(all_students):
-            # Student name
-            nameItem = QTableWidgetItem(student["user"]["display_name"])
-            self.studentTable.setItem(row, 0, nameItem)
-
-            # Answer
-            answer = student["answer"] or "No answer provided"
-            answerItem = QTableWidgetItem(answer)
-            answerItem.setToolTip(answer)
-
-            if answer == "No answer provided":
-                answerItem.setForeground(QColor("#999999"))
-
-            self.studentTable.setItem(row, 1, answerItem)
-
-            # Performance
-            performance = (
-                student["performance"].name.lower()
-                if student["performance"]
-                else "Not Submitted"
-            )
-            color, _ = levelToColor(performance)
-            performanceItem = QTableWidgetItem(enumNameToText(performance))
-            performanceItem.setForeground(color)
-            self.studentTable.setItem(row, 2, performanceItem)
-
-            # Feedback
-            feedback = student["feedback"] or "No feedback provided"
-            feedbackItem = QTableWidgetItem(feedback)
-            feedbackItem.setToolTip(feedback)
-
-            self.studentTable.setItem(row, 3, feedbackItem)
-
-        self.studentTable.setSelectionBehavior(TableWidget.SelectionBehavior.SelectRows)
-        self.studentTable.verticalHeader().setVisible(False)
-        self.studentTable.setEditTriggers(TableWidget.EditTrigger.NoEditTriggers)
-
         header = self.studentTable.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
@@ -3979,8 +4354,8 @@ class TeacherAssignmentReviewInterface(QWidget):
 
         # Image
         if image_data:
-            imageWidget = ImageLabel(QImage.fromData(image_data))
-            imageWidget.scaledToWidth(800)
+            imageWidget = AsyncImageLabel(800, square=False)
+            imageWidget.setImageData(image_data)
             contentLayout.addWidget(imageWidget)
 
         layout.addLayout(contentLayout)
@@ -4135,6 +4510,8 @@ class TeacherMainWindow(FluentWindow):
     def __init__(self, teacherController: TeacherController):
         super().__init__()
         self.teacherController = teacherController
+        self.uploadStateTip = None
+        self.importStateTip = None
 
         self.setupInterfaces()
         self.initWindow()
@@ -4217,7 +4594,7 @@ class TeacherMainWindow(FluentWindow):
         self.teacherController.dashboardDataReady.connect(self.onDashboardDataReady)
         self.teacherController.classesDataReady.connect(self.onClassesDataReady)
         self.teacherController.assignmentsDataReady.connect(self.onAssignmentsDataReady)
-        self.teacherController.questionsDataReady.connect(self.onQuestionsDataReady)
+        self.teacherController.questionsPageReady.connect(self.onQuestionsPageReady)
         self.teacherController.classDataReady.connect(self.onClassDataReady)
         self.teacherController.studentStatisticsReady.connect(
             self.onStudentStatisticsReady
@@ -4227,6 +4604,11 @@ class TeacherMainWindow(FluentWindow):
         )
         self.teacherController.classCreationResult.connect(self.onClassCreated)
         self.teacherController.questionCreationResult.connect(self.onQuestionCreated)
+        self.teacherController.imageUploadProgress.connect(self.onImageUploadProgress)
+        self.teacherController.questionImportProgress.connect(
+            self.onQuestionImportProgress
+        )
+        self.teacherController.questionImportResult.connect(self.onQuestionImportResult)
         self.teacherController.classAssignmentReviewReady.connect(
             self.onClassAssignmentReviewReady
         )
@@ -4351,7 +4733,9 @@ class TeacherMainWindow(FluentWindow):
             and self._loadStatus["assignments"]
             and self._loadStatus["questions"]
         ):
-            self.initNavigation()
+            if not getattr(self, "_isNavigationInitialized", False):
+                self._isNavigationInitialized = True
+                self.initNavigation()
             if self.homeInterface:
                 self.switchTo(self.homeInterface)
             self.splashScreen.hide()
@@ -4371,10 +4755,12 @@ class TeacherMainWindow(FluentWindow):
         if self.assignmentsInterface:
             self.assignmentsInterface.updateContent(assignmentsData)
 
-    def _updateQuestionsInterfaceContent(self, questionsData: list):
+    def _updateQuestionsInterfaceContent(
+        self, questionsData: list, nextCursor: Optional[int] = None
+    ):
         """Update questions interface content"""
         if self.questionsInterface:
-            self.questionsInterface.updateContent(questionsData)
+            self.questionsInterface.updateContent(questionsData, nextCursor)
 
     def onDashboardDataReady(self, data: dict):
         """Handle dashboard data ready"""
@@ -4420,20 +4806,25 @@ class TeacherMainWindow(FluentWindow):
                 self.assignmentsInterface.updateContent(data)
             self._finishLoading()
 
-    def onQuestionsDataReady(self, data: list):
-        """Handle questions data ready"""
-        if getattr(self, "_isBackgroundRefresh", False):
-            self._updateQuestionsInterfaceContent(data)
+    def onQuestionsPageReady(
+        self, cursor: Optional[int], data: list, nextCursor: Optional[int]
+    ):
+        """Handle a page of questions data ready"""
+        if cursor is not None:
+            if self.questionsInterface:
+                self.questionsInterface.appendQuestions(cursor, data, nextCursor)
+        elif getattr(self, "_isBackgroundRefresh", False):
+            self._updateQuestionsInterfaceContent(data, nextCursor)
             self._checkBackgroundRefreshComplete()
         else:
             self._loadStatus["questions"] = True
             if self.questionsInterface:
-                self._updateQuestionsInterfaceContent(data)
+                self._updateQuestionsInterfaceContent(data, nextCursor)
             else:
                 self.questionsInterface = TeacherQuestionsInterface(
                     self.teacherController, self
                 )
-                self.questionsInterface.updateContent(data)
+                self.questionsInterface.updateContent(data, nextCursor)
             self._finishLoading()
 
     def onClassDataReady(self, data: dict):
@@ -4517,6 +4908,81 @@ class TeacherMainWindow(FluentWindow):
             )
             self.loadData()
 
+    def onImageUploadProgress(self, uploaded: int, total: int, path: str):
+        """Show the progress of uploading the images of a new question"""
+        if self.uploadStateTip is None:
+            self.uploadStateTip = StateToolTip("Uploading Images", "", self)
+            self.uploadStateTip.move(self.uploadStateTip.getSuitablePos())
+            self.uploadStateTip.show()
+
+        if uploaded < total:
+            content = f"{uploaded} of {total} images uploaded"
+            if path:
+                content = f"Uploaded {os.path.basename(path)}, {uploaded} of {total}"
+            self.uploadStateTip.setContent(content)
+            return
+
+        self.uploadStateTip.setContent(f"{total} of {total} images uploaded")
+        self.uploadStateTip.setState(True)
+        self.uploadStateTip = None
+
+    def onQuestionImportProgress(self, finished: int, total: int, name: str):
+        """Show the progress of a bulk import, closing the tip cancels the import"""
+        if self.importStateTip is None:
+            self.importStateTip = StateToolTip("Importing Questions", "", self)
+            self.importStateTip.closedSignal.connect(
+                self.teacherController.cancelQuestionImport
+            )
+            self.importStateTip.move(self.importStateTip.getSuitablePos())
+            self.importStateTip.show()
+
+        self.importStateTip.setContent(f"{finished} of {total} questions imported")
+
+    def onQuestionImportResult(self, report: dict):
+        """Handle bulk import result, reporting the throughput achieved"""
+        if self.importStateTip is not None:
+            self.importStateTip.setState(True)
+            self.importStateTip = None
+
+        content = (
+            f"{report['imported']} of {report['total']} questions imported in "
+            f"{report['elapsed']:.1f}s ({report['questions_per_second']:.1f} "
+            f"questions/s, {report['sub_questions_per_second']:.1f} sub-questions/s)"
+        )
+        if report["skipped"]:
+            content += f", {report['skipped']} were imported before"
+
+        if report["failed"] or report["cancelled"]:
+            name, error = report["failed"][0] if report["failed"] else ("", "")
+            content += (
+                f". {len(report['failed'])} failed and {report['cancelled']} were "
+                "not started, import the manifest again to resume"
+            )
+            if name:
+                content += f". {name}: {error}"
+            InfoBar.warning(
+                title="Import Incomplete",
+                content=content,
+                orient=Qt.Orientation.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP,
+                duration=-1,
+                parent=self,
+            )
+        else:
+            InfoBar.success(
+                title="Questions Imported",
+                content=content,
+                orient=Qt.Orientation.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP,
+                duration=5000,
+                parent=self,
+            )
+
+        if report["imported"]:
+            self.loadData()
+
     def onClassAssignmentReviewReady(self, data: dict):
         """Handle class assignment review data ready"""
         self.handleShowAssignmentReview(data)
@@ -4595,6 +5061,12 @@ class TeacherMainWindow(FluentWindow):
     def onOperationError(self, operation: str, error: str):
         """Handle operation errors"""
         print(f"[TeacherMainWindow] Error in {operation}: {error}")
+        if operation == "create_question" and self.uploadStateTip is not None:
+            self.uploadStateTip.deleteLater()
+            self.uploadStateTip = None
+        if operation == "import_questions" and self.importStateTip is not None:
+            self.importStateTip.deleteLater()
+            self.importStateTip = None
         InfoBar.error(
             title="Error",
             content=error,
@@ -0,0 +1,166 @@
+import sys
+import argparse
+from dataclasses import asdict
+from PyQt6.QtCore import QCoreApplication
+
+from benchmark.dataset import Dataset, DatasetConfig
+from benchmark.harness import BenchmarkHarness, formatResults, writeJson
+from benchmark.standInServer import LatencyConfig, StandInServer
+
+
+def parseArgs(argv: list) -> argparse.Namespace:
+    """Parse the command line of the benchmark
+
+    Args:
+        argv (list): The arguments without the program name
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmark",
+        description="Time client operations against a local Nanoko stand-in server",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="only run the stand-in server, e.g. to point the real client at it "
+        "with NANOKO_BASE_URL",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument(
+        "--port", type=int, default=0, help="0 picks a free port (default)"
+    )
+
+    latency = parser.add_argument_group("latency")
+    latency.add_argument("--latency", type=float, default=0.05, help="seconds")
+    latency.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    latency.add_argument(
+        "--bandwidth", type=float, default=0.0, help="bytes per second, 0 = unlimited"
+    )
+    latency.add_argument("--hint-latency", type=float, default=1.0, help="seconds")
+    latency.add_argument(
+        "--hint-chunks", type=int, default=20, help="events per streamed hint"
+    )
+
+    defaults = DatasetConfig()
+    scale = parser.add_argument_group("dataset")
+    scale.add_argument("--students", type=int, default=defaults.students)
+    scale.add_argument("--classes", type=int, default=defaults.classes)
+    scale.add_argument("--questions", type=int, default=defaults.questions)
+    scale.add_argument(
+        "--sub-questions", type=int, default=defaults.subQuestionsPerQuestion
+    )
+    scale.add_argument("--images", type=int, default=defaults.images)
+    scale.add_argument("--image-bytes", type=int, default=defaults.imageBytes)
+    scale.add_argument(
+        "--description-length", type=int, default=defaults.descriptionLength
+    )
+    scale.add_argument(
+        "--assignments-per-class", type=int, default=defaults.assignmentsPerClass
+    )
+    scale.add_argument(
+        "--questions-per-assignment", type=int, default=defaults.questionsPerAssignment
+    )
+    scale.add_argument("--seed", type=int, default=defaults.seed)
+
+    run = parser.add_argument_group("run")
+    run.add_argument("--runs", type=int, default=5, help="runs per operation")
+    run.add_argument(
+        "--role",
+        choices=["student", "teacher", "all"],
+        default="all",
+        help="which client to drive",
+    )
+    run.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        help="only run operations whose name contains this, can be repeated",
+    )
+    run.add_argument(
+        "--response-cache",
+        action="store_true",
+        help="enable the ApiWorker response cache",
+    )
+    run.add_argument("--timeout", type=float, default=60.0, help="seconds per run")
+    run.add_argument("--json", help="also write the results to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None) -> int:
+    """Run the stand-in server and, unless --serve is given, the benchmark
+
+    Args:
+        argv (list): The arguments without the program name
+
+    Returns:
+        int: The exit code
+    """
+    args = parseArgs(sys.argv[1:] if argv is None else argv)
+
+    datasetConfig = DatasetConfig(
+        students=args.students,
+        classes=args.classes,
+        questions=args.questions,
+        subQuestionsPerQuestion=args.sub_questions,
+        images=args.images,
+        imageBytes=args.image_bytes,
+        descriptionLength=args.description_length,
+        assignmentsPerClass=args.assignments_per_class,
+        questionsPerAssignment=args.questions_per_assignment,
+        seed=args.seed,
+    )
+    latencyConfig = LatencyConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        bytesPerSecond=args.bandwidth,
+        hintLatency=args.hint_latency,
+        hintChunks=args.hint_chunks,
+    )
+    dataset = Dataset(datasetConfig)
+    server = StandInServer(dataset, latencyConfig, args.host, args.port)
+
+    if args.serve:
+        print(f"[Benchmark] Serving a stand-in Nanoko API at {server.url}")
+        print("[Benchmark] Sign in as 'teacher' or 'student0' with any password")
+        try:
+            server.serveForever()
+        except KeyboardInterrupt:
+            pass
+        server.httpServer.server_close()
+        return 0
+
+    app = QCoreApplication(sys.argv[:1])
+    server.start()
+    harness = BenchmarkHarness(
+        server.url, dataset, args.response_cache, timeout=args.timeout
+    )
+    roles = ["student", "teacher"] if args.role == "all" else [args.role]
+    try:
+        results = harness.runAll(args.runs, roles, args.only)
+    finally:
+        harness.close()
+        server.stop()
+
+    print(formatResults(results))
+    print(f"[Benchmark] {server.requestCount} requests served")
+    if args.json:
+        writeJson(
+            results,
+            args.json,
+            {
+                "dataset": asdict(datasetConfig),
+                "latency": asdict(latencyConfig),
+                "runs": args.runs,
+                "responseCache": args.response_cache,
+                "requests": server.requestCount,
+            },
+        )
+
+    del app
+    return 1 if any(result.errors for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
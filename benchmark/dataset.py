@@ -0,0 +1,331 @@
+import zlib
+import random
+import struct
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+CONCEPTS = 7
+PROCESSES = 3
+TEACHER_ID = 1
+FIRST_STUDENT_ID = 2
+
+
+@dataclass
+class DatasetConfig:
+    """Scale and payload sizes of a generated dataset"""
+
+    students: int = 30
+    classes: int = 2
+    questions: int = 200
+    subQuestionsPerQuestion: int = 3
+    images: int = 50
+    imageBytes: int = 32 * 1024
+    descriptionLength: int = 200
+    assignmentsPerClass: int = 6
+    questionsPerAssignment: int = 5
+    completedAssignmentRatio: float = 0.5
+    performanceDays: int = 30
+    seed: int = 0
+
+
+def makePng(size: int, seed: int) -> bytes:
+    """Build a valid PNG of roughly the given size
+
+    The pixels are random, so the image does not compress and its size
+    follows the requested number of bytes.
+
+    Args:
+        size (int): The approximate size of the file in bytes
+        seed (int): The seed of the pixels
+
+    Returns:
+        bytes: The PNG file
+    """
+    side = max(1, int((size / 3) ** 0.5))
+    rng = random.Random(seed)
+    rows = b"".join(b"\x00" + rng.randbytes(side * 3) for _ in range(side))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + kind
+            + data
+            + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+        )
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", side, side, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(rows, 1))
+        + chunk(b"IEND", b"")
+    )
+
+
+class Dataset:
+    """Deterministic in-memory data served by the stand-in server
+
+    One teacher owns every class, students are spread evenly over the classes
+    and every class has its own assignments built from the question bank. A
+    share of each class's assignments is already completed by its students.
+    Submissions made during a run are kept in memory. All methods are
+    thread-safe.
+    """
+
+    def __init__(self, config: DatasetConfig = None):
+        self.config = config or DatasetConfig()
+        self._rng = random.Random(self.config.seed)
+        self.lock = threading.RLock()
+        self._imageBytes = {}
+
+        self.now = datetime.now(timezone.utc).replace(microsecond=0)
+        self.teacher = self._makeUser(TEACHER_ID, "teacher", "Test Teacher", 1)
+        self.students = [
+            self._makeUser(
+                FIRST_STUDENT_ID + index,
+                f"student{index}",
+                f"Student {index}",
+                0,
+            )
+            for index in range(self.config.students)
+        ]
+        self.usersById = {user["id"]: user for user in [self.teacher, *self.students]}
+        self.usersByName = {user["name"]: user for user in self.usersById.values()}
+
+        self._makeQuestions()
+        self._makeClasses()
+        self._makeSubmissions()
+
+    def _makeUser(self, userId: int, name: str, displayName: str, permission: int):
+        return {
+            "id": userId,
+            "name": name,
+            "display_name": displayName,
+            "email": f"{name}@example.com",
+            "permission": permission,
+        }
+
+    def _text(self, length: int) -> str:
+        words = ["number", "total", "shape", "graph", "price", "chance", "metre"]
+        text = ""
+        while len(text) < length:
+            text += self._rng.choice(words) + " "
+        return text[:length].strip()
+
+    def _makeQuestions(self):
+        config = self.config
+        self.questions = []
+        self.subQuestions = {}
+        subQuestionId = 1
+
+        for questionId in range(1, config.questions + 1):
+            subQuestions = []
+            for _ in range(config.subQuestionsPerQuestion):
+                isChoice = self._rng.random() < 0.3
+                subQuestion = {
+                    "id": subQuestionId,
+                    "description": self._text(config.descriptionLength),
+                    "answer": "A" if isChoice else "42",
+                    "concept": self._rng.randrange(CONCEPTS),
+                    "process": self._rng.randrange(PROCESSES),
+                    "keywords": ["number"],
+                    "options": ["A", "B", "C", "D"] if isChoice else None,
+                    "image_id": (
+                        self._rng.randrange(1, config.images + 1)
+                        if config.images and self._rng.random() < 0.6
+                        else None
+                    ),
+                }
+                subQuestions.append(subQuestion)
+                self.subQuestions[subQuestionId] = (questionId, subQuestion)
+                subQuestionId += 1
+
+            self.questions.append(
+                {
+                    "id": questionId,
+                    "name": f"Question {questionId}",
+                    "source": "nzqa" if questionId % 2 else "custom",
+                    "is_audited": True,
+                    "sub_questions": subQuestions,
+                }
+            )
+
+        self.questionsById = {question["id"]: question for question in self.questions}
+
+    def _makeClasses(self):
+        config = self.config
+        self.classes = []
+        self.assignments = []
+        self.classOfStudent = {}
+        assignmentId = 1
+
+        for classIndex in range(config.classes):
+            classId = classIndex + 1
+            students = self.students[classIndex :: config.classes]
+            assignments = []
+
+            for assignmentIndex in range(config.assignmentsPerClass):
+                questionIds = self._rng.sample(
+                    [question["id"] for question in self.questions],
+                    min(config.questionsPerAssignment, len(self.questions)),
+                )
+                dueDate = self.now + timedelta(days=assignmentIndex - 2)
+                assignment = {
+                    "id": assignmentId,
+                    "name": f"Assignment {assignmentId}",
+                    "description": self._text(config.descriptionLength // 2),
+                    "teacher_id": TEACHER_ID,
+                    "question_ids": questionIds,
+                    "due_date": dueDate.isoformat(),
+                    "has_image": assignmentId % 2 == 1,
+                }
+                assignments.append(assignment)
+                self.assignments.append(assignment)
+                assignmentId += 1
+
+            self.classes.append(
+                {
+                    "id": classId,
+                    "name": f"Class {classId}",
+                    "enter_code": f"code{classId}",
+                    "students": students,
+                    "assignments": assignments,
+                }
+            )
+            for student in students:
+                self.classOfStudent[student["id"]] = self.classes[-1]
+
+        self.classesById = {class_["id"]: class_ for class_ in self.classes}
+        self.assignmentsById = {
+            assignment["id"]: assignment for assignment in self.assignments
+        }
+
+    def _makeSubmissions(self):
+        config = self.config
+        self.submissions = {}  # (student id, sub-question id) -> submission
+
+        for student in self.students:
+            class_ = self.classOfStudent[student["id"]]
+            completed = int(
+                len(class_["assignments"]) * config.completedAssignmentRatio
+            )
+            for assignment in class_["assignments"][:completed]:
+                for subQuestion in self.assignmentSubQuestions(assignment):
+                    self.submissions[(student["id"], subQuestion["id"])] = {
+                        "assignment_id": assignment["id"],
+                        "answer": subQuestion["answer"],
+                        "performance": self._rng.randrange(1, 5),
+                        "feedback": "Good work.",
+                        "date": (
+                            self.now - timedelta(days=self._rng.randrange(30))
+                        ).isoformat(),
+                    }
+
+    def assignmentSubQuestions(self, assignment: dict) -> list:
+        """Get every sub-question of an assignment
+
+        Args:
+            assignment (dict): The assignment
+
+        Returns:
+            list: The sub-questions in question order
+        """
+        return [
+            subQuestion
+            for questionId in assignment["question_ids"]
+            for subQuestion in self.questionsById[questionId]["sub_questions"]
+        ]
+
+    def image(self, imageId: int) -> bytes:
+        """Get the bytes of an image, generating them on first use
+
+        Args:
+            imageId (int): The id of the image
+
+        Returns:
+            bytes: The PNG file
+        """
+        with self.lock:
+            data = self._imageBytes.get(imageId)
+            if data is None:
+                data = makePng(self.config.imageBytes, self.config.seed + imageId)
+                self._imageBytes[imageId] = data
+            return data
+
+    def submission(self, studentId: int, subQuestionId: int):
+        with self.lock:
+            return self.submissions.get((studentId, subQuestionId))
+
+    def submit(
+        self, studentId: int, assignmentId: int, subQuestionId: int, answer: str
+    ) -> dict:
+        """Record a submission and grade it
+
+        Args:
+            studentId (int): The id of the student
+            assignmentId (int): The id of the assignment
+            subQuestionId (int): The id of the sub-question
+            answer (str): The submitted answer
+
+        Returns:
+            dict: The feedback
+        """
+        _, subQuestion = self.subQuestions[subQuestionId]
+        performance = 4 if answer == subQuestion["answer"] else 1
+        feedback = "Correct." if performance == 4 else "Have another look."
+
+        with self.lock:
+            self.submissions[(studentId, subQuestionId)] = {
+                "assignment_id": assignmentId,
+                "answer": answer,
+                "performance": performance,
+                "feedback": feedback,
+                "date": datetime.now(timezone.utc).isoformat(),
+            }
+        return {"comment": feedback, "performance": performance}
+
+    def performances(self, userId: int) -> dict:
+        """Get a deterministic performance matrix for a user or class
+
+        Args:
+            userId (int): The id used to seed the matrix
+
+        Returns:
+            dict: The performances keyed by concept and process
+        """
+        rng = random.Random(self.config.seed * 1000 + userId)
+        concepts = [
+            "operations_on_numbers",
+            "mathematical_relationships",
+            "spatial_properties_and_representations",
+            "location_and_navigation",
+            "measurement",
+            "statistics_and_data",
+            "elements_of_chance",
+        ]
+        return {
+            concept: {
+                process: round(rng.uniform(0, 4), 2)
+                for process in ("formulate", "apply", "explain")
+            }
+            for concept in concepts
+        }
+
+    def performanceDateData(self, userId: int) -> dict:
+        """Get a deterministic daily average performance series
+
+        Args:
+            userId (int): The id of the student
+
+        Returns:
+            dict: The scores and their dates
+        """
+        rng = random.Random(self.config.seed * 1000 + userId)
+        days = self.config.performanceDays
+        return {
+            "performances": [round(rng.uniform(0, 4), 2) for _ in range(days)],
+            "dates": [
+                (self.now - timedelta(days=days - index)).isoformat()
+                for index in range(days)
+            ],
+        }
@@ -0,0 +1,566 @@
+import os
+import json
+import time
+import tempfile
+import statistics
+from itertools import count
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+from PyQt6.QtCore import QEventLoop, QTimer, pyqtBoundSignal
+
+from nanoko import Nanoko
+from nanoko.models.question import ConceptType, ProcessType
+
+from app.controllers.apiWorker import ApiWorker
+from app.controllers.imageCache import ImageCache
+from app.controllers.responseCache import ResponseCache
+from app.controllers.studentController import StudentController
+from app.controllers.teacherController import TeacherController
+from app.utils import enumNameToText
+from benchmark.dataset import Dataset, makePng
+
+
+@dataclass
+class Operation:
+    """A controller call and the signal that completes it"""
+
+    name: str
+    call: Callable[[int], None]  # run index -> None
+    readySignal: pyqtBoundSignal
+    errorSignal: pyqtBoundSignal
+    progressSignal: Optional[pyqtBoundSignal] = None  # e.g. a streamed chunk
+
+
+@dataclass
+class OperationResult:
+    """Time-to-signal samples of one operation in milliseconds"""
+
+    name: str
+    samples: List[float] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        """Summarise the samples
+
+        Returns:
+            dict: The first, min, median, p95 and max times, and the error count
+        """
+        if not self.samples:
+            return {"name": self.name, "runs": 0, "errors": len(self.errors)}
+
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+        return {
+            "name": self.name,
+            "runs": len(self.samples),
+            "errors": len(self.errors),
+            "first": self.samples[0],
+            "min": ordered[0],
+            "median": statistics.median(ordered),
+            "p95": p95,
+            "max": ordered[-1],
+        }
+
+
+class BenchmarkHarness:
+    """Headless driver measuring controller operations end to end
+
+    Each operation is started through the real StudentController or
+    TeacherController and timed until its ready signal reaches the GUI
+    thread, so the numbers include the HTTP round trips, ApiWorker
+    scheduling and caching, but no widget work.
+    """
+
+    def __init__(
+        self,
+        baseUrl: str,
+        dataset: Dataset,
+        useResponseCache: bool = False,
+        timeout: float = 60.0,
+    ):
+        self.baseUrl = baseUrl
+        self.dataset = dataset
+        self.useResponseCache = useResponseCache
+        self.timeout = timeout
+        self._imageDir = tempfile.TemporaryDirectory(prefix="nanoko-benchmark-")
+
+    def _createWorker(self, username: str) -> ApiWorker:
+        """Create an ApiWorker with empty caches and sign it in
+
+        Args:
+            username (str): The user to sign in as
+
+        Returns:
+            ApiWorker: The signed in worker
+        """
+        self._imageDir.cleanup()
+        self._imageDir = tempfile.TemporaryDirectory(prefix="nanoko-benchmark-")
+        apiWorker = ApiWorker(
+            Nanoko(base_url=self.baseUrl),
+            imageCache=ImageCache(self._imageDir.name),
+            responseCache=ResponseCache() if self.useResponseCache else None,
+        )
+        result = {}
+
+        def onSignInFinished(success: bool, message: str, user):
+            result["success"], result["message"] = success, message
+
+        apiWorker.signInFinished.connect(onSignInFinished)
+        self._wait(
+            lambda: apiWorker.submit("signin", username=username, password="password"),
+            apiWorker.signInFinished,
+            apiWorker.operationFailed,
+        )
+        if not result.get("success"):
+            raise RuntimeError(f"Failed to sign in as {username}: {result}")
+        return apiWorker
+
+    def _wait(
+        self,
+        start: Callable[[], None],
+        readySignal: pyqtBoundSignal,
+        errorSignal: pyqtBoundSignal,
+    ) -> Optional[str]:
+        """Start an operation and block in an event loop until it completes
+
+        Args:
+            start (Callable[[], None]): Starts the operation
+            readySignal (pyqtBoundSignal): Emitted when the operation succeeds
+            errorSignal (pyqtBoundSignal): Emitted when the operation fails
+
+        Returns:
+            Optional[str]: The error, or None if the operation succeeded
+        """
+        loop = QEventLoop()
+        outcome = {}
+
+        def onReady(*args):
+            outcome.setdefault("error", None)
+            loop.quit()
+
+        def onError(operation: str, message: str):
+            outcome.setdefault("error", f"{operation}: {message}")
+            loop.quit()
+
+        def onTimeout():
+            outcome.setdefault("error", "timed out")
+            loop.quit()
+
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(onTimeout)
+        readySignal.connect(onReady)
+        errorSignal.connect(onError)
+        try:
+            timer.start(int(self.timeout * 1000))
+            start()
+            if "error" not in outcome:
+                loop.exec()
+        finally:
+            timer.stop()
+            readySignal.disconnect(onReady)
+            errorSignal.disconnect(onError)
+        return outcome["error"]
+
+    def run(self, operation: Operation, runs: int) -> List[OperationResult]:
+        """Time an operation several times
+
+        Operations with a progress signal also report the time until its
+        first emission, e.g. the time to the first token of a streamed reply.
+
+        Args:
+            operation (Operation): The operation
+            runs (int): The number of runs
+
+        Returns:
+            List[OperationResult]: The samples and errors of the runs, followed
+                by the first progress times if the operation has a progress signal
+        """
+        result = OperationResult(operation.name)
+        progress = OperationResult(f"{operation.name} (first)")
+        for index in range(runs):
+            firstProgress = []
+
+            def onProgress(*args, firstProgress=firstProgress):
+                if not firstProgress:
+                    firstProgress.append(time.perf_counter())
+
+            if operation.progressSignal is not None:
+                operation.progressSignal.connect(onProgress)
+            start = time.perf_counter()
+            try:
+                error = self._wait(
+                    lambda index=index: operation.call(index),
+                    operation.readySignal,
+                    operation.errorSignal,
+                )
+            finally:
+                if operation.progressSignal is not None:
+                    operation.progressSignal.disconnect(onProgress)
+            elapsed = (time.perf_counter() - start) * 1000
+            if error is None:
+                result.samples.append(elapsed)
+                if firstProgress:
+                    progress.samples.append((firstProgress[0] - start) * 1000)
+            else:
+                result.errors.append(error)
+                print(f"[BenchmarkHarness] {operation.name} failed: {error}")
+
+        if operation.progressSignal is None:
+            return [result]
+        return [result, progress]
+
+    def studentOperations(self, controller: StudentController) -> List[Operation]:
+        """Build the timed operations of the student client
+
+        Args:
+            controller (StudentController): The controller to drive
+
+        Returns:
+            List[Operation]: The operations
+        """
+        dataset = self.dataset
+        student = dataset.students[0]
+        class_ = dataset.classOfStudent[student["id"]]
+        completed = int(
+            len(class_["assignments"]) * dataset.config.completedAssignmentRatio
+        )
+        doneAssignment = class_["assignments"][0]
+        todoAssignment = class_["assignments"][
+            min(completed, len(class_["assignments"]) - 1)
+        ]
+        subQuestions = dataset.assignmentSubQuestions(todoAssignment)
+        imageIds = count(1)
+
+        def loadImage(index: int):
+            # bypass the controller's in-flight dedup so every run reaches the worker
+            imageId = next(imageIds)
+            controller._pendingImageIds.discard(imageId)
+            controller.loadImage(imageId)
+
+        def submitSubQuestion(index: int):
+            subQuestion = subQuestions[index % len(subQuestions)]
+            controller.submitSubQuestion(
+                todoAssignment["id"], subQuestion["id"], subQuestion["answer"]
+            )
+
+        error = controller.errorOccurred
+        return [
+            Operation(
+                "student.loadDashboardData",
+                lambda index: controller.loadDashboardData(),
+                controller.dashboardDataReady,
+                error,
+            ),
+            Operation(
+                "student.loadClassData",
+                lambda index: controller.loadClassData(),
+                controller.classDataReady,
+                error,
+            ),
+            Operation(
+                "student.loadQuestions",
+                lambda index: controller.loadQuestions(),
+                controller.questionsReady,
+                error,
+            ),
+            Operation(
+                "student.loadAssignmentData",
+                lambda index: controller.loadAssignmentData(todoAssignment["id"]),
+                controller.questionAnsweringDataReady,
+                error,
+            ),
+            Operation(
+                "student.loadAssignmentReviewData",
+                lambda index: controller.loadAssignmentReviewData(doneAssignment["id"]),
+                controller.assignmentReviewDataReady,
+                error,
+            ),
+            Operation(
+                "student.loadQuestionReviewData",
+                lambda index: controller.loadQuestionReviewData(
+                    doneAssignment["question_ids"][0]
+                ),
+                controller.questionReviewDataReady,
+                error,
+            ),
+            Operation("student.loadImage", loadImage, controller.imageReady, error),
+            Operation(
+                "student.submitSubQuestion",
+                submitSubQuestion,
+                controller.subQuestionFeedbackReady,
+                error,
+            ),
+            Operation(
+                "student.sendAIMessage",
+                lambda index: controller.sendAIMessage(
+                    "How do I start?", subQuestions[0]["id"], []
+                ),
+                controller.aiResponseReady,
+                error,
+                controller.aiResponseChunkReady,
+            ),
+        ]
+
+    def teacherOperations(self, controller: TeacherController) -> List[Operation]:
+        """Build the timed operations of the teacher client
+
+        Args:
+            controller (TeacherController): The controller to drive
+
+        Returns:
+            List[Operation]: The operations
+        """
+        dataset = self.dataset
+        class_ = dataset.classes[0]
+        student = class_["students"][0]
+        assignment = class_["assignments"][0]
+        question = dataset.questions[0]
+
+        def createQuestion(index: int):
+            # ten sub-questions sharing four image files, so the first run
+            # uploads four files and later runs only register them again
+            paths = []
+            for imageIndex in range(4):
+                path = os.path.join(self._imageDir.name, f"upload{imageIndex}.png")
+                if not os.path.exists(path):
+                    with open(path, "wb") as file:
+                        file.write(
+                            makePng(
+                                dataset.config.imageBytes,
+                                dataset.config.seed - imageIndex - 1,
+                            )
+                        )
+                paths.append(path)
+
+            controller.createQuestion(
+                f"Benchmark question {index}",
+                "Benchmark",
+                [
+                    {
+                        "description": f"Sub-question {subIndex}",
+                        "answer": "42",
+                        "concept": enumNameToText(ConceptType(0).name),
+                        "process": enumNameToText(ProcessType(0).name),
+                        "keywords": None,
+                        "options": None,
+                        "image_path": paths[subIndex % len(paths)],
+                        "image_description": f"Figure {subIndex}",
+                    }
+                    for subIndex in range(10)
+                ],
+            )
+
+        def importQuestions(index: int):
+            # twenty questions of three sub-questions sharing eight image files,
+            # named after the run so an earlier run's questions aren't skipped
+            folder = os.path.join(self._imageDir.name, f"import{index}")
+            os.makedirs(folder, exist_ok=True)
+            for imageIndex in range(8):
+                path = os.path.join(self._imageDir.name, f"import{imageIndex}.png")
+                if not os.path.exists(path):
+                    with open(path, "wb") as file:
+                        file.write(
+                            makePng(
+                                dataset.config.imageBytes,
+                                dataset.config.seed + imageIndex + 1,
+                            )
+                        )
+
+            with open(os.path.join(folder, "manifest.json"), "w") as file:
+                json.dump(
+                    {
+                        "source": "Benchmark",
+                        "questions": [
+                            {
+                                "name": f"Imported question {index}.{questionIndex}",
+                                "sub_questions": [
+                                    {
+                                        "description": f"Sub-question {subIndex}",
+                                        "answer": "42",
+                                        "concept": enumNameToText(
+                                            ConceptType(subIndex).name
+                                        ),
+                                        "process": enumNameToText(
+                                            ProcessType(subIndex).name
+                                        ),
+                                        "image": os.path.join(
+                                            "..",
+                                            f"import{(questionIndex + subIndex) % 8}.png",
+                                        ),
+                                        "image_description": f"Figure {subIndex}",
+                                    }
+                                    for subIndex in range(3)
+                                ],
+                            }
+                            for questionIndex in range(20)
+                        ],
+                    },
+                    file,
+                )
+            controller.importQuestions(folder)
+
+        error = controller.operationError
+        return [
+            Operation(
+                "teacher.loadDashboardData",
+                lambda index: controller.loadDashboardData(),
+                controller.dashboardDataReady,
+                error,
+            ),
+            Operation(
+                "teacher.loadAssignmentsData",
+                lambda index: controller.loadAssignmentsData(),
+                controller.assignmentsDataReady,
+                error,
+            ),
+            Operation(
+                "teacher.loadQuestionsData",
+                lambda index: controller.loadQuestionsData(),
+                controller.questionsPageReady,
+                error,
+            ),
+            Operation(
+                "teacher.loadMoreQuestions",
+                lambda index: controller.loadMoreQuestions(question["id"]),
+                controller.questionsPageReady,
+                error,
+            ),
+            Operation(
+                "teacher.loadClassData",
+                lambda index: controller.loadClassData(class_["id"]),
+                controller.classDataReady,
+                error,
+            ),
+            Operation(
+                "teacher.loadStudentStatistics",
+                lambda index: controller.loadStudentStatistics(
+                    student["id"], student["display_name"], class_["id"]
+                ),
+                controller.studentStatisticsReady,
+                error,
+            ),
+            Operation(
+                "teacher.loadClassAssignmentReview",
+                lambda index: controller.loadClassAssignmentReview(
+                    assignment["id"], class_["id"]
+                ),
+                controller.classAssignmentReviewReady,
+                error,
+            ),
+            Operation(
+                "teacher.loadFilteredQuestions",
+                lambda index: controller.loadFilteredQuestions(
+                    "number", "All Concepts", "All Processes"
+                ),
+                controller.filteredQuestionsDataReady,
+                error,
+            ),
+            Operation(
+                "teacher.loadQuestionPreview",
+                lambda index: controller.loadQuestionPreview(question["id"]),
+                controller.questionPreviewDataReady,
+                error,
+            ),
+            Operation(
+                "teacher.loadAssignmentQuestions",
+                lambda index: controller.loadAssignmentQuestions(assignment["id"]),
+                controller.assignmentQuestionsDataReady,
+                error,
+            ),
+            Operation(
+                "teacher.createQuestion",
+                createQuestion,
+                controller.questionCreationResult,
+                error,
+            ),
+            Operation(
+                "teacher.importQuestions",
+                importQuestions,
+                controller.questionImportResult,
+                error,
+                controller.questionImportProgress,
+            ),
+        ]
+
+    def runAll(
+        self, runs: int, roles: List[str], only: List[str] = None
+    ) -> List[OperationResult]:
+        """Time every operation of the given roles
+
+        Args:
+            runs (int): The number of runs per operation
+            roles (List[str]): "student" and/or "teacher"
+            only (List[str]): Substrings selecting operations, all if empty
+
+        Returns:
+            List[OperationResult]: The results in run order
+        """
+        results = []
+        for role in roles:
+            if role == "student":
+                apiWorker = self._createWorker(self.dataset.students[0]["name"])
+                operations = self.studentOperations(StudentController(apiWorker))
+            else:
+                apiWorker = self._createWorker(self.dataset.teacher["name"])
+                operations = self.teacherOperations(TeacherController(apiWorker))
+
+            for operation in operations:
+                if only and not any(name in operation.name for name in only):
+                    continue
+                results.extend(self.run(operation, runs))
+            apiWorker.waitForDone()
+        return results
+
+    def close(self):
+        """Remove the temporary image cache"""
+        self._imageDir.cleanup()
+
+
+def formatResults(results: List[OperationResult]) -> str:
+    """Format results as a text table
+
+    Args:
+        results (List[OperationResult]): The results
+
+    Returns:
+        str: The table
+    """
+    columns = ["first", "min", "median", "p95", "max"]
+    width = max([len("operation")] + [len(result.name) for result in results])
+    lines = [
+        f"{'operation':<{width}}  {'runs':>4}  {'err':>3}  "
+        + "  ".join(f"{column + ' ms':>9}" for column in columns)
+    ]
+    for result in results:
+        summary = result.summary()
+        values = "  ".join(
+            f"{summary[column]:>9.1f}" if column in summary else f"{'-':>9}"
+            for column in columns
+        )
+        lines.append(
+            f"{result.name:<{width}}  {summary['runs']:>4}  {summary['errors']:>3}  {values}"
+        )
+    return "\n".join(lines)
+
+
+def writeJson(results: List[OperationResult], path: str, metadata: dict):
+    """Write the results and the run configuration to a JSON file
+
+    Args:
+        results (List[OperationResult]): The results
+        path (str): The output path
+        metadata (dict): The configuration of the run
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "config": metadata,
+                "results": [
+                    {**result.summary(), "samples": result.samples}
+                    for result in results
+                ],
+            },
+            file,
+            indent=2,
+        )
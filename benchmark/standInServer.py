@@ -0,0 +1,697 @@
+import json
+import time
+import random
+import hashlib
+import threading
+from dataclasses import dataclass
+from urllib.parse import parse_qs, urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmark.dataset import Dataset, DatasetConfig
+
+
+@dataclass
+class LatencyConfig:
+    """Simulated network and backend costs of the stand-in server"""
+
+    latency: float = 0.05  # seconds added to every request
+    jitter: float = 0.0  # extra random seconds in [0, jitter]
+    bytesPerSecond: float = 0.0  # simulated bandwidth, 0 for unlimited
+    hintLatency: float = 1.0  # extra seconds for AI hints
+    hintChunks: int = 20  # events a streamed hint is split into
+
+
+class HttpError(Exception):
+    """Error response raised by a route"""
+
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+class StandInServer:
+    """Local stand-in for the Nanoko HTTP API
+
+    Serves the endpoints used by ApiWorker from a generated Dataset, with
+    configurable latency, bandwidth and dataset scale, so the client can be
+    profiled reproducibly without a real backend. Any password is accepted;
+    the users are "teacher" and "student0" ... "studentN".
+    """
+
+    def __init__(
+        self,
+        dataset: Dataset = None,
+        latencyConfig: LatencyConfig = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.dataset = dataset or Dataset(DatasetConfig())
+        self.latencyConfig = latencyConfig or LatencyConfig()
+        self.requestCount = 0
+        self._countLock = threading.Lock()
+        self._rng = random.Random(self.dataset.config.seed)
+        self._nextIds = {"class": 1000, "assignment": 1000, "image": 1000, "user": 1000}
+        self._routes = self._buildRoutes()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # the headers and body are separate writes, with Nagle on the
+            # client's delayed ACK would hold up the body by ~40 ms
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                server._handle(self, "GET")
+
+            def do_POST(self):
+                server._handle(self, "POST")
+
+            def do_DELETE(self):
+                server._handle(self, "DELETE")
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpServer = ThreadingHTTPServer((host, port), Handler)
+        self.httpServer.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """The base URL of the server"""
+        host, port = self.httpServer.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(
+            target=self.httpServer.serve_forever, name="StandInServer", daemon=True
+        )
+        self._thread.start()
+
+    def serveForever(self):
+        """Serve requests on the current thread until interrupted"""
+        self.httpServer.serve_forever()
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self.httpServer.shutdown()
+        self.httpServer.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _buildRoutes(self) -> dict:
+        return {
+            ("POST", "/api/v1/user/token"): self._token,
+            ("POST", "/api/v1/user/register"): self._register,
+            ("GET", "/api/v1/user/me"): self._me,
+            ("GET", "/api/v1/service/overview"): self._overview,
+            ("GET", "/api/v1/service/overview/teacher"): self._teacherOverview,
+            ("GET", "/api/v1/service/performances/date"): self._performanceDateData,
+            ("GET", "/api/v1/service/performances/average"): self._performances,
+            ("GET", "/api/v1/service/performances/average/recent"): self._performances,
+            ("GET", "/api/v1/service/performances/best"): self._performances,
+            ("GET", "/api/v1/service/performances/best/recent"): self._performances,
+            ("GET", "/api/v1/user/class/data"): self._classData,
+            ("GET", "/api/v1/user/questions"): self._userQuestions,
+            ("GET", "/api/v1/user/questions/completed"): self._completedQuestions,
+            ("GET", "/api/v1/user/question/completed"): self._completedQuestion,
+            (
+                "GET",
+                "/api/v1/user/sub-questions/completed",
+            ): self._completedSubQuestions,
+            ("GET", "/api/v1/user/assignments"): self._assignments,
+            ("GET", "/api/v1/user/assignment/image/get"): self._assignmentImage,
+            ("GET", "/api/v1/user/assignment/review"): self._assignmentReview,
+            ("POST", "/api/v1/user/submit"): self._submit,
+            ("POST", "/api/v1/user/class/join"): self._joinClass,
+            ("POST", "/api/v1/user/class/create"): self._createClass,
+            ("POST", "/api/v1/user/class/kick"): self._kickStudent,
+            ("POST", "/api/v1/user/assignment/create"): self._createAssignment,
+            ("POST", "/api/v1/user/assignment/assign"): self._assignAssignment,
+            ("GET", "/api/v1/bank/question/get"): self._bankQuestions,
+            ("GET", "/api/v1/bank/image/get"): self._image,
+            ("POST", "/api/v1/bank/image/upload"): self._uploadImage,
+            ("POST", "/api/v1/bank/image/add"): self._addImage,
+            ("POST", "/api/v1/bank/question/add"): self._addQuestion,
+            ("POST", "/api/v1/llm/hint"): self._hint,
+        }
+
+    def _handle(self, handler: BaseHTTPRequestHandler, method: str):
+        """Route a request and write its response after the simulated delay"""
+        with self._countLock:
+            self.requestCount += 1
+
+        start = time.perf_counter()
+        url = urlsplit(handler.path)
+        query = parse_qs(url.query)
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length) if length else b""
+
+        status, contentType, payload = 200, "application/json", b""
+        route = self._routes.get((method, url.path))
+        try:
+            if route is None:
+                raise HttpError(404, "Not Found")
+            result = route(handler, query, body)
+            if result is None:
+                status = 204
+            elif isinstance(result, bytes):
+                contentType, payload = "image/png", result
+            else:
+                payload = json.dumps(result).encode()
+        except HttpError as e:
+            status, payload = e.status, json.dumps({"detail": e.detail}).encode()
+        except Exception as e:
+            status, payload = 500, json.dumps({"detail": str(e)}).encode()
+
+        config = self.latencyConfig
+        delay = config.latency + self._rng.uniform(0, config.jitter)
+        if config.bytesPerSecond:
+            delay += (len(body) + len(payload)) / config.bytesPerSecond
+        isStream = (
+            route == self._hint
+            and status == 200
+            and "text/event-stream" in handler.headers.get("Accept", "")
+        )
+        if route == self._hint and not isStream:
+            delay += config.hintLatency
+        remaining = delay - (time.perf_counter() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+
+        if isStream:
+            self._streamHint(handler, json.loads(payload)["hint"])
+            return
+
+        handler.send_response(status)
+        handler.send_header("Content-Type", contentType)
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        if payload:
+            handler.wfile.write(payload)
+
+    def _streamHint(self, handler: BaseHTTPRequestHandler, hint: str):
+        """Send a hint as server-sent events spread over the hint latency
+
+        Args:
+            handler (BaseHTTPRequestHandler): The request handler
+            hint (str): The full hint
+        """
+        config = self.latencyConfig
+        words = hint.split(" ")
+        size = max(1, -(-len(words) // max(1, config.hintChunks)))
+        chunks = [
+            " ".join(words[index : index + size]) + " "
+            for index in range(0, len(words), size)
+        ]
+        chunks[-1] = chunks[-1].rstrip()
+
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Transfer-Encoding", "chunked")
+        handler.end_headers()
+
+        def write(data: str):
+            encoded = data.encode()
+            handler.wfile.write(f"{len(encoded):x}\r\n".encode() + encoded + b"\r\n")
+            handler.wfile.flush()
+
+        for chunk in chunks:
+            time.sleep(config.hintLatency / len(chunks))
+            write(f"data: {json.dumps({'delta': chunk})}\n\n")
+        write("data: [DONE]\n\n")
+        handler.wfile.write(b"0\r\n\r\n")
+
+    # Helpers
+
+    def _user(self, handler: BaseHTTPRequestHandler) -> dict:
+        authorization = handler.headers.get("Authorization", "")
+        token = authorization.removeprefix("Bearer ")
+        user = self.dataset.usersByName.get(token)
+        if user is None:
+            raise HttpError(401, "Not authenticated")
+        return user
+
+    def _teacher(self, handler: BaseHTTPRequestHandler) -> dict:
+        user = self._user(handler)
+        if user["permission"] < 1:
+            raise HttpError(403, "Permission denied")
+        return user
+
+    def _studentClass(self, user: dict) -> dict:
+        class_ = self.dataset.classOfStudent.get(user["id"])
+        if class_ is None:
+            raise HttpError(404, "User is not in any class")
+        return class_
+
+    def _param(self, query: dict, name: str, default=None):
+        values = query.get(name)
+        return values[0] if values else default
+
+    def _intParam(self, query: dict, name: str) -> int:
+        value = self._param(query, name)
+        if value is None:
+            raise HttpError(422, f"Missing parameter: {name}")
+        return int(value)
+
+    def _json(self, body: bytes) -> dict:
+        return json.loads(body or b"{}")
+
+    def _nextId(self, kind: str) -> int:
+        with self.dataset.lock:
+            self._nextIds[kind] += 1
+            return self._nextIds[kind]
+
+    @staticmethod
+    def _assignment(assignment: dict) -> dict:
+        return {key: value for key, value in assignment.items() if key != "has_image"}
+
+    @staticmethod
+    def _subQuestion(subQuestion: dict, submission: dict = None) -> dict:
+        data = {key: value for key, value in subQuestion.items() if value is not None}
+        if submission is not None:
+            data["submitted_answer"] = submission["answer"]
+            data["performance"] = submission["performance"]
+            data["feedback"] = submission["feedback"]
+        return data
+
+    def _question(self, question: dict, subQuestions: list = None) -> dict:
+        return {
+            **question,
+            "sub_questions": [
+                self._subQuestion(subQuestion)
+                for subQuestion in (
+                    question["sub_questions"] if subQuestions is None else subQuestions
+                )
+            ],
+        }
+
+    def _isDone(self, user: dict, assignment: dict) -> bool:
+        return all(
+            self.dataset.submission(user["id"], subQuestion["id"]) is not None
+            for subQuestion in self.dataset.assignmentSubQuestions(assignment)
+        )
+
+    # Users
+
+    def _token(self, handler, query, body):
+        form = parse_qs(body.decode())
+        username = (form.get("username") or [""])[0]
+        if username not in self.dataset.usersByName:
+            raise HttpError(401, "Incorrect username or password")
+        return {"access_token": username, "token_type": "bearer"}
+
+    def _register(self, handler, query, body):
+        data = self._json(body)
+        if data["username"] in self.dataset.usersByName:
+            raise HttpError(400, "Username already registered")
+        user = {
+            "id": self._nextId("user"),
+            "name": data["username"],
+            "display_name": data["display_name"],
+            "email": data["email"],
+            "permission": data["permission"],
+        }
+        with self.dataset.lock:
+            self.dataset.usersById[user["id"]] = user
+            self.dataset.usersByName[user["name"]] = user
+        return user
+
+    def _me(self, handler, query, body):
+        return self._user(handler)
+
+    # Service
+
+    def _overview(self, handler, query, body):
+        user = self._user(handler)
+        class_ = self._studentClass(user)
+        return {
+            "class_name": class_["name"],
+            "assignments": [
+                self._assignment(assignment)
+                for assignment in class_["assignments"]
+                if not self._isDone(user, assignment)
+            ],
+            "display_name": user["display_name"],
+            "total_question_number": sum(
+                1
+                for (studentId, _) in list(self.dataset.submissions)
+                if studentId == user["id"]
+            ),
+            "performances": self.dataset.performances(user["id"]),
+        }
+
+    def _teacherOverview(self, handler, query, body):
+        self._teacher(handler)
+        return {
+            "classes": [
+                {
+                    "class_id": class_["id"],
+                    "name": class_["name"],
+                    "student_number": len(class_["students"]),
+                    "assignments": [
+                        self._assignment(assignment)
+                        for assignment in class_["assignments"]
+                    ],
+                }
+                for class_ in self.dataset.classes
+            ],
+            "assignments": [
+                self._assignment(assignment) for assignment in self.dataset.assignments
+            ],
+            "students": [
+                student
+                for class_ in self.dataset.classes
+                for student in class_["students"]
+            ],
+        }
+
+    def _performanceDateData(self, handler, query, body):
+        self._user(handler)
+        return self.dataset.performanceDateData(self._intParam(query, "user_id"))
+
+    def _performances(self, handler, query, body):
+        self._user(handler)
+        return self.dataset.performances(self._intParam(query, "user_id"))
+
+    # Classes and assignments
+
+    def _classData(self, handler, query, body):
+        user = self._user(handler)
+        if user["permission"] >= 1:
+            classId = self._intParam(query, "class_id")
+            class_ = self.dataset.classesById.get(classId)
+            if class_ is None:
+                raise HttpError(404, "Class not found")
+            return {
+                "class_id": class_["id"],
+                "name": class_["name"],
+                "enter_code": class_["enter_code"],
+                "students": class_["students"],
+                "assignments": [
+                    self._assignment(assignment) for assignment in class_["assignments"]
+                ],
+                "performances": self.dataset.performances(-class_["id"]),
+            }
+
+        class_ = self._studentClass(user)
+        todo, done = [], []
+        for assignment in class_["assignments"]:
+            (done if self._isDone(user, assignment) else todo).append(
+                self._assignment(assignment)
+            )
+        return {
+            "class_name": class_["name"],
+            "teacher_name": self.dataset.teacher["display_name"],
+            "to_do_assignments": todo,
+            "done_assignments": done,
+        }
+
+    def _assignments(self, handler, query, body):
+        user = self._user(handler)
+        if user["permission"] >= 1:
+            assignments = self.dataset.assignments
+        else:
+            assignments = self._studentClass(user)["assignments"]
+        return [self._assignment(assignment) for assignment in assignments]
+
+    def _assignmentImage(self, handler, query, body):
+        self._user(handler)
+        assignment = self.dataset.assignmentsById.get(
+            self._intParam(query, "assignment_id")
+        )
+        if assignment is None:
+            raise HttpError(404, "Assignment not found")
+        if not assignment["has_image"]:
+            return None
+        return self.dataset.image(-assignment["id"])
+
+    def _assignmentReview(self, handler, query, body):
+        self._teacher(handler)
+        assignment = self.dataset.assignmentsById.get(
+            self._intParam(query, "assignment_id")
+        )
+        class_ = self.dataset.classesById.get(self._intParam(query, "class_id"))
+        if assignment is None or class_ is None:
+            raise HttpError(404, "Assignment or class not found")
+
+        questions = []
+        for questionId in assignment["question_ids"]:
+            question = self._question(self.dataset.questionsById[questionId])
+            for subQuestion in question["sub_questions"]:
+                performances = []
+                for student in class_["students"]:
+                    submission = self.dataset.submission(
+                        student["id"], subQuestion["id"]
+                    )
+                    performances.append(
+                        {"user": student}
+                        if submission is None
+                        else {
+                            "user": student,
+                            "answer": submission["answer"],
+                            "performance": submission["performance"],
+                            "feedback": submission["feedback"],
+                            "date": submission["date"],
+                        }
+                    )
+                subQuestion["student_performances"] = performances
+            questions.append(question)
+        return {"title": assignment["name"], "questions": questions}
+
+    def _submit(self, handler, query, body):
+        user = self._user(handler)
+        data = self._json(body)
+        if data["sub_question_id"] not in self.dataset.subQuestions:
+            raise HttpError(404, "Sub-question not found")
+        return self.dataset.submit(
+            user["id"], data["assignment_id"], data["sub_question_id"], data["answer"]
+        )
+
+    def _joinClass(self, handler, query, body):
+        user = self._user(handler)
+        data = self._json(body)
+        for class_ in self.dataset.classes:
+            if (
+                class_["name"] == data["class_name"]
+                and class_["enter_code"] == data["enter_code"]
+            ):
+                break
+        else:
+            raise HttpError(404, "Class not found")
+
+        with self.dataset.lock:
+            if user["id"] in self.dataset.classOfStudent:
+                raise HttpError(403, "Already in a class")
+            class_["students"].append(user)
+            self.dataset.classOfStudent[user["id"]] = class_
+        return self._class(class_)
+
+    def _createClass(self, handler, query, body):
+        self._teacher(handler)
+        data = self._json(body)
+        class_ = {
+            "id": self._nextId("class"),
+            "name": data["class_name"],
+            "enter_code": data["enter_code"],
+            "students": [],
+            "assignments": [],
+        }
+        with self.dataset.lock:
+            self.dataset.classes.append(class_)
+            self.dataset.classesById[class_["id"]] = class_
+        return self._class(class_)
+
+    def _class(self, class_: dict) -> dict:
+        return {
+            "id": class_["id"],
+            "name": class_["name"],
+            "enter_code": class_["enter_code"],
+            "teacher_id": self.dataset.teacher["id"],
+        }
+
+    def _kickStudent(self, handler, query, body):
+        self._teacher(handler)
+        studentId = self._json(body)["student_id"]
+        with self.dataset.lock:
+            class_ = self.dataset.classOfStudent.pop(studentId, None)
+            if class_ is None:
+                raise HttpError(404, "Student not found")
+            class_["students"] = [
+                student for student in class_["students"] if student["id"] != studentId
+            ]
+        return {"msg": "Student removed"}
+
+    def _createAssignment(self, handler, query, body):
+        self._teacher(handler)
+        data = self._json(body)
+        assignment = {
+            "id": self._nextId("assignment"),
+            "name": data["assignment_name"],
+            "description": data["description"],
+            "teacher_id": self.dataset.teacher["id"],
+            "question_ids": data["question_ids"],
+            "due_date": None,
+            "has_image": False,
+        }
+        with self.dataset.lock:
+            self.dataset.assignments.append(assignment)
+            self.dataset.assignmentsById[assignment["id"]] = assignment
+        return self._assignment(assignment)
+
+    def _assignAssignment(self, handler, query, body):
+        self._teacher(handler)
+        data = self._json(body)
+        assignment = self.dataset.assignmentsById.get(data["assignment_id"])
+        class_ = self.dataset.classesById.get(data["class_id"])
+        if assignment is None or class_ is None:
+            raise HttpError(404, "Assignment or class not found")
+        with self.dataset.lock:
+            assignment["due_date"] = data["due_date"]
+            if assignment not in class_["assignments"]:
+                class_["assignments"].append(assignment)
+        return {"msg": "Assignment assigned"}
+
+    # Question bank
+
+    def _userQuestions(self, handler, query, body):
+        self._user(handler)
+        questions = self.dataset.questions
+        afterId = self._param(query, "after_id")
+        if afterId is not None:
+            questions = [q for q in questions if q["id"] > int(afterId)]
+        limit = self._param(query, "limit")
+        if limit is not None:
+            questions = questions[: int(limit)]
+        return [self._question(question) for question in questions]
+
+    def _completedQuestions(self, handler, query, body):
+        user = self._user(handler)
+        questions = []
+        for question in self.dataset.questions:
+            subQuestions = []
+            for subQuestion in question["sub_questions"]:
+                submission = self.dataset.submission(user["id"], subQuestion["id"])
+                if submission is not None:
+                    subQuestions.append(self._subQuestion(subQuestion, submission))
+            if subQuestions:
+                questions.append({**question, "sub_questions": subQuestions})
+        return questions
+
+    def _completedQuestion(self, handler, query, body):
+        user = self._user(handler)
+        question = self.dataset.questionsById.get(self._intParam(query, "question_id"))
+        if question is None:
+            raise HttpError(404, "Question not found")
+        return {
+            **question,
+            "sub_questions": [
+                self._subQuestion(
+                    subQuestion,
+                    self.dataset.submission(user["id"], subQuestion["id"]),
+                )
+                for subQuestion in question["sub_questions"]
+            ],
+        }
+
+    def _completedSubQuestions(self, handler, query, body):
+        user = self._user(handler)
+        assignmentId = self._param(query, "assignment_id")
+        if assignmentId is not None:
+            assignment = self.dataset.assignmentsById.get(int(assignmentId))
+            if assignment is None:
+                raise HttpError(404, "Assignment not found")
+            subQuestions = self.dataset.assignmentSubQuestions(assignment)
+        else:
+            subQuestions = [
+                subQuestion for _, subQuestion in self.dataset.subQuestions.values()
+            ]
+
+        completed = []
+        for subQuestion in subQuestions:
+            submission = self.dataset.submission(user["id"], subQuestion["id"])
+            if submission is not None:
+                completed.append(self._subQuestion(subQuestion, submission))
+        return completed
+
+    def _bankQuestions(self, handler, query, body):
+        self._user(handler)
+        questionIds = {int(value) for value in query.get("question_ids", [])}
+        keyword = (self._param(query, "keyword") or "").lower()
+        source = self._param(query, "source")
+        concept = self._param(query, "concept")
+        process = self._param(query, "process")
+
+        questions = []
+        for question in self.dataset.questions:
+            if questionIds and question["id"] not in questionIds:
+                continue
+            if source is not None and question["source"] != source:
+                continue
+            if keyword and not (
+                keyword in question["name"].lower()
+                or any(
+                    keyword in subQuestion["description"].lower()
+                    for subQuestion in question["sub_questions"]
+                )
+            ):
+                continue
+            if concept is not None and not any(
+                subQuestion["concept"] == int(concept)
+                for subQuestion in question["sub_questions"]
+            ):
+                continue
+            if process is not None and not any(
+                subQuestion["process"] == int(process)
+                for subQuestion in question["sub_questions"]
+            ):
+                continue
+            questions.append(self._question(question))
+        return questions
+
+    def _image(self, handler, query, body):
+        self._user(handler)
+        imageId = self._intParam(query, "image_id")
+        if imageId < 1:
+            raise HttpError(404, "Image not found")
+        return self.dataset.image(imageId)
+
+    def _uploadImage(self, handler, query, body):
+        self._teacher(handler)
+        return {"hash": hashlib.sha256(body).hexdigest()}
+
+    def _addImage(self, handler, query, body):
+        self._teacher(handler)
+        return {"image_id": self._nextId("image")}
+
+    def _addQuestion(self, handler, query, body):
+        self._teacher(handler)
+        data = self._json(body)
+        with self.dataset.lock:
+            questionId = len(self.dataset.questions) + 1
+            subQuestions = []
+            for subQuestion in data["sub_questions"]:
+                subQuestionId = len(self.dataset.subQuestions) + 1
+                subQuestion = {**subQuestion, "id": subQuestionId}
+                subQuestions.append(subQuestion)
+                self.dataset.subQuestions[subQuestionId] = (questionId, subQuestion)
+            question = {
+                "id": questionId,
+                "name": data["name"],
+                "source": data["source"],
+                "is_audited": False,
+                "sub_questions": subQuestions,
+            }
+            self.dataset.questions.append(question)
+            self.dataset.questionsById[questionId] = question
+        return {"question_id": questionId}
+
+    # LLM
+
+    def _hint(self, handler, query, body):
+        self._user(handler)
+        data = self._json(body)
+        return {"hint": f"Think about what the question asks first: {data['question']}"}
@@ -1,21 +1,80 @@
+import argparse
 import sys
-from PyQt6.QtCore import QDir
-from PyQt6.QtWidgets import QApplication
+import time
 
-from app.controllers.mainController import MainController
+STARTED = time.perf_counter()
+
+
+def parseArgs(argv: list) -> tuple:
+    """Parse the options of the application, leaving the rest to Qt
+
+    Args:
+        argv (list): The command line including the program name
+
+    Returns:
+        tuple: The parsed options and the arguments for QApplication
+    """
+    parser = argparse.ArgumentParser(prog="nanoko")
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="print how long each startup phase took and quit after the "
+        "sign-in dialog is first painted",
+    )
+    parser.add_argument(
+        "--startup-budget",
+        type=float,
+        help="with --startup-report, exit with 1 if startup took longer (ms)",
+    )
+    parser.add_argument(
+        "--startup-json", help="with --startup-report, also write it to this file"
+    )
+    args, qtArgs = parser.parse_known_args(argv[1:])
+    return args, argv[:1] + qtArgs
 
 
 def main():
     """Main entry point of the application"""
+    # imported here so that the "import" phase of the startup report covers them
+    from PyQt6.QtCore import QDir, QThreadPool
+    from PyQt6.QtWidgets import QApplication
+
+    from app.config import SHUTDOWN_WAIT_MS
+    from app.controllers.mainController import MainController
+    from app.controllers.startupTimer import StartupTimer
+
+    args, qtArgs = parseArgs(sys.argv)
+    timer = StartupTimer(STARTED)
+    timer.mark("import")
+
     QDir.addSearchPath("resources", "app/resources")
 
-    app = QApplication(sys.argv)
+    app = QApplication(qtArgs)
     app.setApplicationName("Nanoko")
+    timer.mark("QApplication")
 
     controller = MainController()
+    timer.mark("MainController")
+
     controller.start()
+    timer.mark("show sign-in dialog")
+
+    if args.startup_report:
+
+        def report():
+            print(timer.report())
+            if args.startup_json:
+                timer.writeJson(args.startup_json)
+            app.exit(timer.exitCode(args.startup_budget))
+
+        timer.firstPainted.connect(report)
+        timer.watchFirstPaint(controller.signinDialog, "first paint of sign-in")
 
-    sys.exit(app.exec())
+    exitCode = app.exec()
+    # let running requests, e.g. the warm-up, finish before Qt objects go away
+    controller.apiWorker.waitForDone(SHUTDOWN_WAIT_MS)
+    QThreadPool.globalInstance().waitForDone(SHUTDOWN_WAIT_MS)
+    sys.exit(exitCode)
 
 
 if __name__ == "__main__":